@@ -45,6 +45,10 @@ from Game.Map.terrain_randomizer import apply_random_terrain
 from Game.Rendering.game_renderer import GameRenderer
 from Game.Utils.lane_pathfinder import LanePathfinder
 from Game.Utils.grid_utils import GridUtils
+from Game.Utils.flow_field import FlowFieldManager
+from Game.Utils.impact_queue import ImpactQueue
+from Game.Utils.projectile_pool import ProjectilePool
+from Game.Utils.damage_events import DamageAccumulator
 
 
 # UI : si tu as déjà Game/App/ui.py, il sera pris
@@ -229,6 +233,7 @@ class GameApp:
 
         self.map_files = []
         self.nav_grid = None
+        self.flow_fields = None  # flow fields partagés (cases d'attaque)
 
         # match state
         self.world = None
@@ -248,6 +253,11 @@ class GameApp:
         self.targeting_system = None
         self.combat_system = None
         self.projectile_system = None
+        self.impact_queue = None
+        self.projectile_pool = None
+        self.damage_events = None
+        self.combat_ready = None
+        self.damage_system = None
         self.cleanup_system = None
         self.enemy_spawner_system = None
         self.difficulty_system = None
@@ -346,7 +356,6 @@ class GameApp:
         self.enemy_kills = 0
         self.best_time = 0.0
         self.best_kills = 0
-        self._prev_enemy_ids = set()
 
         # random map info
         self.last_map_seed = 0
@@ -995,7 +1004,14 @@ class GameApp:
         path = self.lane_paths[lane_idx]
         if path:
             start_i = 0
-            if (px, py) in path:
+            # Index case -> position de la route partagée (au lieu de path.index)
+            routes = getattr(getattr(self, "lane_route_system", None), "routes", None)
+            route = routes[lane_idx] if routes and lane_idx < len(routes) else None
+            if route is not None and len(route) == len(path):
+                hit = route.index_of((px, py))
+                if hit is not None:
+                    start_i = hit + 1
+            elif (px, py) in path:
                 start_i = path.index((px, py)) + 1
             for c in path[start_i:start_i + 10]:
                 cx, cy = int(c[0]), int(c[1])
@@ -1050,7 +1066,7 @@ class GameApp:
 
             try:
                 p = esper.component_for_entity(ent, PathComponent)
-                p.noeuds = []
+                p.clear()
             except Exception:
                 pass
 
@@ -1073,6 +1089,12 @@ class GameApp:
             self._known_units.add(ent)
 
 
+    # Réagit à un changement de terrain (tempête de sable) : champs + lanes
+    def _on_terrain_change(self):
+        if self.flow_fields:
+            self.flow_fields.invalidate()
+        self.pathfinder.recalculate_all_lanes()
+
     # Déclenche un effet visuel de flash sur la lane sélectionnée
     def _flash_lane(self):
         self.lane_flash_timer = float(self.lane_flash_duration)
@@ -1096,12 +1118,19 @@ class GameApp:
         self.input_system = None
         self.economy_system = None
         self.upgrade_system = None
+        if self.astar_system:
+            self.astar_system.close()
         self.astar_system = None
         self.terrain_system = None
         self.nav_system = None
         self.targeting_system = None
         self.combat_system = None
         self.projectile_system = None
+        self.impact_queue = None
+        self.projectile_pool = None
+        self.damage_events = None
+        self.combat_ready = None
+        self.damage_system = None
         self.cleanup_system = None
         self.enemy_spawner_system = None
         self.difficulty_system = None
@@ -1113,7 +1142,6 @@ class GameApp:
 
         self.match_time = 0.0
         self.enemy_kills = 0
-        self._prev_enemy_ids = set()
 
         self.camera_x = 0.0
         self.camera_y = 0.0
@@ -1122,6 +1150,7 @@ class GameApp:
         self.lane_preview_path = []
         self.lane_paths = [[], [], []]
         self.lane_paths_enemy = [[], [], []]
+        self.flow_fields = None
 
         self._known_units = set()
 
@@ -1246,6 +1275,17 @@ class GameApp:
         #  connectors lanes haut/milieu/bas + cases d’attaque walkable
         self.grid_utils.carve_pyramid_connectors()
 
+        # 5b) flow fields partagés : un champ par case d'attaque (équipe x lane)
+        self.flow_fields = FlowFieldManager(self.nav_grid)
+        for team_id in (1, 2):
+            for lane_idx in (0, 1, 2):
+                self.flow_fields.register_goal(self.grid_utils.attack_cell_for_lane(team_id, lane_idx))
+
+        # 5c) solveur de chemins ("astar", "jps" ou "hpa") depuis balance.json
+        path_cfg = self.balance.get("pathfinding", {})
+        path_solver = str(path_cfg.get("solver", "astar"))
+        self.pathfinder.solver = path_solver
+
         # 6) pré-calcul des 3 lanes (joueur ET ennemi)
         self.pathfinder.recalculate_all_lanes()
 
@@ -1275,6 +1315,7 @@ class GameApp:
         from Game.Ecs.Systems.CombatSystem import CombatSystem
         from Game.Ecs.Systems.ProjectileSystem import ProjectileSystem
         from Game.Ecs.Systems.CleanupSystem import CleanupSystem
+        from Game.Ecs.Systems.DamageSystem import DamageSystem
         from Game.Ecs.Systems.EconomySystem import EconomySystem
         from Game.Ecs.Systems.UpgradeSystem import UpgradeSystem
         from Game.Ecs.Systems.RandomEventSystem import RandomEventSystem
@@ -1308,7 +1349,16 @@ class GameApp:
             upgrade_costs=upgrade_costs
         )
 
-        self.astar_system = AStarPathfindingSystem(self.nav_grid)
+        self.astar_system = AStarPathfindingSystem(
+            self.nav_grid,
+            flow_fields=self.flow_fields,
+            solver=path_solver,
+            cluster_size=int(path_cfg.get("cluster_size", 10)),
+            hpa_refine_margin=int(path_cfg.get("hpa_refine_margin", -1)),
+            frame_budget_ms=float(path_cfg.get("frame_budget_ms", 2.0)),
+            async_workers=int(path_cfg.get("async_workers", 0)),
+            simplify_paths=bool(path_cfg.get("simplify_paths", False)),
+        )
         self.terrain_system = TerrainEffectSystem(self.nav_grid)
         
         #  Paramètres de combat centralisés depuis balance.json
@@ -1317,6 +1367,17 @@ class GameApp:
         align_tolerance = float(combat_cfg.get("align_tolerance", 0.5))
         hit_cooldown = float(combat_cfg.get("hit_cooldown", 0.6))
         projectile_speed = float(combat_cfg.get("projectile_speed", 12.0))
+        # Tirs : "entity" (entités ECS), "pool" (ProjectilePool) ou "scheduled" (ImpactQueue),
+        # structures partagées entre les tireurs et ProjectileSystem
+        projectile_mode = str(combat_cfg.get(
+            "projectile_mode", "scheduled" if combat_cfg.get("scheduled_impacts", False) else "entity"
+        ))
+        self.impact_queue = ImpactQueue() if projectile_mode == "scheduled" else None
+        self.projectile_pool = ProjectilePool() if projectile_mode == "pool" else None
+        # Dégâts groupés : tirs et événements empilent, DamageSystem applique et publie les morts
+        self.damage_events = DamageAccumulator()
+        # Unités prêtes à tirer : cibles posées (TargetingSystem) + recharges écoulées (CombatSystem)
+        self.combat_ready = set()
         
         self.nav_system = NavigationSystem(arrive_radius=0.05, attack_range=attack_range, align_tolerance=align_tolerance)
 
@@ -1331,34 +1392,49 @@ class GameApp:
 
         pyramid_ids = {int(self.player_pyramid_eid), int(self.enemy_pyramid_eid)}
 
+        # Moteur de ciblage ("hash", "sweep" ou "numpy") depuis balance.json
+        targeting_cfg = self.balance.get("targeting", {})
         self.targeting_system = TargetingSystem(
             goals_by_team=goals_by_team,
             pyramid_ids=pyramid_ids,
-            attack_range=attack_range
+            attack_range=attack_range,
+            engine=str(targeting_cfg.get("engine", "hash")),
+            reeval_frames=int(targeting_cfg.get("reeval_frames", 1)),
+            damage=self.damage_events,
+            ready=self.combat_ready,
         )
 
         self.combat_system = CombatSystem(
             attack_range=attack_range,
             hit_cooldown=hit_cooldown,
             projectile_speed=projectile_speed,
-            align_tolerance=align_tolerance
+            align_tolerance=align_tolerance,
+            impacts=self.impact_queue,
+            pool=self.projectile_pool,
+            damage=self.damage_events,
+            ready=self.combat_ready,
         )
 
-        try:
-            reward_divisor = float(self.balance.get("sae", {}).get("reward_divisor", 2.0))
-            self.projectile_system = ProjectileSystem(
-                pyramid_by_team={1: int(self.player_pyramid_eid), 2: int(self.enemy_pyramid_eid)},
-                reward_divisor=reward_divisor
-            )
-        except TypeError:
-            self.projectile_system = ProjectileSystem()
+        reward_divisor = float(self.balance.get("sae", {}).get("reward_divisor", 2.0))
+        self.damage_system = DamageSystem(
+            self.damage_events,
+            pyramid_by_team={1: int(self.player_pyramid_eid), 2: int(self.enemy_pyramid_eid)},
+            reward_divisor=reward_divisor,
+        )
+        self.projectile_system = ProjectileSystem(
+            impacts=self.impact_queue,
+            pool=self.projectile_pool,
+            damage=self.damage_events,
+        )
 
-        self.cleanup_system = CleanupSystem(protected_entities=pyramid_ids)
+        self.cleanup_system = CleanupSystem(protected_entities=pyramid_ids, damage=self.damage_events)
 
         # lane route gameplay - utilise les chemins pré-calculés
         self.lane_route_system = LaneRouteSystem(
             self.lanes_y,
-            pyramid_ids=pyramid_ids
+            pyramid_ids=pyramid_ids,
+            nav_grid=self.nav_grid,
+            simplify=bool(path_cfg.get("simplify_paths", False)),
         )
         # Passer les chemins pré-calculés
         self.lane_route_system.set_lane_paths(self.lane_paths)
@@ -1392,7 +1468,8 @@ class GameApp:
                 self.nav_grid,
                 self.player_pyramid_eid,
                 self.enemy_pyramid_eid,
-                on_terrain_change=self.pathfinder.recalculate_all_lanes  # Recalculer les lanes au sandstorm
+                on_terrain_change=self._on_terrain_change,  # Recalculer les lanes au sandstorm
+                damage=self.damage_events,
             )
             print("[OK] RandomEventSystem created")
         except Exception as e:
@@ -1407,6 +1484,9 @@ class GameApp:
                 attack_range=3.5,  # Portée de défense
                 damage=8.0,        # Dégâts par tir
                 cooldown=1.0,      # Temps entre tirs
+                impacts=self.impact_queue,
+                pool=self.projectile_pool,
+                targeting=self.targeting_system,
             )
             print("[OK] PyramidDefenseSystem created")
         except Exception as e:
@@ -1454,13 +1534,14 @@ class GameApp:
             self.world.add_system(self.ai_behavior_system, priority=35)  # Entre targeting et combat
         
         self.world.add_system(self.projectile_system, priority=60)
+        # Flush des dégâts juste après les tirs : combat et ciblage voient les morts de la frame
+        self.world.add_system(self.damage_system, priority=58)
         self.world.add_system(self.cleanup_system, priority=90)
 
         self.camera_x = 0.0
         self.camera_y = 0.0
         self.match_time = 0.0
         self.enemy_kills = 0
-        self._prev_enemy_ids = set()
         self.game_over_text = ""
 
         self._known_units = set()
@@ -1640,24 +1721,15 @@ class GameApp:
     # ----------------------------
     # Stats
     # ----------------------------
-    # Met à jour le compteur de kills des joueurs
+    # Met à jour le compteur de kills des joueurs (flux de morts de DamageSystem)
     def _update_kills_tracker(self):
-        if self.world:
-            self.world._activate()
-
-        current = set()
-        for ent, (team,) in esper.get_components(Team):
-            if ent in (self.player_pyramid_eid, self.enemy_pyramid_eid):
-                continue
-            if team.id == 2:
-                current.add(ent)
-
-        if self._prev_enemy_ids:
-            dead = self._prev_enemy_ids - current
-            if dead:
-                self.enemy_kills += len(dead)
+        if self.damage_events is None:
+            return
 
-        self._prev_enemy_ids = current
+        pyramids = (self.player_pyramid_eid, self.enemy_pyramid_eid)
+        for event in self.damage_events.drain():
+            if event.victim_team == 2 and event.victim not in pyramids:
+                self.enemy_kills += 1
 
     # Joue un effet sonore si les sons sont activés
     def _play_sound(self, sound_name: str):
@@ -1943,6 +2015,7 @@ class GameApp:
 
                 self.match_time += dt
                 self.world.process(dt)
+                self.pathfinder.refine_landmarks()
 
                 self._snap_new_friendly_units_to_lane_start()
                 self._update_kills_tracker()
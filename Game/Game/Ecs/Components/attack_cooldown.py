@@ -5,7 +5,8 @@ class AttackCooldown:
     """
     Gère un cooldown d'attaque simple.
     - cooldown : temps entre deux coups (s)
-    - timer : temps restant avant prochain coup (s)
+    - timer : recharge en cours (s) ; posé à cooldown au tir, remis à 0 quand
+              CombatSystem réveille l'unité (la recharge est planifiée dans son tas)
     """
     cooldown: float = 0.7
     timer: float = 0.0
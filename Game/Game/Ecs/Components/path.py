@@ -1,6 +1,7 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 from .grid_position import GridPosition
+from Game.Utils.lane_route import LaneRoute
 
 
 @dataclass
@@ -9,6 +10,52 @@ class Path:
 
     Attributes:
         noeuds: Liste ordonnée des positions (GridPosition) que l’entité doit suivre
-                pour atteindre sa destination.
+                pour atteindre sa destination (chemin propre à l'entité).
+        route: Route de lane partagée (LaneRoute) ; si présente, elle remplace noeuds.
+        offset: Indice, dans les points de passage de la route, du premier nœud lu
+                après head (hors route : aucun).
+        step: Sens de lecture de la route (+1 ou -1).
+        head: Nœuds (x, y) explicites placés avant ceux de la route.
+
+    Lire le chemin via length() / point(i) fonctionne dans les deux cas.
     """
-    noeuds: List[GridPosition]
+    noeuds: List[GridPosition] = field(default_factory=list)
+    route: Optional[LaneRoute] = None
+    offset: int = 0
+    step: int = 1
+    head: Tuple[Tuple[int, int], ...] = ()
+
+    # Nombre de nœuds du chemin
+    def length(self) -> int:
+        if self.route is not None:
+            return len(self.head) + self.route.span(self.offset, self.step)
+        return len(self.noeuds)
+
+    # Coordonnées (x, y) du i-ème nœud
+    def point(self, i: int) -> Tuple[int, int]:
+        if self.route is not None:
+            if i < len(self.head):
+                return self.head[i]
+            return self.route.waypoint(self.offset + (i - len(self.head)) * self.step)
+        node = self.noeuds[i]
+        return (int(node.x), int(node.y))
+
+    # Tous les nœuds (x, y) dans l'ordre de parcours
+    def points(self) -> List[Tuple[int, int]]:
+        return [self.point(i) for i in range(self.length())]
+
+    # Suit une route partagée (après head) à partir du point de passage offset dans le sens step
+    def set_route(self, route: LaneRoute, offset: int = 0, step: int = 1, head=()):
+        self.route = route
+        self.offset = int(offset)
+        self.step = 1 if step >= 0 else -1
+        self.head = tuple(head)
+        self.noeuds = []
+
+    # Vide le chemin
+    def clear(self):
+        self.route = None
+        self.offset = 0
+        self.step = 1
+        self.head = ()
+        self.noeuds = []
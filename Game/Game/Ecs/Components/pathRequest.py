@@ -8,5 +8,8 @@ class PathRequest:
 
     Attributes:
         goal: Position cible (GridPosition) vers laquelle l’entité souhaite aller.
+        priority: Priorité de traitement (les plus hautes sont servies en premier
+                  quand le budget de pathfinding par frame est limité).
     """
     goal: GridPosition
+    priority: float = 0.0
@@ -9,46 +9,28 @@ This module provides:
 The implementation for `GridMap` uses tile `speed` to weight movement cost (slower
 tiles are more expensive). The numpy-grid implementation uses unit costs.
 """
-from typing import List, Tuple, Dict, Optional
-import heapq
-import math
+from typing import Callable, List, Tuple, Optional
+import weakref
 
 import esper
+import numpy as np
 
 from Game.Ecs.Components.grid_position import GridPosition
 from Game.Ecs.Components.pathRequest import PathRequest
 from Game.Ecs.Components.path import Path
 from Game.Ecs.Components.pathProgress import PathProgress
+from Game.Map.tile_index import TileIndex, build_tile_index
+from Game.Utils.path_cache import MISSING, PathCache, cached_path
+from Game.Utils.astar_core import CostGrid, find_path as core_find_path
+from Game.Utils.jump_point import JumpPointSearch, navgrid_cost_array
+from Game.Utils.hierarchical import HierarchicalPathfinder
+from Game.Utils.path_scheduler import PathRequestScheduler, straight_line_path
+from Game.Utils.async_paths import AsyncPathSolver
+from Game.Utils.path_simplify import navgrid_mult, simplify_path
 
 Point = Tuple[int, int]
 
 
-# Calcule la distance heuristique entre deux points (Manhattan ou Octile)
-def _heuristic(a: Point, b: Point, diagonal: bool) -> float:
-    dx = abs(a[0] - b[0])
-    dy = abs(a[1] - b[1])
-    if diagonal:
-        # Octile distance
-        F = math.sqrt(2) - 1
-        return (dx + dy) + (F * min(dx, dy)) - min(dx, dy)
-    return dx + dy
-
-
-# Retourne les voisins d'une position (4 ou 8 directions selon diagonal)
-def _neighbors_4_8(pos: Point, width: Optional[int], height: Optional[int], diagonal: bool) -> List[Point]:
-    x, y = pos
-    nbrs = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
-    if diagonal:
-        nbrs += [(x + 1, y + 1), (x + 1, y - 1), (x - 1, y + 1), (x - 1, y - 1)]
-    if width is None or height is None:
-        return nbrs
-    out = []
-    for nx, ny in nbrs:
-        if 0 <= nx < width and 0 <= ny < height:
-            out.append((nx, ny))
-    return out
-
-
 # Algorithme A* utilisant une GridMap avec tuiles et coûts de vitesse
 def astar_gridmap(grid_map, start: Point, goal: Point, allow_diagonal: bool = False) -> Optional[List[Point]]:
     """A* using `GridMap` / `GridTile` objects.
@@ -56,111 +38,46 @@ def astar_gridmap(grid_map, start: Point, goal: Point, allow_diagonal: bool = Fa
     - `grid_map` must expose `.tiles` iterable and optionally `.width` and `.height`.
     - Each tile must have `.x`, `.y`, `.walkable` and `.speed` attributes.
     - `start` and `goal` are `(x,y)` tile coordinates.
-    """
-    tile_map: Dict[Point, object] = {}
-    for t in getattr(grid_map, "tiles", []):
-        tile_map[(t.x, t.y)] = t
-
-    speeds = [getattr(t, "speed", 0) for t in tile_map.values() if getattr(t, "speed", 0) > 0]
-    max_speed = max(speeds) if speeds else 1.0
-
-    def cost(a: Point, b: Point) -> float:
-        tile = tile_map.get(b)
-        if tile is None or not getattr(tile, "walkable", True):
-            return float("inf")
-        s = float(getattr(tile, "speed", max_speed))
-        base = 1.0
-        if a[0] != b[0] and a[1] != b[1]:
-            base *= math.sqrt(2)
-        # slower tiles => higher cost
-        return base * (max_speed / s)
-
-    width = getattr(grid_map, "width", None)
-    height = getattr(grid_map, "height", None)
-
-    open_heap = []
-    g_score: Dict[Point, float] = {start: 0.0}
-    came_from: Dict[Point, Point] = {}
-    f0 = _heuristic(start, goal, allow_diagonal)
-    counter = 0
-    heapq.heappush(open_heap, (f0, counter, start))
-    closed = set()
-
-    while open_heap:
-        _, _, current = heapq.heappop(open_heap)
-        if current == goal:
-            path = [current]
-            while current in came_from:
-                current = came_from[current]
-                path.append(current)
-            path.reverse()
-            return path
-
-        closed.add(current)
-        for nbr in _neighbors_4_8(current, width, height, allow_diagonal):
-            if nbr in closed:
-                continue
-            tile = tile_map.get(nbr)
-            if tile is None or not getattr(tile, "walkable", True):
-                continue
-            tentative = g_score.get(current, float("inf")) + cost(current, nbr)
-            if tentative < g_score.get(nbr, float("inf")):
-                came_from[nbr] = current
-                g_score[nbr] = tentative
-                f = tentative + _heuristic(nbr, goal, allow_diagonal)
-                counter += 1
-                heapq.heappush(open_heap, (f, counter, nbr))
 
-    return None
+    A `GridMap` provides a cached dense `tile_index()` (rebuilt only after a tile
+    change); other map-like objects get an index built for this call.
+    """
+    if hasattr(grid_map, "tile_index"):
+        index = grid_map.tile_index()
+    else:
+        index = build_tile_index(
+            getattr(grid_map, "tiles", []),
+            getattr(grid_map, "width", None),
+            getattr(grid_map, "height", None),
+        )
+    return astar_tile_index(index, start, goal, allow_diagonal=allow_diagonal)
+
+
+# A* sur un TileIndex (coût = max_speed / speed)
+def astar_tile_index(index: TileIndex, start: Point, goal: Point, allow_diagonal: bool = False) -> Optional[List[Point]]:
+    if not index.connectivity(allow_diagonal).reachable(start, goal):
+        return None
+    return core_find_path(
+        index.grid, start, goal,
+        diagonal=allow_diagonal, heuristic="octile" if allow_diagonal else "manhattan",
+    )
 
 
 # Algorithme A* sur une grille 2D numpy (0=libre, 1=bloqué)
 def astar_numpy(grid, start: Point, goal: Point, allow_diagonal: bool = True) -> Optional[List[Point]]:
     """A* over a 2D grid (list of lists), where 0 = free, 1 = blocked.
 
-    `start` and `goal` are (x,y) tuples.
+    `start` and `goal` are (x,y) tuples; the grid is indexed `grid[x][y]`.
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows else 0
-
-    def is_blocked(p: Point) -> bool:
-        x, y = p
-        return grid[x][y] != 0
-
-    open_heap = []
-    g_score: Dict[Point, float] = {start: 0.0}
-    came_from: Dict[Point, Point] = {}
-    f0 = _heuristic(start, goal, allow_diagonal)
-    counter = 0
-    heapq.heappush(open_heap, (f0, counter, start))
-    closed = set()
-
-    while open_heap:
-        _, _, current = heapq.heappop(open_heap)
-        if current == goal:
-            path = [current]
-            while current in came_from:
-                current = came_from[current]
-                path.append(current)
-            path.reverse()
-            return path
-
-        closed.add(current)
-        for nbr in _neighbors_4_8(current, rows, cols, allow_diagonal):
-            if nbr in closed:
-                continue
-            if is_blocked(nbr):
-                continue
-            step_cost = math.sqrt(2) if (nbr[0] != current[0] and nbr[1] != current[1]) else 1.0
-            tentative = g_score.get(current, float("inf")) + step_cost
-            if tentative < g_score.get(nbr, float("inf")):
-                came_from[nbr] = current
-                g_score[nbr] = tentative
-                f = tentative + _heuristic(nbr, goal, allow_diagonal)
-                counter += 1
-                heapq.heappush(open_heap, (f, counter, nbr))
-
-    return None
+    cells = np.asarray(grid)
+    if cells.ndim != 2 or cells.size == 0:
+        return None
+    # CostGrid est indexée [y, x] : transposée de grid[x][y]
+    cost = np.where(cells.T != 0, np.inf, 1.0)
+    return core_find_path(
+        CostGrid(cost), start, goal,
+        diagonal=allow_diagonal, heuristic="octile" if allow_diagonal else "manhattan",
+    )
 
 
 # Fonction dispatcher qui choisit l'implémentation A* selon le type de grille
@@ -175,90 +92,277 @@ def astar(grid_map_or_grid, start: Point, goal: Point, allow_diagonal: bool = Fa
     return astar_numpy(grid_map_or_grid, start, goal, allow_diagonal=allow_diagonal)
 
 
-# Algorithme A* spécialisé pour NavigationGrid avec walkable et movement_cost
-def astar_navgrid(nav_grid, start: Point, goal: Point, allow_diagonal: bool = False) -> Optional[List[Point]]:
-    """A* spécialisé pour NavigationGrid (is_walkable + movement_cost)."""
-    width = getattr(nav_grid, "width", None)
-    height = getattr(nav_grid, "height", None)
-
-    open_heap = []
-    g_score: Dict[Point, float] = {start: 0.0}
-    came_from: Dict[Point, Point] = {}
-    f0 = _heuristic(start, goal, allow_diagonal)
-    counter = 0
-    heapq.heappush(open_heap, (f0, counter, start))
-    closed = set()
-
-    while open_heap:
-        _, _, current = heapq.heappop(open_heap)
-        if current == goal:
-            path = [current]
-            while current in came_from:
-                current = came_from[current]
-                path.append(current)
-            path.reverse()
-            return path
-
-        closed.add(current)
-
-        for nbr in _neighbors_4_8(current, width, height, allow_diagonal):
-            if nbr in closed:
-                continue
+# CostGrid en cache par NavigationGrid (reconstruite quand `version` change)
+_NAV_COST_GRIDS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
 
-            x, y = nbr
-            if not nav_grid.is_walkable(x, y):
-                continue
 
-            base = math.sqrt(2) if (nbr[0] != current[0] and nbr[1] != current[1]) else 1.0
-            move_cost = float(nav_grid.movement_cost(x, y))
-            if math.isinf(move_cost):
-                continue
+# Coûts d'une grille "NavigationGrid-like" pour le cœur A*
+def _navgrid_cost_grid(nav_grid) -> CostGrid:
+    version = getattr(nav_grid, "version", None)
+    cached = _NAV_COST_GRIDS.get(nav_grid)
+    if cached is not None and version is not None and cached[0] == version:
+        return cached[1]
 
-            tentative = g_score.get(current, float("inf")) + base * move_cost
-            if tentative < g_score.get(nbr, float("inf")):
-                came_from[nbr] = current
-                g_score[nbr] = tentative
-                f = tentative + _heuristic(nbr, goal, allow_diagonal)
-                counter += 1
-                heapq.heappush(open_heap, (f, counter, nbr))
+    if hasattr(nav_grid, "walkable") and hasattr(nav_grid, "cost"):
+        cost = navgrid_cost_array(nav_grid)
+    else:
+        # Grille sans tableaux : lecture case par case
+        w, h = int(nav_grid.width), int(nav_grid.height)
+        cost = np.array(
+            [[float(nav_grid.movement_cost(x, y)) if nav_grid.is_walkable(x, y) else np.inf for x in range(w)]
+             for y in range(h)],
+            dtype=np.float64,
+        ).reshape(h, w)
 
-    return None
+    grid = CostGrid(cost)
+    _NAV_COST_GRIDS[nav_grid] = (version, grid)
+    return grid
+
+
+# Rejet immédiat si goal est hors de la composante de start (grilles sans index : True)
+def navgrid_reachable(nav_grid, start: Point, goal: Point, allow_diagonal: bool = False) -> bool:
+    if not hasattr(nav_grid, "connectivity"):
+        return True
+    return nav_grid.connectivity(allow_diagonal).reachable(start, goal)
+
+
+# Algorithme A* spécialisé pour NavigationGrid avec walkable et movement_cost
+def astar_navgrid(nav_grid, start: Point, goal: Point, allow_diagonal: bool = False) -> Optional[List[Point]]:
+    """A* spécialisé pour NavigationGrid (is_walkable + movement_cost)."""
+    if not navgrid_reachable(nav_grid, start, goal, allow_diagonal):
+        return None
+    return core_find_path(
+        _navgrid_cost_grid(nav_grid), start, goal,
+        diagonal=allow_diagonal, heuristic="octile" if allow_diagonal else "manhattan",
+    )
 
 
 class AStarPathfindingSystem(esper.Processor):
     """
     System Esper : consomme PathRequest et produit Path + PathProgress.
     (Phase 1 sans IA : chemin direct vers objectif)
+
+    Si un FlowFieldManager est fourni, les requêtes vers un objectif enregistré
+    (cases d'attaque) sont lues dans le flow field partagé au lieu d'un A*.
+    Les autres passent par un cache LRU (start, goal, diagonal, version grille).
+
+    solver : "astar" (astar_navgrid), "jps" (Jump Point Search, même coût de chemin)
+    ou "hpa" (HPA* par clusters de cluster_size cases, grandes cartes ; chemins
+    ~1.1x l'optimal en moyenne, 3x et plus au pire, sauf affinage dans le couloir
+    avec hpa_refine_margin >= 0, voir Utils/hierarchical.py).
+
+    Les requêtes passent par un PathRequestScheduler : priorité décroissante,
+    au plus frame_budget_ms de calcul par frame (<= 0 : tout dans la frame).
+    En attendant son chemin, une unité sans Path reçoit un chemin provisoire
+    (interim_path(ent, start, goal) s'il est fourni, sinon ligne droite
+    tronquée au premier obstacle).
+
+    async_workers > 0 : les recherches A* / JPS partent dans un pool de
+    processus (grille en mémoire partagée) ; les chemins sont attachés quand
+    les résultats arrivent. Flow fields et hits du cache restent immédiats.
     """
 
     # Initialise le système de pathfinding avec la grille de navigation
-    def __init__(self, nav_grid, *, allow_diagonal: bool = False):
+    def __init__(
+        self,
+        nav_grid,
+        *,
+        allow_diagonal: bool = False,
+        flow_fields=None,
+        cache_size: int = 256,
+        solver: str = "astar",
+        cluster_size: int = 10,
+        hpa_refine_margin: int = -1,
+        frame_budget_ms: float = 2.0,
+        interim_path: Optional[Callable[[int, Point, Point], Optional[List[Point]]]] = None,
+        async_workers: int = 0,
+        simplify_paths: bool = False,
+    ):
         super().__init__()
         self.nav_grid = nav_grid
+        # Chemins attachés réduits aux coins (et frontières de terrain) ; le cache garde les chemins complets
+        self.simplify_paths = bool(simplify_paths)
         self.allow_diagonal = bool(allow_diagonal)
+        self.flow_fields = flow_fields
+        self.path_cache = PathCache(cache_size) if cache_size > 0 else None
+        if solver not in ("astar", "jps", "hpa"):
+            raise ValueError(f"solver inconnu: {solver!r}")
+        self.solver = solver
+        self.jps = JumpPointSearch(nav_grid) if solver == "jps" else None
+        self.hpa = None
+        if solver == "hpa":
+            self.hpa = HierarchicalPathfinder(
+                nav_grid, cluster_size=cluster_size, allow_diagonal=self.allow_diagonal,
+                refine_margin=hpa_refine_margin,
+            )
+
+        self.scheduler = PathRequestScheduler(frame_budget_ms)
+        self.interim_path = interim_path
+        self._interim: set[int] = set()
+        self._time = 0.0
+        self._frame = 0
+
+        # HPA* garde un état (graphe abstrait) : il reste synchrone
+        self.async_solver = None
+        if async_workers > 0 and solver != "hpa":
+            self.async_solver = AsyncPathSolver(
+                nav_grid, max_workers=async_workers, allow_diagonal=self.allow_diagonal, solver=solver
+            )
+
+    # Recherche sans cache avec le solveur choisi
+    def _search(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        if not navgrid_reachable(self.nav_grid, start, goal, self.allow_diagonal):
+            return None
+        if self.jps is not None:
+            return self.jps.find_path(start, goal, allow_diagonal=self.allow_diagonal)
+        if self.hpa is not None:
+            path = self.hpa.find_path(start, goal)
+            if path is not None:
+                return path
+            # Passage hors graphe abstrait (ex: coin diagonal entre clusters) : A* plat
+        return astar_navgrid(self.nav_grid, start, goal, allow_diagonal=self.allow_diagonal)
+
+    # Calcule un chemin : flow field partagé si disponible, sinon A* / JPS
+    def _solve(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        if self.flow_fields is not None and self.flow_fields.has_goal(goal):
+            return self.flow_fields.path(start, goal)
+        return cached_path(
+            self.path_cache, self.nav_grid, start, goal, self.allow_diagonal,
+            lambda: self._search(start, goal),
+        )
+
+    # Chemin provisoire pendant l'attente (None si rien d'utile)
+    def _interim_for(self, ent: int, start: Point, goal: Point) -> Optional[List[Point]]:
+        if self.interim_path is not None:
+            points = self.interim_path(ent, start, goal)
+            if points:
+                return points
+
+        points = []
+        for p in straight_line_path(start, goal, self.allow_diagonal):
+            if points and not self.nav_grid.is_walkable(p[0], p[1]):
+                break
+            points.append(p)
+        return points if len(points) > 1 else None
+
+    # Remplace Path + PathProgress d'une entité
+    @staticmethod
+    def _set_path(ent: int, points: List[Point]):
+        nodes = [GridPosition(x=p[0], y=p[1]) for p in points]
+
+        if esper.has_component(ent, Path):
+            esper.remove_component(ent, Path)
+        esper.add_component(ent, Path(nodes))
+
+        if esper.has_component(ent, PathProgress):
+            esper.remove_component(ent, PathProgress)
+        esper.add_component(ent, PathProgress(index=0))
+
+    # Chemin disponible sans recherche (flow field ou cache), sinon MISSING
+    def _immediate(self, start: Point, goal: Point):
+        if self.flow_fields is not None and self.flow_fields.has_goal(goal):
+            return self.flow_fields.path(start, goal)
+        if self.path_cache is None:
+            return MISSING
+        return self.path_cache.get(start, goal, self.allow_diagonal, getattr(self.nav_grid, "version", None))
+
+    # Attache un chemin résolu (ou retire le chemin provisoire s'il n'y en a pas)
+    def _apply(self, ent: int, points: Optional[List[Point]]):
+        esper.remove_component(ent, PathRequest)
+        if not points:
+            # Pas de chemin : on retire aussi le chemin provisoire
+            if ent in self._interim:
+                if esper.has_component(ent, Path):
+                    esper.remove_component(ent, Path)
+                if esper.has_component(ent, PathProgress):
+                    esper.remove_component(ent, PathProgress)
+            self._interim.discard(ent)
+            return
+
+        if self.simplify_paths:
+            points = simplify_path(points, navgrid_mult(self.nav_grid))
+        self._set_path(ent, points)
+        self._interim.discard(ent)
+
+    # Attache les résultats arrivés du pool (les résultats périmés sont redemandés)
+    def _collect_async(self):
+        for res in self.async_solver.poll():
+            if res.stale:
+                continue
+            if self.path_cache is not None:
+                self.path_cache.put(res.start, res.goal, self.allow_diagonal, res.version, res.points)
+
+            ent = res.key
+            if not esper.entity_exists(ent) or not esper.has_component(ent, PathRequest):
+                self._interim.discard(ent)
+                continue
+            req = esper.component_for_entity(ent, PathRequest)
+            if (int(req.goal.x), int(req.goal.y)) != res.goal:
+                continue
+            self._apply(ent, res.points)
 
-    # Traite les requêtes de pathfinding et génère les chemins pour les entités
+    # Met en file les requêtes, puis en résout autant que le budget le permet
     def process(self, dt: float):
+        self._time += max(0.0, float(dt))
+        self._frame += 1
+
+        if self.async_solver is not None:
+            self._collect_async()
+
         for ent, (gpos, req) in esper.get_components(GridPosition, PathRequest):
+            if self.async_solver is not None and self.async_solver.is_pending(ent):
+                continue
             start = (int(gpos.x), int(gpos.y))
             goal = (int(req.goal.x), int(req.goal.y))
-
-            points = astar_navgrid(self.nav_grid, start, goal, allow_diagonal=self.allow_diagonal)
-            if not points:
-                esper.remove_component(ent, PathRequest)
+            is_new = self.scheduler.submit(
+                ent, start, goal, priority=req.priority, now=self._time, frame=self._frame
+            )
+            if is_new and not esper.has_component(ent, Path):
+                interim = self._interim_for(ent, start, goal)
+                if interim:
+                    self._set_path(ent, interim)
+                    self._interim.add(ent)
+
+        for ent, start, goal in self.scheduler.drain(now=self._time, frame=self._frame):
+            if not esper.entity_exists(ent) or not esper.has_component(ent, PathRequest):
+                self._interim.discard(ent)
                 continue
 
-            nodes = [GridPosition(x=p[0], y=p[1]) for p in points]
-
-            if esper.has_component(ent, Path):
-                esper.remove_component(ent, Path)
-            esper.add_component(ent, Path(nodes))
-
-            if esper.has_component(ent, PathProgress):
-                esper.remove_component(ent, PathProgress)
-            esper.add_component(ent, PathProgress(index=0))
-
-            esper.remove_component(ent, PathRequest)
+            if self.async_solver is not None:
+                points = self._immediate(start, goal)
+                if points is MISSING:
+                    if not navgrid_reachable(self.nav_grid, start, goal, self.allow_diagonal):
+                        self._apply(ent, None)
+                        continue
+                    self.async_solver.submit(ent, start, goal)
+                    continue
+            else:
+                points = self._solve(start, goal)
+            self._apply(ent, points)
+
+    # Arrête le pool de processus éventuel
+    def close(self):
+        if self.async_solver is not None:
+            self.async_solver.close()
+
+    # Compteurs scheduler + cache (télémétrie)
+    def stats(self) -> dict:
+        out = self.scheduler.stats()
+        if self.async_solver is not None:
+            out["async_inflight"] = len(self.async_solver)
+            out["async_stale"] = self.async_solver.stale
+        if self.path_cache is not None:
+            out["cache_hit_rate"] = self.path_cache.hit_rate
+        return out
+
+    # Ligne de debug pour le HUD
+    def hud_line(self) -> str:
+        st = self.scheduler.stats()
+        return (
+            f"Path: file {st['queue_depth']} | {st['last_served']} servies "
+            f"({st['last_frame_ms']:.1f}/{self.scheduler.frame_budget_ms:.1f} ms) | "
+            f"attente moy {st['avg_wait_frames']:.1f}f max {st['max_wait_frames']}f"
+        )
 
 
 # alias si tu veux l'importer comme "Processor"
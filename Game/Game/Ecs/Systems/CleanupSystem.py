@@ -2,18 +2,22 @@ import esper
 
 from Game.Ecs.Components.health import Health
 from Game.Ecs.Components.lifetime import Lifetime
+from Game.Utils.damage_events import DamageAccumulator
 
 
 class CleanupSystem(esper.Processor):
     """
     - Supprime les entités mortes (sauf celles protégées : pyramides)
     - Gère aussi Lifetime.ttl si utilisé
+    - Avec un DamageAccumulator : les morts sont lues dans le flux de morts
+      (dernier flush) au lieu de parcourir toutes les Health
     """
 
     # Initialise le système de nettoyage avec une liste d'entités protégées
-    def __init__(self, *, protected_entities: set[int] | None = None):
+    def __init__(self, *, protected_entities: set[int] | None = None, damage: DamageAccumulator | None = None):
         super().__init__()
         self.protected = set(protected_entities or set())
+        self.damage = damage
 
     # Supprime les entités mortes ou expirées (sauf celles protégées)
     def process(self, dt: float):
@@ -26,11 +30,16 @@ class CleanupSystem(esper.Processor):
                 to_delete.append(eid)
 
         # morts
-        for eid, (hp,) in esper.get_components(Health):
-            if eid in self.protected:
-                continue
-            if hp.is_dead:
-                to_delete.append(eid)
+        if self.damage is not None:
+            for event in self.damage.deaths:
+                if event.victim not in self.protected:
+                    to_delete.append(event.victim)
+        else:
+            for eid, (hp,) in esper.get_components(Health):
+                if eid in self.protected:
+                    continue
+                if hp.is_dead:
+                    to_delete.append(eid)
 
         # suppression
         for eid in set(to_delete):
@@ -3,7 +3,20 @@ CombatSystem - Gère les tirs des unités.
 
 Projectiles HOMING - les unités tirent directement vers leur cible,
 les projectiles suivent la cible jusqu'à l'impact.
+
+Recharge planifiée : au tir, l'instant où l'unité pourra retirer (horloge de
+simulation) est mis dans un tas ; à chaque frame on ne réveille que les
+unités dont la recharge est écoulée, au lieu de décrémenter tous les timers.
+
+Flux de morts (damage) : une cible tuée au dernier flush de DamageSystem est
+abandonnée sans revérifier entity_exists / Health de chaque cible.
+
+Unités prêtes (ready) : ensemble partagé avec TargetingSystem, qui y ajoute
+les unités dont la cible est posée ou change ; le réveil de fin de recharge
+y remet les autres. Seules ces unités sont parcourues : une unité en recharge
+ou sans cible n'est plus lue à chaque frame.
 """
+import heapq
 import math
 import esper
 
@@ -16,13 +29,18 @@ from Game.Ecs.Components.attack_cooldown import AttackCooldown
 from Game.Ecs.Components.velocity import Velocity
 from Game.Ecs.Components.projectile import Projectile
 from Game.Ecs.Components.lifetime import Lifetime
+from Game.Utils.impact_queue import ImpactQueue
+from Game.Utils.projectile_pool import ProjectilePool
+from Game.Utils.damage_events import DamageAccumulator
 
 
 class CombatSystem(esper.Processor):
     """Combat avec projectiles homing - tire dès qu'une cible est à portée."""
 
     # Initialise le système de combat avec les paramètres d'attaque et projectiles
-    def __init__(self, *, attack_range: float = 2.0, hit_cooldown: float = 0.6, projectile_speed: float = 12.0, align_tolerance: float = 0.5):
+    def __init__(self, *, attack_range: float = 2.0, hit_cooldown: float = 0.6, projectile_speed: float = 12.0, align_tolerance: float = 0.5,
+                 impacts: ImpactQueue | None = None, pool: ProjectilePool | None = None,
+                 damage: DamageAccumulator | None = None, ready: set | None = None):
         super().__init__()
         self.attack_range = float(attack_range)
         self.hit_cooldown = float(hit_cooldown)
@@ -30,6 +48,48 @@ class CombatSystem(esper.Processor):
         self.align_tolerance = float(align_tolerance)  # Gardé pour compatibilité mais non utilisé
         self._sound_manager = None
         self._shoot_sound_cooldown = 0.0
+        # Impacts programmés / pool de projectiles : pas d'entité projectile (voir ProjectileSystem)
+        self.impacts = impacts
+        self.pool = pool
+        # Morts de la frame (sinon on regarde Health de chaque cible)
+        self.damage = damage
+        # Unités prêtes à tirer (None : toutes les unités qui ont une cible)
+        self.ready = ready
+
+        # Horloge de simulation et tas (instant prêt, entité) des unités en recharge
+        self._time = 0.0
+        self._ready_heap: list = []
+        # Entité -> instant où elle pourra retirer (entrée valide du tas)
+        self._cooling: dict = {}
+
+    # Réveille les unités dont la recharge est écoulée
+    def _wake_ready(self):
+        heap = self._ready_heap
+        while heap and heap[0][0] <= self._time:
+            ready_at, eid = heapq.heappop(heap)
+            if self._cooling.get(eid) != ready_at:
+                continue
+            del self._cooling[eid]
+            cd = esper.try_component(eid, AttackCooldown)
+            if cd is not None:
+                cd.timer = 0.0
+            if self.ready is not None:
+                self.ready.add(eid)
+
+    # Unités prêtes, par numéro d'entité ; oublie celles en recharge, sans cible ou disparues
+    def _ready_units(self):
+        ready = self.ready
+        units = []
+        for eid in sorted(ready):
+            t = esper.try_component(eid, Transform)
+            team = esper.try_component(eid, Team)
+            stats = esper.try_component(eid, UnitStats)
+            target = esper.try_component(eid, Target)
+            if eid in self._cooling or t is None or team is None or stats is None or target is None:
+                ready.discard(eid)
+                continue
+            units.append((eid, (t, team, stats, target)))
+        return units
 
     # Récupère l'instance du gestionnaire de sons (lazy loading)
     def _get_sound_manager(self):
@@ -54,38 +114,37 @@ class CombatSystem(esper.Processor):
         # Cooldown son (éviter spam)
         self._shoot_sound_cooldown = max(0.0, self._shoot_sound_cooldown - dt)
 
-        for eid, (t, team, stats, target) in esper.get_components(Transform, Team, UnitStats, Target):
-            # Gérer le cooldown d'attaque
-            if esper.has_component(eid, AttackCooldown):
-                cd = esper.component_for_entity(eid, AttackCooldown)
-            else:
-                cd = AttackCooldown(cooldown=self.hit_cooldown, timer=0.0)
-                esper.add_component(eid, cd)
+        self._time += dt
+        self._wake_ready()
+        cooling = self._cooling
+        victims = self.damage.victims if self.damage is not None else None
+
+        ready = self.ready
+        if ready is None:
+            units = esper.get_components(Transform, Team, UnitStats, Target)
+        else:
+            units = self._ready_units()
 
-            cd.timer = max(0.0, cd.timer - dt)
-            if cd.timer > 0.0:
+        for eid, (t, team, stats, target) in units:
+            # Encore en recharge : rien à faire avant son réveil
+            if eid in cooling:
                 continue
 
             # Vérifier que la cible existe
             tid = int(target.entity_id)
-            if not esper.entity_exists(tid):
-                if esper.has_component(eid, Target):
-                    esper.remove_component(eid, Target)
-                continue
-
-            try:
-                tt = esper.component_for_entity(tid, Transform)
-                th = esper.component_for_entity(tid, Health)
-                tteam = esper.component_for_entity(tid, Team)
-            except Exception:
-                if esper.has_component(eid, Target):
-                    esper.remove_component(eid, Target)
-                continue
-
-            # Cible morte ou même équipe
-            if th.is_dead or tteam.id == team.id:
-                if esper.has_component(eid, Target):
-                    esper.remove_component(eid, Target)
+            tt = esper.try_component(tid, Transform)
+            tteam = esper.try_component(tid, Team)
+            if victims is not None:
+                dead = tid in victims
+            else:
+                th = esper.try_component(tid, Health)
+                dead = th is None or th.is_dead
+
+            # Cible disparue, morte ou même équipe
+            if tt is None or tteam is None or dead or tteam.id == team.id:
+                esper.remove_component(eid, Target)
+                if ready is not None:
+                    ready.discard(eid)
                 continue
 
             # Calculer la distance
@@ -109,13 +168,24 @@ class CombatSystem(esper.Processor):
                 fire_dx = self.projectile_speed
                 fire_dy = 0.0
 
-            # Créer le projectile
-            esper.create_entity(
-                Transform(pos=(ax, ay)),
-                Velocity(vx=fire_dx, vy=fire_dy),
-                Projectile(team_id=int(team.id), target_entity_id=tid, damage=dmg, hit_radius=0.4),
-                Lifetime(ttl=5.0, despawn_on_death=False)
-            )
+            # Créer le projectile (impact programmé, pool ou entité)
+            if self.impacts is not None:
+                self.impacts.schedule(
+                    team_id=int(team.id), target_entity_id=tid, damage=dmg, origin=(ax, ay),
+                    target_pos=(bx, by), speed=self.projectile_speed, hit_radius=0.4, ttl=5.0,
+                )
+            elif self.pool is not None:
+                self.pool.spawn(
+                    pos=(ax, ay), vel=(fire_dx, fire_dy), target_entity_id=tid,
+                    team_id=int(team.id), damage=dmg, hit_radius=0.4, ttl=5.0,
+                )
+            else:
+                esper.create_entity(
+                    Transform(pos=(ax, ay)),
+                    Velocity(vx=fire_dx, vy=fire_dy),
+                    Projectile(team_id=int(team.id), target_entity_id=tid, damage=dmg, hit_radius=0.4),
+                    Lifetime(ttl=5.0, despawn_on_death=False)
+                )
 
             # Son de tir (limité pour éviter spam)
             if self._shoot_sound_cooldown <= 0:
@@ -124,5 +194,15 @@ class CombatSystem(esper.Processor):
                     sm.play("shoot")
                 self._shoot_sound_cooldown = 0.15
 
-            # Reset cooldown
-            cd.timer = cd.cooldown
\ No newline at end of file
+            # Reset cooldown (AttackCooldown posé à la création ; sinon valeur par défaut)
+            if esper.has_component(eid, AttackCooldown):
+                cd = esper.component_for_entity(eid, AttackCooldown)
+            else:
+                cd = AttackCooldown(cooldown=self.hit_cooldown, timer=0.0)
+                esper.add_component(eid, cd)
+            cd.timer = cd.cooldown
+            ready_at = self._time + cd.cooldown
+            cooling[eid] = ready_at
+            heapq.heappush(self._ready_heap, (ready_at, eid))
+            if ready is not None:
+                ready.discard(eid)
\ No newline at end of file
@@ -0,0 +1,87 @@
+import esper
+
+from Game.Ecs.Components.health import Health
+from Game.Ecs.Components.team import Team
+from Game.Ecs.Components.wallet import Wallet
+from Game.Ecs.Components.unitStats import UnitStats
+from Game.Utils.damage_events import ENVIRONMENT_TEAM, DamageAccumulator, DeathEvent
+
+
+class DamageSystem(esper.Processor):
+    """
+    Applique en une fois les dégâts accumulés pendant la frame.
+    - Touches appliquées dans l'ordre d'arrivée (une victime morte n'encaisse plus)
+    - Sons de touche et de mort (tirs seulement, pas l'environnement)
+    - Récompense : coût de la victime / reward_divisor au Wallet de la pyramide
+      de l'équipe qui a tué
+    - Publie les morts de la frame (DeathEvent) dans l'accumulateur
+    """
+
+    # Initialise le système avec l'accumulateur partagé, les pyramides et les récompenses
+    def __init__(self, damage: DamageAccumulator, *, pyramid_by_team: dict[int, int] | None = None,
+                 reward_divisor: float = 2.0):
+        super().__init__()
+        self.damage = damage
+        self.pyramid_by_team = pyramid_by_team or {}
+        self.reward_divisor = float(reward_divisor) if float(reward_divisor) > 0 else 2.0
+        self._sound_manager = None
+
+    # Récupère l'instance du gestionnaire de sons (lazy loading)
+    def _get_sound_manager(self):
+        if self._sound_manager is None:
+            try:
+                from Game.Audio.sound_manager import sound_manager
+                self._sound_manager = sound_manager
+            except ImportError:
+                try:
+                    from Audio.sound_manager import sound_manager
+                    self._sound_manager = sound_manager
+                except ImportError:
+                    pass
+        return self._sound_manager
+
+    # Crédite la pyramide de l'équipe qui a tué
+    def _reward(self, event: DeathEvent):
+        pyramid_eid = int(self.pyramid_by_team.get(event.killer_team, 0))
+        if pyramid_eid == 0 or event.cost <= 0:
+            return
+        wallet = esper.try_component(pyramid_eid, Wallet)
+        if wallet is not None:
+            wallet.solde += (event.cost / self.reward_divisor)
+
+    # Applique les touches en attente et publie les morts
+    def process(self, dt: float = 0.0):
+        pending = self.damage.take()
+        deaths = []
+        sm = self._get_sound_manager() if pending else None
+
+        for victim, points, source_team in pending:
+            hp = esper.try_component(victim, Health)
+            if hp is None or hp.is_dead:
+                continue
+            hp.hp = max(0, int(hp.hp - points))
+            shot = source_team != ENVIRONMENT_TEAM
+
+            # Son de hit
+            if sm and shot:
+                sm.play("hit")
+
+            if not hp.is_dead:
+                continue
+
+            # Son de mort
+            if sm and shot:
+                sm.play("death")
+
+            stats = esper.try_component(victim, UnitStats)
+            team = esper.try_component(victim, Team)
+            event = DeathEvent(
+                victim=victim,
+                killer_team=source_team,
+                cost=float(stats.cost) if stats is not None else 0.0,
+                victim_team=int(team.id) if team is not None else 0,
+            )
+            self._reward(event)
+            deaths.append(event)
+
+        self.damage.publish(deaths)
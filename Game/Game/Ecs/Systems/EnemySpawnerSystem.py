@@ -146,30 +146,8 @@ class EnemySpawnerSystem(esper.Processor):
 
     # Trouve une case marchable proche d'une position donnée
     def _find_walkable_near(self, x: int, y: int, max_r: int = 10):
-        w = int(getattr(self.nav_grid, "width", 0))
-        h = int(getattr(self.nav_grid, "height", 0))
-
-        for r in range(0, max_r + 1):
-            for dy in range(-r, r + 1):
-                for dx in range(-r, r + 1):
-                    nx = int(x + dx)
-                    ny = int(y + dy)
-
-                    if w > 0 and h > 0:
-                        if nx < 0 or nx >= w or ny < 0 or ny >= h:
-                            continue
-
-                    if hasattr(self.nav_grid, "is_walkable"):
-                        try:
-                            if self.nav_grid.is_walkable(nx, ny):
-                                return nx, ny
-                        except Exception:
-                            continue
-                    else:
-                        if 0 <= nx < self.nav_grid.width and 0 <= ny < self.nav_grid.height:
-                            if self.nav_grid.walkable[ny][nx]:
-                                return nx, ny
-        return None
+        # Carte précalculée de la NavigationGrid (une lecture de tableau)
+        return self.nav_grid.nearest_walkable(int(x), int(y), max_r=max_r)
 
     # S'assure que la pyramide ennemie a un Wallet avec argent de départ
     def _ensure_enemy_wallet(self):
@@ -7,15 +7,22 @@ et ce système les assigne aux unités selon leur lane et leur équipe.
 
 - Joueur (team 1) : utilise lane_paths[lane_idx]
 - Ennemi (team 2) : utilise lane_paths[lane_idx] INVERSÉ
+
+Chaque lane est stockée une seule fois (LaneRoute, coordonnées compactes) ;
+le Path d'une unité ne garde qu'une référence + indice de départ + sens.
+
+Option simplify : les unités ne visent que les coins de la route (et les
+frontières de terrain lues dans nav_grid.mult) au lieu de chaque case.
 """
 import esper
 
 from Game.Ecs.Components.transform import Transform
 from Game.Ecs.Components.team import Team
 from Game.Ecs.Components.path import Path as PathComponent
-from Game.Ecs.Components.grid_position import GridPosition
 from Game.Ecs.Components.pathProgress import PathProgress
 from Game.Ecs.Components.lane import Lane
+from Game.Utils.lane_route import LaneRoute
+from Game.Utils.path_simplify import navgrid_mult
 
 
 class LaneRouteSystem:
@@ -28,23 +35,70 @@ class LaneRouteSystem:
         self,
         lanes_y: list[int],
         pyramid_ids: set[int],
+        *,
+        nav_grid=None,
+        simplify: bool = False,
     ):
         self.lanes_y = list(lanes_y)
         self.pyramid_ids = set(int(x) for x in pyramid_ids)
+        # Simplification des routes en points de passage (coins + frontières de terrain)
+        self.nav_grid = nav_grid
+        self.simplify = bool(simplify)
         
         # Chemins pré-calculés (seront mis à jour par game_app)
         self.lane_paths = [[], [], []]  # Joueur → Ennemi
+        # Routes partagées par lane (None si pas de chemin)
+        self.routes: list = [None, None, None]
         
         # Tracking des unités
         self.assigned_ents = set()
 
     # Met à jour les chemins précalculés pour chaque lane
     def set_lane_paths(self, lane_paths: list):
-        """Met à jour les chemins pré-calculés (appelé par game_app)."""
-        self.lane_paths = [list(p) for p in lane_paths] if lane_paths else [[], [], []]
-        
-        # Forcer le recalcul des chemins pour toutes les unités
-        self.assigned_ents.clear()
+        """
+        Met à jour les chemins pré-calculés (appelé par game_app).
+        Seules les unités des lanes dont le chemin a changé sont réassignées.
+        """
+        new_paths = [list(p) for p in lane_paths] if lane_paths else [[], [], []]
+        changed = {
+            i for i in range(len(new_paths))
+            if i >= len(self.lane_paths) or self.lane_paths[i] != new_paths[i]
+        }
+        routes = [self._build_route(p) for p in new_paths]
+        if self.simplify:
+            # Même chemin mais terrain modifié : les points de passage peuvent changer
+            changed |= {
+                i for i, r in enumerate(routes)
+                if r is not None and not r.same_as(self.routes[i] if i < len(self.routes) else None)
+            }
+        self.lane_paths = new_paths
+        self.routes = [
+            (self.routes[i] if i < len(self.routes) and i not in changed else r)
+            for i, r in enumerate(routes)
+        ]
+
+        if not changed:
+            return
+        if len(changed) == len(new_paths):
+            # Forcer le recalcul des chemins pour toutes les unités
+            self.assigned_ents.clear()
+            return
+
+        for ent in list(self.assigned_ents):
+            lane_idx = -1
+            if esper.entity_exists(ent) and esper.has_component(ent, Lane):
+                lane_idx = esper.component_for_entity(ent, Lane).index
+            if lane_idx < 0 or lane_idx in changed:
+                self.assigned_ents.discard(ent)
+
+    # Construit la route partagée d'un chemin (None si vide)
+    def _build_route(self, points: list):
+        if not points:
+            return None
+        if not self.simplify:
+            return LaneRoute(points)
+        mult_at = navgrid_mult(self.nav_grid) if self.nav_grid is not None else None
+        return LaneRoute(points, simplify=True, mult_at=mult_at)
 
     # Assigne manuellement une lane à une entité
     def set_lane_for_entity(self, ent: int, lane_idx: int):
@@ -78,23 +132,14 @@ class LaneRouteSystem:
                 best_i = i
         return max(0, min(2, best_i))
 
-    # Trouve le point le plus proche sur un chemin donné
-    def _find_closest_point_on_path(self, pos: tuple, path: list) -> int:
-        """Trouve l'index du point le plus proche sur le chemin."""
-        if not path:
+    # Trouve le point le plus proche sur une route lue dans le sens step
+    def _find_closest_point_on_path(self, pos: tuple, route: LaneRoute, step: int = 1) -> int:
+        """Trouve l'index (dans le sens de lecture) du point le plus proche de la route."""
+        if len(route) == 0:
             return 0
-        
-        px, py = pos
-        best_idx = 0
-        best_dist = 999999
-        
-        for i, (x, y) in enumerate(path):
-            d = abs(x - px) + abs(y - py)
-            if d < best_dist:
-                best_dist = d
-                best_idx = i
-        
-        return best_idx
+        # Index spatial de la route : O(1) attendu au lieu d'un balayage complet
+        first = 0 if step > 0 else len(route) - 1
+        return (route.closest(pos, step) - first) * step
 
     # Assigne les chemins précalculés aux unités selon leur lane et équipe
     def process(self, dt: float):
@@ -109,8 +154,7 @@ class LaneRouteSystem:
             
             # Si déjà assigné et a un chemin, ne pas toucher
             if int(ent) in self.assigned_ents:
-                nodes = getattr(path, "noeuds", [])
-                if nodes:
+                if path.length() > 0:
                     continue
             
             # Déterminer la lane
@@ -125,36 +169,38 @@ class LaneRouteSystem:
             
             lane_idx = max(0, min(2, lane_idx))
             
-            # Récupérer le chemin pré-calculé
-            if not self.lane_paths or lane_idx >= len(self.lane_paths):
+            # Récupérer la route pré-calculée
+            if not self.routes or lane_idx >= len(self.routes):
                 continue
             
-            base_path = self.lane_paths[lane_idx]
-            if not base_path:
+            route = self.routes[lane_idx]
+            if route is None or len(route) == 0:
                 continue
             
-            # Pour l'ennemi (team 2), inverser le chemin
-            if team.id == 2:
-                full_path = list(reversed(base_path))
-            else:
-                full_path = list(base_path)
+            # Pour l'ennemi (team 2), lire la route à l'envers
+            step = -1 if team.id == 2 else 1
+            first = 0 if step > 0 else len(route) - 1
             
-            if not full_path:
-                continue
-            
-            # Trouver où l'unité se trouve sur le chemin
+            # Trouver où l'unité se trouve sur la route
             cur_pos = (int(round(t.pos[0])), int(round(t.pos[1])))
-            start_idx = self._find_closest_point_on_path(cur_pos, full_path)
-            
-            # Prendre le chemin à partir de la position actuelle
-            remaining_path = full_path[start_idx:]
+            start_idx = self._find_closest_point_on_path(cur_pos, route, step)
             
-            if len(remaining_path) < 2:
-                remaining_path = full_path  # Fallback au chemin complet
+            # Prendre la route à partir de la position actuelle
+            if len(route) - start_idx < 2:
+                start_idx = 0  # Fallback à la route complète
             
-            # Assigner le chemin
-            gp_nodes = [GridPosition(int(x), int(y)) for (x, y) in remaining_path]
-            path.noeuds = gp_nodes
+            # Case de départ + case suivante, puis points de passage au-delà
+            # (référence partagée, aucun nœud copié ; sans simplification,
+            # mêmes nœuds que la route lue depuis start_idx)
+            cur = first + start_idx * step
+            nxt = cur + step
+            if 0 <= nxt < len(route):
+                head = (route.point(cur), route.point(nxt))
+                k = route.next_waypoint(nxt, step)
+            else:
+                head = (route.point(cur),)
+                k = None
+            path.set_route(route, -1 if k is None else k, step, head=head)
             
             # Reset progress
             try:
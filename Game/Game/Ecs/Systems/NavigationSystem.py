@@ -90,18 +90,18 @@ class NavigationSystem(esper.Processor):
                 velocity.vy = 0.0
                 continue
 
-            # Suivre le chemin normal
-            nodes = getattr(path, "noeuds", None)
-            if not nodes or prog.index >= len(nodes) - 1:
+            # Suivre le chemin normal (propre ou vue sur une route de lane partagée)
+            n_nodes = path.length()
+            if n_nodes == 0 or prog.index >= n_nodes - 1:
                 # Chemin terminé - s'arrêter
                 velocity.vx = 0.0
                 velocity.vy = 0.0
                 continue
 
             # Prochain nœud à atteindre
-            target_node = nodes[prog.index + 1]
+            node_x, node_y = path.point(prog.index + 1)
             tx, ty = transform.pos
-            gx, gy = float(target_node.x), float(target_node.y)
+            gx, gy = float(node_x), float(node_y)
 
             dx = gx - tx
             dy = gy - ty
@@ -110,10 +110,10 @@ class NavigationSystem(esper.Processor):
             # Arrivé au nœud (snap)
             if dist <= self.arrive_radius:
                 transform.pos = (gx, gy)
-                gpos.x, gpos.y = int(target_node.x), int(target_node.y)
+                gpos.x, gpos.y = node_x, node_y
                 prog.index += 1
 
-                if prog.index >= len(nodes) - 1:
+                if prog.index >= n_nodes - 1:
                     # Chemin terminé
                     velocity.vx = 0.0
                     velocity.vy = 0.0
@@ -142,9 +142,9 @@ class NavigationSystem(esper.Processor):
             # Anti-overshoot
             if step >= dist:
                 transform.pos = (gx, gy)
-                gpos.x, gpos.y = int(target_node.x), int(target_node.y)
+                gpos.x, gpos.y = node_x, node_y
                 prog.index += 1
-                if prog.index >= len(nodes) - 1:
+                if prog.index >= n_nodes - 1:
                     velocity.vx = 0.0
                     velocity.vy = 0.0
                 continue
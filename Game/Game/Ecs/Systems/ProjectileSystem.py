@@ -1,49 +1,115 @@
 import math
 import esper
+import numpy as np
 
 from Game.Ecs.Components.transform import Transform
 from Game.Ecs.Components.velocity import Velocity
 from Game.Ecs.Components.projectile import Projectile
 from Game.Ecs.Components.health import Health
 from Game.Ecs.Components.team import Team
-from Game.Ecs.Components.wallet import Wallet
-from Game.Ecs.Components.unitStats import UnitStats
+from Game.Ecs.Systems.DamageSystem import DamageSystem
+from Game.Utils.damage_events import DamageAccumulator
+from Game.Utils.impact_queue import MIN_HIT_RADIUS, ImpactQueue, ScheduledImpact
+from Game.Utils.projectile_pool import ProjectilePool
 
 
 class ProjectileSystem(esper.Processor):
     """
     Projectiles HOMING (suivent leur cible).
     - Recalcule la direction vers la cible à chaque frame
-    - Applique les dégâts quand le projectile touche
+    - Empile les dégâts quand le projectile touche (DamageAccumulator partagé,
+      appliqué par DamageSystem ; sans accumulateur partagé, flush local en fin
+      de process, récompense comprise)
     - Supprime le projectile si la cible meurt ou n'existe plus
+    - Mode impacts programmés (impacts) : applique les tirs échus de la file,
+      sans entité projectile
+    - Mode pool (pool) : mêmes règles, vectorisées sur le ProjectilePool
+      (durée de vie comprise, à la place de Lifetime / CleanupSystem)
     """
 
     # Initialise le système de projectiles avec pyramides et récompenses
-    def __init__(self, pyramid_by_team: dict[int, int] | None = None, reward_divisor: float = 2.0):
+    def __init__(self, pyramid_by_team: dict[int, int] | None = None, reward_divisor: float = 2.0,
+                 impacts: ImpactQueue | None = None, pool: ProjectilePool | None = None,
+                 damage: DamageAccumulator | None = None):
         super().__init__()
         self.pyramid_by_team = pyramid_by_team or {}
         self.reward_divisor = float(reward_divisor) if float(reward_divisor) > 0 else 2.0
-        self._sound_manager = None
+        self.impacts = impacts
+        self.pool = pool
+        # Accumulateur partagé : le flush est un système à part ; sinon flush local
+        self.flush = None
+        if damage is None:
+            damage = DamageAccumulator()
+            self.flush = DamageSystem(damage, pyramid_by_team=self.pyramid_by_team,
+                                      reward_divisor=self.reward_divisor)
+        self.damage = damage
+
+    # Empile les dégâts d'un tir au but (appliqués au flush de DamageSystem)
+    def _apply_hit(self, tid: int, shooter_team: int, damage: float):
+        self.damage.add(tid, damage, shooter_team)
+
+    # Applique un impact programmé échu (perdu si la cible est morte ou a disparu)
+    def _resolve_impact(self, impact: ScheduledImpact):
+        tid = impact.target_entity_id
+        if not esper.entity_exists(tid) or not esper.has_components(tid, Transform, Health, Team):
+            return
+        th = esper.component_for_entity(tid, Health)
+        if th.is_dead or int(esper.component_for_entity(tid, Team).id) == impact.team_id:
+            return
+        self._apply_hit(tid, impact.team_id, impact.damage)
+
+    # Projectiles du pool : cibles lues une fois par cible distincte, touches et vol vectorisés
+    def _process_pool(self, dt: float):
+        pool = self.pool
+        pool.tick(dt)
+        idx = pool.active_indices()
+        if len(idx) == 0:
+            return
 
-    # Récupère l'instance du gestionnaire de sons (lazy loading)
-    def _get_sound_manager(self):
-        if self._sound_manager is None:
-            try:
-                from Game.Audio.sound_manager import sound_manager
-                self._sound_manager = sound_manager
-            except ImportError:
-                try:
-                    from Audio.sound_manager import sound_manager
-                    self._sound_manager = sound_manager
-                except ImportError:
-                    pass
-        return self._sound_manager
+        targets, inverse = np.unique(pool.target[idx], return_inverse=True)
+        n = len(targets)
+        tx = np.zeros(n)
+        ty = np.zeros(n)
+        tteam = np.full(n, -1, dtype=np.int64)
+        alive = np.zeros(n, dtype=bool)
+        for k, tid in enumerate(targets.tolist()):
+            if not esper.entity_exists(tid) or not esper.has_components(tid, Transform, Health, Team):
+                continue
+            if esper.component_for_entity(tid, Health).is_dead:
+                continue
+            tx[k], ty[k] = esper.component_for_entity(tid, Transform).pos
+            tteam[k] = int(esper.component_for_entity(tid, Team).id)
+            alive[k] = True
+
+        px = tx[inverse]
+        py = ty[inverse]
+        # Cible vivante et adverse, sinon le projectile disparaît
+        valid = alive[inverse] & (tteam[inverse] != pool.team[idx])
+        dist = np.hypot(px - pool.x[idx], py - pool.y[idx])
+        hit = valid & (dist <= np.maximum(MIN_HIT_RADIUS, pool.hit_radius[idx]))
+
+        # TOUCHÉS, dans l'ordre des cases (une cible tuée n'encaisse plus les suivants, au flush)
+        for i in idx[hit].tolist():
+            self._apply_hit(int(pool.target[i]), int(pool.team[i]), float(pool.damage[i]))
+
+        pool.release(idx[~valid | hit])
+        fly = valid & ~hit
+        pool.steer_and_move(idx[fly], px[fly], py[fly], dt)
 
     # Déplace les projectiles homing vers leur cible et applique les dégâts
     def process(self, dt: float):
         if dt <= 0:
             return
 
+        # Impacts programmés : horloge, puis tirs arrivés
+        if self.impacts is not None:
+            self.impacts.advance(dt)
+            for impact in self.impacts.pop_due():
+                self._resolve_impact(impact)
+
+        if self.pool is not None:
+            self._process_pool(dt)
+
         to_delete = []
 
         for eid, (t, v, p) in esper.get_components(Transform, Velocity, Projectile):
@@ -75,45 +141,11 @@ class ProjectileSystem(esper.Processor):
             dist = math.hypot(dx, dy)
 
             # Vérifier si on touche (hit_radius augmenté pour plus de fiabilité)
-            effective_hit_radius = max(0.4, float(p.hit_radius))
+            effective_hit_radius = max(MIN_HIT_RADIUS, float(p.hit_radius))
             
             if dist <= effective_hit_radius:
                 # TOUCHÉ !
-                dmg = float(p.damage)
-                dmg_points = int(round(dmg))
-                if dmg_points < 0:
-                    dmg_points = 0
-
-                old_hp = int(th.hp)
-                th.hp = max(0, int(th.hp - dmg_points))
-                
-                # Son de hit
-                sm = self._get_sound_manager()
-                if sm:
-                    sm.play("hit")
-
-                # Vérifier si la cible meurt
-                if old_hp > 0 and th.hp <= 0:
-                    shooter_team = int(p.team_id)
-                    pyramid_eid = int(self.pyramid_by_team.get(shooter_team, 0))
-                    
-                    # Son de mort
-                    if sm:
-                        sm.play("death")
-
-                    # Récompense
-                    if pyramid_eid != 0:
-                        ce = 0.0
-                        if esper.has_component(tid, UnitStats):
-                            ce = float(esper.component_for_entity(tid, UnitStats).cost)
-
-                        if ce > 0:
-                            try:
-                                wallet = esper.component_for_entity(pyramid_eid, Wallet)
-                                wallet.solde += (ce / self.reward_divisor)
-                            except Exception:
-                                pass
-
+                self._apply_hit(tid, int(p.team_id), float(p.damage))
                 to_delete.append(eid)
                 continue
 
@@ -135,4 +167,8 @@ class ProjectileSystem(esper.Processor):
             try:
                 esper.delete_entity(eid, immediate=True)
             except Exception:
-                pass
\ No newline at end of file
+                pass
+
+        # Sans DamageSystem dédié : dégâts appliqués tout de suite
+        if self.flush is not None:
+            self.flush.process(dt)
@@ -3,6 +3,12 @@ PyramidDefenseSystem - Les pyramides tirent sur les ennemis à portée.
 
 La pyramide tire automatiquement sur l'ennemi le plus proche dans sa portée.
 Respecte les règles SAÉ : tirs axiaux uniquement.
+
+Les ennemis ne sont collectés que si au moins une pyramide est prête à tirer
+(cooldown écoulé). Ils sont lus dans l'index spatial de la frame de
+TargetingSystem (targeting.frame_index()), sinon dans un hachage propre ;
+chaque pyramide ne lit que ses deux bandes d'alignement (horizontale et
+verticale).
 """
 import math
 import esper
@@ -14,6 +20,9 @@ from Game.Ecs.Components.unitStats import UnitStats
 from Game.Ecs.Components.velocity import Velocity
 from Game.Ecs.Components.projectile import Projectile
 from Game.Ecs.Components.lifetime import Lifetime
+from Game.Utils.spatial_hash import SpatialHash
+from Game.Utils.impact_queue import ImpactQueue
+from Game.Utils.projectile_pool import ProjectilePool
 
 
 # Retourne le signe d'un nombre (1.0 ou -1.0)
@@ -28,7 +37,9 @@ class PyramidDefenseSystem(esper.Processor):
 
     # Initialise le système de défense des pyramides avec portée et dégâts
     def __init__(self, pyramid_ids: set[int], attack_range: float = 3.0, 
-                 damage: float = 8.0, cooldown: float = 1.2, projectile_speed: float = 10.0):
+                 damage: float = 8.0, cooldown: float = 1.2, projectile_speed: float = 10.0,
+                 impacts: ImpactQueue | None = None, pool: ProjectilePool | None = None,
+                 targeting=None):
         super().__init__()
         self.pyramid_ids = set(int(x) for x in pyramid_ids)
         self.attack_range = float(attack_range)
@@ -36,9 +47,39 @@ class PyramidDefenseSystem(esper.Processor):
         self.cooldown = float(cooldown)
         self.projectile_speed = float(projectile_speed)
         self.align_tolerance = 0.8  # Plus tolérant pour les pyramides
+        # Impacts programmés / pool de projectiles : pas d'entité projectile (voir ProjectileSystem)
+        self.impacts = impacts
+        self.pool = pool
         
         # Cooldown par pyramide
         self.timers = {pid: 0.0 for pid in self.pyramid_ids}
+        # Index spatial partagé (TargetingSystem) ; sinon hachage propre, reconstruit
+        # seulement quand une pyramide peut tirer
+        self.targeting = targeting
+        self.spatial = SpatialHash(self.attack_range)
+
+    # Index des unités vivantes (clé = équipe) : celui de la frame si partagé
+    def _build_index(self) -> SpatialHash:
+        if self.targeting is not None:
+            return self.targeting.frame_index()
+        self.spatial.clear()
+        order = 0
+        for eid, (t, team, stats, hp) in esper.get_components(Transform, Team, UnitStats, Health):
+            if hp.is_dead:
+                continue
+            ex, ey = t.pos
+            # order : départage des égalités comme l'ancien balayage de liste
+            # (même forme que les entrées de TargetingSystem : pyramide, lane)
+            self.spatial.insert((order, eid, ex, ey, False, -1), ex, ey, team.id)
+            order += 1
+        return self.spatial
+
+    # Ennemis des bandes d'alignement (horizontale et verticale) autour de (px, py)
+    def _aligned_candidates(self, spatial: SpatialHash, px: float, py: float, enemy_team: int):
+        r = self.attack_range
+        tol = self.align_tolerance
+        yield from spatial.query_rect(px - r, py - tol, px + r, py + tol, enemy_team)
+        yield from spatial.query_rect(px - tol, py - r, px + tol, py + r, enemy_team)
 
     # Fait tirer les pyramides sur les ennemis alignés axialement à portée
     def process(self, dt: float):
@@ -50,23 +91,17 @@ class PyramidDefenseSystem(esper.Processor):
             if pid in self.timers:
                 self.timers[pid] = max(0.0, self.timers[pid] - dt)
 
-        # Collecter les ennemis potentiels (unités avec UnitStats)
-        enemies_by_team = {1: [], 2: []}  # team_id -> [(eid, transform)]
-        for eid, (t, team, stats, hp) in esper.get_components(Transform, Team, UnitStats, Health):
-            if hp.is_dead:
-                continue
-            if team.id in enemies_by_team:
-                enemies_by_team[team.id].append((eid, t))
+        # Pyramides prêtes (cooldown écoulé) : sinon aucune collecte d'ennemis
+        ready = [
+            pid for pid in self.pyramid_ids
+            if self.timers.get(pid, 0.0) <= 0.0 and esper.entity_exists(pid)
+        ]
+        if not ready:
+            return
+        spatial = self._build_index()
 
         # Chaque pyramide tire sur les ennemis
-        for pid in self.pyramid_ids:
-            if not esper.entity_exists(pid):
-                continue
-                
-            # Vérifier cooldown
-            if self.timers.get(pid, 0.0) > 0.0:
-                continue
-
+        for pid in ready:
             try:
                 pt = esper.component_for_entity(pid, Transform)
                 pteam = esper.component_for_entity(pid, Team)
@@ -81,17 +116,17 @@ class PyramidDefenseSystem(esper.Processor):
             
             # Trouver l'ennemi le plus proche
             enemy_team = 2 if pteam.id == 1 else 1
-            enemies = enemies_by_team.get(enemy_team, [])
             
+            best_key = None
             best_target = None
-            best_dist = 999999.0
             best_pos = None
 
-            for eid, et in enemies:
-                ex, ey = et.pos
+            for order, eid, ex, ey, is_pyramid, _ in self._aligned_candidates(spatial, px, py, enemy_team):
+                if is_pyramid:
+                    continue
                 d = math.hypot(ex - px, ey - py)
                 
-                if d <= self.attack_range and d < best_dist:
+                if d <= self.attack_range and (best_key is None or (d, order) < best_key):
                     # Vérifier alignement axial
                     dx = ex - px
                     dy = ey - py
@@ -99,7 +134,7 @@ class PyramidDefenseSystem(esper.Processor):
                     aligned_v = abs(dx) <= self.align_tolerance
                     
                     if aligned_h or aligned_v:
-                        best_dist = d
+                        best_key = (d, order)
                         best_target = eid
                         best_pos = (ex, ey)
 
@@ -117,14 +152,27 @@ class PyramidDefenseSystem(esper.Processor):
                     fire_dx = 0.0
                     fire_dy = _sign(dy)
 
-                # Créer projectile
-                esper.create_entity(
-                    Transform(pos=(px, py)),
-                    Velocity(vx=fire_dx * self.projectile_speed, vy=fire_dy * self.projectile_speed),
-                    Projectile(team_id=int(pteam.id), target_entity_id=best_target, 
-                              damage=self.damage, hit_radius=0.3),
-                    Lifetime(ttl=3.0, despawn_on_death=False)
-                )
+                # Créer projectile (impact programmé, pool ou entité)
+                if self.impacts is not None:
+                    self.impacts.schedule(
+                        team_id=int(pteam.id), target_entity_id=best_target, damage=self.damage,
+                        origin=(px, py), target_pos=best_pos, speed=self.projectile_speed,
+                        hit_radius=0.3, ttl=3.0,
+                    )
+                elif self.pool is not None:
+                    self.pool.spawn(
+                        pos=(px, py), vel=(fire_dx * self.projectile_speed, fire_dy * self.projectile_speed),
+                        target_entity_id=best_target, team_id=int(pteam.id), damage=self.damage,
+                        hit_radius=0.3, ttl=3.0,
+                    )
+                else:
+                    esper.create_entity(
+                        Transform(pos=(px, py)),
+                        Velocity(vx=fire_dx * self.projectile_speed, vy=fire_dy * self.projectile_speed),
+                        Projectile(team_id=int(pteam.id), target_entity_id=best_target, 
+                                  damage=self.damage, hit_radius=0.3),
+                        Lifetime(ttl=3.0, despawn_on_death=False)
+                    )
                 
                 # Reset cooldown
                 self.timers[pid] = self.cooldown
\ No newline at end of file
@@ -14,6 +14,7 @@ from Game.Ecs.Components.team import Team
 from Game.Ecs.Components.health import Health
 from Game.Ecs.Components.unitStats import UnitStats
 from Game.Ecs.Components.incomeRate import IncomeRate
+from Game.Utils.damage_events import ENVIRONMENT_TEAM, DamageAccumulator
 
 
 class RandomEventSystem(esper.Processor):
@@ -22,12 +23,14 @@ class RandomEventSystem(esper.Processor):
     """
 
     # Initialise le système d'événements aléatoires avec grille et pyramides
-    def __init__(self, nav_grid, player_pyramid_eid: int, enemy_pyramid_eid: int, on_terrain_change=None):
+    def __init__(self, nav_grid, player_pyramid_eid: int, enemy_pyramid_eid: int, on_terrain_change=None,
+                 damage: DamageAccumulator | None = None):
         super().__init__()
         self.nav_grid = nav_grid
         self.player_pyramid_eid = int(player_pyramid_eid)
         self.enemy_pyramid_eid = int(enemy_pyramid_eid)
         self.on_terrain_change = on_terrain_change  # Callback pour recalculer les lanes
+        self.damage = damage  # Dégâts groupés (appliqués par DamageSystem)
         
         # Timing
         self.time_since_last_event = 0.0
@@ -112,22 +115,17 @@ class RandomEventSystem(esper.Processor):
         self.message_timer = 3.0
         self.current_message = "TEMPETE DE SABLE! Terrain modifie!"
         
-        # Sauvegarder et échanger les multiplicateurs
-        if hasattr(self.nav_grid, 'mult'):
-            h = len(self.nav_grid.mult)
-            w = len(self.nav_grid.mult[0]) if h > 0 else 0
-            
-            self.original_mults = [[self.nav_grid.mult[y][x] for x in range(w)] for y in range(h)]
-            
-            for y in range(h):
-                for x in range(w):
-                    m = self.nav_grid.mult[y][x]
-                    if m == 1.0:  # Open → Dusty
-                        self.nav_grid.mult[y][x] = 0.5
-                    elif 0 < m < 1.0:  # Dusty → Open
-                        self.nav_grid.mult[y][x] = 1.0
-                    # Interdit (0) reste interdit
-            
+        # Sauvegarder et échanger les multiplicateurs (opérations de masse sur la grille)
+        if hasattr(self.nav_grid, 'snapshot'):
+            self.original_mults = self.nav_grid.snapshot()
+
+            # Masques calculés AVANT l'échange
+            open_mask = self.nav_grid.mult == 1.0            # Open → Dusty
+            dusty_mask = (self.nav_grid.mult > 0.0) & (self.nav_grid.mult < 1.0)  # Dusty → Open
+            # Interdit (0) reste interdit
+            self.nav_grid.set_mask(open_mask, mult=0.5)
+            self.nav_grid.set_mask(dusty_mask, mult=1.0)
+
             # Notifier que le terrain a changé → recalculer les lanes
             if self.on_terrain_change:
                 self.on_terrain_change()
@@ -146,7 +144,10 @@ class RandomEventSystem(esper.Processor):
         for eid, (hp, stats) in esper.get_components(Health, UnitStats):
             if hp.is_dead:
                 continue
-            hp.hp = max(0, hp.hp - damage)
+            if self.damage is not None:
+                self.damage.add(eid, damage, ENVIRONMENT_TEAM)
+            else:
+                hp.hp = max(0, hp.hp - damage)
 
     # Démarre un bonus de fouets qui augmente la production d'une équipe de 25%
     def _start_whip_bonus(self):
@@ -169,19 +170,15 @@ class RandomEventSystem(esper.Processor):
     # Termine l'événement actif et restaure l'état normal
     def _end_event(self):
         """Termine l'événement actif."""
-        if self.active_event == "sandstorm" and self.original_mults:
+        if self.active_event == "sandstorm" and self.original_mults is not None:
             # Restaurer le terrain
-            h = len(self.original_mults)
-            w = len(self.original_mults[0]) if h > 0 else 0
-            for y in range(h):
-                for x in range(w):
-                    self.nav_grid.mult[y][x] = self.original_mults[y][x]
+            self.nav_grid.restore(self.original_mults)
             self.original_mults = None
-            
+
             # Notifier que le terrain a changé → recalculer les lanes
             if self.on_terrain_change:
                 self.on_terrain_change()
-            
+
         elif self.active_event == "whip_bonus" and self.bonus_team:
             # Retirer bonus via multiplier (reset propre)
             pyramid_eid = self.player_pyramid_eid if self.bonus_team == 1 else self.enemy_pyramid_eid
@@ -7,9 +7,35 @@ RÈGLES :
 3. La pyramide n'est ciblée que si l'unité est ARRIVÉE (chemin terminé)
 4. Priorité : troupes ennemies > pyramide
 5. TOUTES les unités (Momie, Dromadaire, Sphinx) se défendent
+
+Moteurs (même résultat) :
+- "hash" : les cibles vivantes sont rangées une fois par frame dans un
+  hachage spatial (seaux = portée d'attaque, une partition par équipe) ;
+  chaque unité ne lit que les 3x3 seaux adverses autour d'elle.
+- "sweep" : listes par (équipe, lane) triées par X (tri par insertion d'une
+  frame à l'autre) ; même lane par balayage à deux pointeurs, convergence
+  (autres lanes) par un index secondaire en seaux de Y (hauteur
+  CONVERGENCE_TOLERANCE), lui aussi séparé par lane.
+- "numpy" : positions, équipes, lanes et états packés en tableaux une fois
+  par frame ; matrices unités x cibles des distances au carré, masques de
+  lane / convergence / équipe, argmin par ligne, puis écriture des Target
+  en une passe.
+
+Réévaluation étalée (reeval_frames > 1) : une unité qui garde une cible
+troupe valide n'est pas rebalayée ; les autres le sont une frame sur
+reeval_frames, sauf mort de la cible, sortie de portée ou changement de lane.
+La mort d'une cible est lue dans le flux de morts de DamageSystem (damage).
+
+L'index spatial (cibles vivantes par équipe) est construit une fois par
+frame par son premier lecteur (frame_index) : PyramidDefenseSystem, qui
+passe avant le ciblage, le réutilise au lieu d'en remplir un second.
+
+Cible posée ou changée : l'unité est ajoutée à l'ensemble `ready` partagé
+avec CombatSystem, qui ne parcourt que ces unités.
 """
 import math
 import esper
+import numpy as np
 
 from Game.Ecs.Components.transform import Transform
 from Game.Ecs.Components.team import Team
@@ -20,6 +46,9 @@ from Game.Ecs.Components.path import Path
 from Game.Ecs.Components.pathProgress import PathProgress
 from Game.Ecs.Components.velocity import Velocity
 from Game.Ecs.Components.lane import Lane
+from Game.Utils.spatial_hash import SpatialHash
+from Game.Utils.lane_sweep import SortedXIndex
+from Game.Utils.damage_events import DamageAccumulator
 
 
 class TargetingSystem(esper.Processor):
@@ -32,12 +61,50 @@ class TargetingSystem(esper.Processor):
     # Si deux unités sont à moins de cette distance en Y, elles sont "sur le même chemin"
     CONVERGENCE_TOLERANCE = 0.4
 
+    # Moteurs de recherche des cibles disponibles
+    ENGINES = ("hash", "sweep", "numpy")
+
     # Initialise le système de ciblage avec les objectifs et pyramides
-    def __init__(self, *, goals_by_team: dict, pyramid_ids: set[int], attack_range: float = 2.0):
+    def __init__(
+        self,
+        *,
+        goals_by_team: dict,
+        pyramid_ids: set[int],
+        attack_range: float = 2.0,
+        engine: str = "hash",
+        reeval_frames: int = 1,
+        damage: DamageAccumulator | None = None,
+        ready: set | None = None,
+    ):
         super().__init__()
         self.goals_by_team = goals_by_team
         self.pyramid_ids = set(int(x) for x in pyramid_ids)
         self.attack_range = float(attack_range)
+        if engine not in self.ENGINES:
+            raise ValueError(f"moteur de ciblage inconnu: {engine!r}")
+        self.engine = engine
+        # Index spatial par équipe (seaux de la taille de la portée), reconstruit à chaque frame
+        self.spatial = SpatialHash(self.attack_range)
+        # Morts vues à la construction de l'index de la frame (None : index à reconstruire)
+        self._index_dead = None
+        # Listes triées par X : cibles par (équipe, lane), cibles par (équipe, seau Y), unités par (équipe, lane)
+        self.by_lane = SortedXIndex()
+        self.by_y = SortedXIndex()
+        self.units_by_lane = SortedXIndex()
+
+        # Réévaluation étalée : chaque unité est rebalayée toutes les reeval_frames frames
+        # (1 = à chaque frame, sans hystérésis)
+        self.reeval_frames = max(1, int(reeval_frames))
+        self._frame = 0
+        # Lane de chaque unité à sa dernière évaluation
+        self._eval_lane: dict = {}
+        # Flux de morts : victimes du dernier flush (sinon balayage des Health)
+        self.damage = damage
+        # Unités prêtes de CombatSystem : on y ajoute celles dont la cible change
+        self.ready = ready
+        # Télémétrie : unités balayées à la dernière frame / unités vivantes
+        self.scanned = 0
+        self.units = 0
 
     # Retourne l'index de lane d'une entité (-1 si pas de lane)
     def _get_lane_index(self, ent: int) -> int:
@@ -53,104 +120,408 @@ class TargetingSystem(esper.Processor):
             return True
         
         path = esper.component_for_entity(ent, Path)
-        nodes = getattr(path, "noeuds", [])
+        n_nodes = path.length()
         
-        if not nodes:
+        if n_nodes == 0:
             return True
         
         if esper.has_component(ent, PathProgress):
             prog = esper.component_for_entity(ent, PathProgress)
-            if prog.index >= len(nodes) - 1:
+            if prog.index >= n_nodes - 1:
                 return True
         
         return False
 
-    # Assigne les cibles aux unités selon leur lane et la proximité
-    def process(self, dt: float):
-        # Collecter toutes les cibles potentielles avec leur lane
-        candidates = []
+    # Vérifie la règle de lane : même Lane.index, ou convergence en Y
+    def _same_lane(self, my_lane: int, enemy_lane: int, ay: float, by: float) -> bool:
+        # LOGIQUE DE CIBLAGE :
+        # 1. Même Lane.index → combat
+        # 2. Lanes différentes MAIS convergence physique (même Y) → combat
+        #    (ex: près des pyramides)
+        # 3. Une ou les deux sans lane assignée → proximité Y uniquement
+        if my_lane >= 0 and enemy_lane >= 0 and my_lane == enemy_lane:
+            return True
+        return abs(ay - by) <= self.CONVERGENCE_TOLERANCE
+
+    # Construit l'index spatial de la frame (cibles vivantes, par équipe)
+    def _build_index(self, lanes: dict) -> set:
+        """Remplit self.spatial et retourne les entités mortes."""
+        self.spatial.clear()
+        dead = set()
+        order = 0
         for eid, (t, team, hp) in esper.get_components(Transform, Team, Health):
             if hp.is_dead:
+                dead.add(eid)
                 continue
             is_pyramid = (eid in self.pyramid_ids)
-            lane_idx = self._get_lane_index(eid) if not is_pyramid else -1
-            candidates.append((eid, t, team, is_pyramid, lane_idx))
+            lane_idx = lanes.get(eid, -1) if not is_pyramid else -1
+            bx, by = t.pos
+            # order : rang dans le parcours (départage des égalités comme l'ancien balayage)
+            self.spatial.insert((order, eid, bx, by, is_pyramid, lane_idx), bx, by, team.id)
+            order += 1
+        return dead
+
+    # Index spatial de la frame, construit au premier appel (partagé avec PyramidDefenseSystem)
+    def frame_index(self, lanes: dict | None = None) -> SpatialHash:
+        if self._index_dead is None:
+            if lanes is None:
+                lanes = {eid: lane.index for eid, lane in esper.get_component(Lane)}
+            self._index_dead = self._build_index(lanes)
+        return self.spatial
+
+    # Meilleures cibles (unité, pyramide) de chaque unité via le hachage spatial
+    def _choose_hash(self, lanes: dict, only=None):
+        self.frame_index(lanes)
+        dead = self._index_dead
+        attack_range = self.attack_range
+        team_keys = list(self.spatial.keys())
 
-        # Pour chaque unité
         for eid, (t, team, stats) in esper.get_components(Transform, Team, UnitStats):
-            if esper.has_component(eid, Health):
-                if esper.component_for_entity(eid, Health).is_dead:
+            if eid in dead or (only is not None and eid not in only):
+                continue
+
+            ax, ay = t.pos
+            my_lane = lanes.get(eid, -1)
+
+            best_unit = None
+            best_pyramid = None
+
+            # Seules les équipes adverses, et seulement les 3x3 seaux autour de l'unité
+            for key in team_keys:
+                if key == team.id:
                     continue
+                for order, cid, bx, by, is_pyramid, enemy_lane in self.spatial.neighbours(ax, ay, key):
+                    d = math.hypot(bx - ax, by - ay)
+                    if d > attack_range:
+                        continue
+
+                    if is_pyramid:
+                        if best_pyramid is None or (d, order) < best_pyramid:
+                            best_pyramid = (d, order, cid)
+                    elif self._same_lane(my_lane, enemy_lane, ay, by):
+                        if best_unit is None or (d, order) < best_unit:
+                            best_unit = (d, order, cid)
 
+            yield eid, best_unit, best_pyramid
+
+    # Meilleures cibles (unité, pyramide) de chaque unité via les listes triées par X
+    def _choose_sweep(self, lanes: dict, only=None):
+        attack_range = self.attack_range
+        tol = self.CONVERGENCE_TOLERANCE
+        by_lane, by_y, units_by_lane = self.by_lane, self.by_y, self.units_by_lane
+
+        # Cibles vivantes : pyramides à part, troupes par lane et par seau de Y
+        by_lane.begin()
+        by_y.begin()
+        pyramids = []
+        teams = set()
+        lane_keys = set()
+        dead = set()
+        order = 0
+        for eid, (t, team, hp) in esper.get_components(Transform, Team, Health):
+            if hp.is_dead:
+                dead.add(eid)
+                continue
+            bx, by = t.pos
+            is_pyramid = (eid in self.pyramid_ids)
+            lane_idx = lanes.get(eid, -1) if not is_pyramid else -1
+            rec = (order, eid, bx, by, is_pyramid, lane_idx)
+            teams.add(team.id)
+            if is_pyramid:
+                pyramids.append((team.id, rec))
+            else:
+                if lane_idx >= 0:
+                    by_lane.add((team.id, lane_idx), eid, bx, rec)
+                by_y.add((team.id, math.floor(by / tol), lane_idx), eid, bx, rec)
+                lane_keys.add(lane_idx)
+            order += 1
+        by_lane.finish()
+        by_y.finish()
+
+        # Unités qui cherchent une cible (celles sur une lane aussi triées par X)
+        units_by_lane.begin()
+        units = []
+        for eid, (t, team, stats) in esper.get_components(Transform, Team, UnitStats):
+            if eid in dead or (only is not None and eid not in only):
+                continue
             ax, ay = t.pos
-            my_lane = self._get_lane_index(eid)
-            
-            best_unit_id = None
-            best_unit_dist = 999999.0
-            
-            best_pyramid_id = None
-            best_pyramid_dist = 999999.0
-
-            for cid, ct, cteam, is_pyramid, enemy_lane in candidates:
-                if cid == eid:
+            my_lane = lanes.get(eid, -1)
+            units.append((eid, ax, ay, team.id, my_lane))
+            if my_lane >= 0:
+                units_by_lane.add((team.id, my_lane), eid, ax, (eid, ax, ay))
+        units_by_lane.finish()
+
+        # 1) Même lane : balayage à deux pointeurs (unités et ennemis triés par X)
+        best_units = {}
+        for (tid, lane), queriers in units_by_lane.items.items():
+            for etid in teams:
+                if etid == tid:
                     continue
-                if cteam.id == team.id:
+                exs = by_lane.xs.get((etid, lane))
+                if not exs:
                     continue
+                enemies = by_lane.items[(etid, lane)]
+                n = len(exs)
+                lo = 0
+                for eid, ax, ay in queriers:
+                    while lo < n and exs[lo] < ax - attack_range:
+                        lo += 1
+                    best = best_units.get(eid)
+                    i = lo
+                    while i < n and exs[i] <= ax + attack_range:
+                        order, cid, bx, by, _, _ = enemies[i]
+                        d = math.hypot(bx - ax, by - ay)
+                        if d <= attack_range and (best is None or (d, order) < best):
+                            best = (d, order, cid)
+                        i += 1
+                    if best is not None:
+                        best_units[eid] = best
+
+        for eid, ax, ay, tid, my_lane in units:
+            # 2) Convergence (autres lanes) : seaux de Y voisins, fenêtre en X
+            best_unit = best_units.get(eid)
+            cy = math.floor(ay / tol)
+            for etid in teams:
+                if etid == tid:
+                    continue
+                for lane in lane_keys:
+                    # Même lane : déjà vue par le balayage
+                    if my_lane >= 0 and lane == my_lane:
+                        continue
+                    for yb in (cy - 1, cy, cy + 1):
+                        for order, cid, bx, by, _, _ in by_y.window((etid, yb, lane), ax - attack_range, ax + attack_range):
+                            if abs(ay - by) > tol:
+                                continue
+                            d = math.hypot(bx - ax, by - ay)
+                            if d <= attack_range and (best_unit is None or (d, order) < best_unit):
+                                best_unit = (d, order, cid)
 
-                bx, by = ct.pos
+            # 3) Pyramides adverses à portée
+            best_pyramid = None
+            for ptid, (order, cid, bx, by, _, _) in pyramids:
+                if ptid == tid:
+                    continue
                 d = math.hypot(bx - ax, by - ay)
+                if d <= attack_range and (best_pyramid is None or (d, order) < best_pyramid):
+                    best_pyramid = (d, order, cid)
+
+            yield eid, best_unit, best_pyramid
+
+    # Unités arrivées (fin de chemin), lues une fois pour toutes les unités
+    def _arrived_flags(self, eids: list) -> np.ndarray:
+        paths = dict(esper.get_component(Path))
+        progs = dict(esper.get_component(PathProgress))
+        flags = np.ones(len(eids), dtype=bool)
+        for i, eid in enumerate(eids):
+            path = paths.get(eid)
+            if path is None:
+                continue
+            n_nodes = path.length()
+            prog = progs.get(eid)
+            flags[i] = n_nodes == 0 or (prog is not None and prog.index >= n_nodes - 1)
+        return flags
 
-                if d > self.attack_range:
+    # Moteur vectorisé : toutes les unités en une fois (matrices unités x cibles)
+    def _process_numpy(self, lanes: dict, only=None):
+        # Cibles vivantes, dans l'ordre du parcours (argmin -> premier à égalité)
+        c_eid, c_x, c_y, c_team, c_lane, c_pyr = [], [], [], [], [], []
+        dead = set()
+        for eid, (t, team, hp) in esper.get_components(Transform, Team, Health):
+            if hp.is_dead:
+                dead.add(eid)
+                continue
+            is_pyramid = (eid in self.pyramid_ids)
+            c_eid.append(eid)
+            c_x.append(t.pos[0])
+            c_y.append(t.pos[1])
+            c_team.append(team.id)
+            c_lane.append(lanes.get(eid, -1) if not is_pyramid else -1)
+            c_pyr.append(is_pyramid)
+
+        u_eid, u_x, u_y, u_team, u_lane = [], [], [], [], []
+        for eid, (t, team, stats) in esper.get_components(Transform, Team, UnitStats):
+            if eid in dead or (only is not None and eid not in only):
+                continue
+            u_eid.append(eid)
+            u_x.append(t.pos[0])
+            u_y.append(t.pos[1])
+            u_team.append(team.id)
+            u_lane.append(lanes.get(eid, -1))
+        self.scanned = len(u_eid)
+        if not u_eid:
+            return
+
+        n_units = len(u_eid)
+        best_unit = np.full(n_units, -1, dtype=np.int64)
+        best_pyramid = np.full(n_units, -1, dtype=np.int64)
+        if c_eid:
+            ux = np.array(u_x, dtype=float)[:, None]
+            uy = np.array(u_y, dtype=float)[:, None]
+            ul = np.array(u_lane, dtype=np.int64)[:, None]
+            cy = np.array(c_y, dtype=float)[None, :]
+            cl = np.array(c_lane, dtype=np.int64)[None, :]
+            pyr = np.array(c_pyr, dtype=bool)[None, :]
+
+            d2 = (np.array(c_x, dtype=float)[None, :] - ux) ** 2 + (cy - uy) ** 2
+            # Adversaires à portée
+            ok = (np.array(u_team)[:, None] != np.array(c_team)[None, :]) & (d2 <= self.attack_range ** 2)
+            # Même lane, ou convergence en Y (toutes lanes, ou sans lane)
+            lane_ok = ((ul >= 0) & (ul == cl)) | (np.abs(uy - cy) <= self.CONVERGENCE_TOLERANCE)
+
+            rows = np.arange(n_units)
+            for mask, out in ((ok & ~pyr & lane_ok, best_unit), (ok & pyr, best_pyramid)):
+                dist = np.where(mask, d2, np.inf)
+                col = dist.argmin(axis=1)
+                hit = np.isfinite(dist[rows, col])
+                out[hit] = col[hit]
+
+        # Pyramide seulement si arrivé (et aucune troupe à portée)
+        use_pyramid = (best_unit < 0) & (best_pyramid >= 0)
+        if use_pyramid.any():
+            use_pyramid[use_pyramid] = self._arrived_flags([u_eid[i] for i in np.flatnonzero(use_pyramid)])
+
+        # Écriture des cibles en une passe
+        targets = dict(esper.get_component(Target))
+        for i, eid in enumerate(u_eid):
+            if best_unit[i] >= 0:
+                self._write_target(eid, targets.get(eid), c_eid[best_unit[i]], "unit")
+            elif use_pyramid[i]:
+                self._write_target(eid, targets.get(eid), c_eid[best_pyramid[i]], "pyramid")
+            elif eid in targets:
+                esper.remove_component(eid, Target)
+
+    # Écrit la cible (composant Target déjà lu, ou None)
+    def _write_target(self, eid: int, tg, target_id: int, target_type: str):
+        if tg is None:
+            esper.add_component(eid, Target(entity_id=int(target_id), type=target_type))
+        elif tg.entity_id != int(target_id):
+            tg.entity_id = int(target_id)
+            tg.type = target_type
+        else:
+            tg.type = target_type
+            return
+        # Cible posée ou changée : CombatSystem doit relire l'unité
+        if self.ready is not None:
+            self.ready.add(eid)
+
+    # Entités mortes : victimes du dernier flush, sinon Health à 0
+    def _dead_ids(self) -> set:
+        if self.damage is not None:
+            return self.damage.victims
+        return {eid for eid, hp in esper.get_component(Health) if hp.is_dead}
+
+    # Unités à réévaluer cette frame (les autres gardent leur cible)
+    def _select_units(self, lanes: dict) -> set:
+        """
+        Hystérésis : une cible troupe encore vivante, à portée et sur la bonne lane
+        est gardée sans balayage. Réévaluation immédiate si la cible est morte ou
+        hors de portée, ou si l'unité a changé de lane ; sinon (pas de cible,
+        cible pyramide) une fois toutes les reeval_frames frames, les unités
+        étant réparties sur les frames.
+        """
+        self._frame += 1
+        attack_range = self.attack_range
+        transforms = dict(esper.get_component(Transform))
+        dead = self._dead_ids()
+        targets = dict(esper.get_component(Target))
+
+        only = set()
+        units = 0
+        eval_lane = {}
+        for eid, (t, team, stats) in esper.get_components(Transform, Team, UnitStats):
+            if eid in dead:
+                continue
+            units += 1
+            my_lane = lanes.get(eid, -1)
+            prev_lane = self._eval_lane.get(eid)
+            eval_lane[eid] = prev_lane
+
+            # Jamais évaluée, ou changement de lane
+            if prev_lane is None or prev_lane != my_lane:
+                only.add(eid)
+                continue
+
+            tg = targets.get(eid)
+            if tg is not None:
+                tid = int(tg.entity_id)
+                tt = transforms.get(tid)
+                ok = tt is not None and tid not in dead
+                if ok:
+                    ax, ay = t.pos
+                    bx, by = tt.pos
+                    ok = math.hypot(bx - ax, by - ay) <= attack_range
+                    if ok and tg.type == "unit":
+                        # Cible troupe toujours valide : on la garde
+                        if self._same_lane(my_lane, lanes.get(tid, -1), ay, by):
+                            continue
+                        ok = False
+                if not ok:
+                    # Cible morte ou hors de portée : réévaluation immédiate
+                    only.add(eid)
                     continue
 
-                if is_pyramid:
-                    if d < best_pyramid_dist:
-                        best_pyramid_dist = d
-                        best_pyramid_id = cid
-                else:
-                    # LOGIQUE DE CIBLAGE :
-                    # 1. Même Lane.index → combat
-                    # 2. Lanes différentes MAIS convergence physique (même Y) → combat
-                    same_lane = False
-                    
-                    if my_lane >= 0 and enemy_lane >= 0:
-                        # Les deux ont une lane assignée
-                        if my_lane == enemy_lane:
-                            # Même lane → combat OK
-                            same_lane = True
-                        elif abs(ay - by) <= self.CONVERGENCE_TOLERANCE:
-                            # Lanes différentes MAIS physiquement au même endroit
-                            # = les chemins convergent (ex: près des pyramides)
-                            same_lane = True
-                    elif my_lane < 0 or enemy_lane < 0:
-                        # Une ou les deux n'ont pas de lane assignée
-                        # Utiliser uniquement la proximité Y
-                        if abs(ay - by) <= self.CONVERGENCE_TOLERANCE:
-                            same_lane = True
-                    
-                    if not same_lane:
-                        continue
-                    
-                    if d < best_unit_dist:
-                        best_unit_dist = d
-                        best_unit_id = cid
+            # Créneau de l'unité dans le cycle
+            if (eid + self._frame) % self.reeval_frames == 0:
+                only.add(eid)
+
+        for eid in only:
+            eval_lane[eid] = lanes.get(eid, -1)
+        self._eval_lane = eval_lane
+        self.units = units
+        return only
+
+    # Assigne les cibles aux unités selon leur lane et la proximité
+    def process(self, dt: float):
+        # Lanes lues une seule fois (au lieu de has_component dans la boucle)
+        lanes = {eid: lane.index for eid, lane in esper.get_component(Lane)}
+        only = self._select_units(lanes) if self.reeval_frames > 1 else None
 
+        if self.engine == "numpy":
+            self._process_numpy(lanes, only)
+            if only is None:
+                self.units = self.scanned
+            self._index_dead = None
+            return
+        if self.engine == "sweep":
+            choices = self._choose_sweep(lanes, only)
+        else:
+            choices = self._choose_hash(lanes, only)
+
+        scanned = 0
+        for eid, best_unit, best_pyramid in choices:
+            scanned += 1
             # Décision de ciblage - MÊME LOGIQUE POUR TOUTES LES UNITÉS
             # Priorité aux troupes ennemies, puis pyramide si arrivé
-            if best_unit_id is not None:
-                self._set_target(eid, best_unit_id, "unit")
-            elif best_pyramid_id is not None and self._is_arrived(eid):
-                self._set_target(eid, best_pyramid_id, "pyramid")
+            if best_unit is not None:
+                self._set_target(eid, best_unit[2], "unit")
+            elif best_pyramid is not None and self._is_arrived(eid):
+                self._set_target(eid, best_pyramid[2], "pyramid")
             else:
                 if esper.has_component(eid, Target):
                     esper.remove_component(eid, Target)
+        self.scanned = scanned
+        if only is None:
+            self.units = scanned
+        # Les unités vont bouger : index à reconstruire à la prochaine frame
+        self._index_dead = None
+
+    # Compteurs (télémétrie)
+    def stats(self) -> dict:
+        return {
+            "engine": self.engine,
+            "reeval_frames": self.reeval_frames,
+            "scanned": self.scanned,
+            "units": self.units,
+        }
+
+    # Ligne de debug pour le HUD
+    def hud_line(self) -> str:
+        return (
+            f"Ciblage: {self.engine} | {self.scanned}/{self.units} unités évaluées "
+            f"(cycle {self.reeval_frames}f)"
+        )
 
     # Assigne ou met à jour la cible d'une unité
     def _set_target(self, eid: int, target_id: int, target_type: str):
         """Assigne ou met à jour la cible d'une unité."""
-        if esper.has_component(eid, Target):
-            tg = esper.component_for_entity(eid, Target)
-            tg.entity_id = int(target_id)
-            tg.type = target_type
-        else:
-            esper.add_component(eid, Target(entity_id=int(target_id), type=target_type))
\ No newline at end of file
+        self._write_target(eid, esper.try_component(eid, Target), target_id, target_type)
\ No newline at end of file
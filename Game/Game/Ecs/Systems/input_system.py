@@ -77,20 +77,8 @@ class InputSystem(esper.Processor):
 
     # Trouve une case marchable proche d'une position donnée
     def _find_walkable_near(self, x: int, y: int, max_r: int = 8):
-        for r in range(0, max_r + 1):
-            for dy in range(-r, r + 1):
-                for dx in range(-r, r + 1):
-                    nx = x + dx
-                    ny = y + dy
-
-                    if hasattr(self.nav_grid, "is_walkable"):
-                        if self.nav_grid.is_walkable(nx, ny):
-                            return nx, ny
-                    else:
-                        if 0 <= nx < self.nav_grid.width and 0 <= ny < self.nav_grid.height:
-                            if self.nav_grid.walkable[ny][nx]:
-                                return nx, ny
-        return None
+        # Carte précalculée de la NavigationGrid (une lecture de tableau)
+        return self.nav_grid.nearest_walkable(int(x), int(y), max_r=max_r)
 
     # Convertit la valeur de vitesse SAÉ en vitesse de déplacement
     def _v_to_move_speed(self, v_value: float) -> float:
@@ -9,6 +9,7 @@ from Game.Ecs.Components.wallet import Wallet
 from Game.Ecs.Components.unitStats import UnitStats
 from Game.Ecs.Components.speed import Speed
 from Game.Ecs.Components.pyramidLevel import PyramidLevel
+from Game.Ecs.Components.attack_cooldown import AttackCooldown
 
 
 class EntityFactory:
@@ -122,6 +123,7 @@ class EntityFactory:
         hp_max = b + 1
 
         move_speed = self._v_to_move_speed(stats.speed)
+        hit_cooldown = float(self._get("combat", "hit_cooldown", default=0.6))
 
         return self.world.create_entity(
             GridPosition(gx, gy),
@@ -130,4 +132,5 @@ class EntityFactory:
             Health(hp_max=int(hp_max), hp=int(hp_max)),
             UnitStats(speed=float(stats.speed), power=float(stats.power), armor=float(stats.armor), cost=float(stats.cost)),
             Speed(base=float(move_speed), mult_terrain=1.0),
+            AttackCooldown(cooldown=hit_cooldown, timer=0.0),
         )
\ No newline at end of file
@@ -2,6 +2,7 @@
 import pytmx
 from .GridTile import GridTile
 from .NavigationGrid import NavigationGrid
+from .tile_index import TileIndex, build_tile_index
 
 
 class GridMap:
@@ -17,8 +18,24 @@ class GridMap:
 
         self.tiles = []
         self.tile_by_pos = {}
+        # Index dense pour l'A* (construit à la demande, invalidé si une tuile change)
+        self._tile_index = None
         self.load_tiles()
 
+    # Construit une carte depuis des tuiles déjà créées (génération, benchmarks)
+    @classmethod
+    def from_tiles(cls, tiles, width: int, height: int, tilewidth: int = 32, tileheight: int = 32) -> "GridMap":
+        gm = cls.__new__(cls)
+        gm.tmx_data = None
+        gm.tilewidth = int(tilewidth)
+        gm.tileheight = int(tileheight)
+        gm.width = int(width)
+        gm.height = int(height)
+        gm.tiles = list(tiles)
+        gm.tile_by_pos = {(t.x, t.y): t for t in gm.tiles}
+        gm._tile_index = None
+        return gm
+
     # Détermine le type de terrain depuis les propriétés Tiled
     def _terrain_type_from_props(self, props: dict) -> str:
         """
@@ -76,10 +93,30 @@ class GridMap:
                         self.tiles.append(tile)
                         self.tile_by_pos[(x, y)] = tile
 
+        self.invalidate_tile_index()
+
     # Retourne la tuile à une position donnée
     def get_tile(self, x: int, y: int):
         return self.tile_by_pos.get((x, y))
 
+    # Change le terrain d'une tuile existante (et invalide l'index A*)
+    def set_terrain(self, x: int, y: int, terrain_type: str):
+        tile = self.get_tile(x, y)
+        if tile is None:
+            return
+        tile.set_terrain(terrain_type)
+        self.invalidate_tile_index()
+
+    # Oublie l'index dense (à appeler après toute modification directe d'une tuile)
+    def invalidate_tile_index(self):
+        self._tile_index = None
+
+    # Index dense walkable / coût, reconstruit seulement après une invalidation
+    def tile_index(self) -> TileIndex:
+        if self._tile_index is None:
+            self._tile_index = build_tile_index(self.tiles, self.width, self.height)
+        return self._tile_index
+
     # Convertit la carte en grille de navigation pour A*
     def to_navigation_grid(self) -> NavigationGrid:
         """
@@ -19,6 +19,12 @@ class GridTile:
         self.speed = GridTile.VITESSE_MAX
         self._apply_terrain_rules()
 
+    # Change le type de terrain et réapplique les règles
+    def set_terrain(self, terrain_type: str):
+        """Passer par GridMap.set_terrain pour invalider l'index de la carte."""
+        self.terrain_type = terrain_type.lower().strip()
+        self._apply_terrain_rules()
+
     # Applique les règles de vitesse et traversabilité selon le type de terrain
     def _apply_terrain_rules(self):
         """Applique les vitesses et la traversabilité selon le type."""
@@ -1,17 +1,37 @@
-from typing import List, Optional
+import itertools
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .connectivity import ConnectivityIndex
+from .nearest_walkable import NearestWalkableMap
+
+# Compteur global : deux grilles (ou deux matchs) n'ont jamais la même version
+_VERSIONS = itertools.count(1)
 
 
 class NavigationGrid:
     """
     Grille de navigation pour A*.
 
-    Chaque case a :
-      - walkable : traversable ou non
-      - mult : multiplicateur de vitesse (1.0 normal, 0.5 lent, 0 bloqué)
+    Stockage contigu (tableaux NumPy, indexés [y, x]) :
+      - walkable : uint8, 1 traversable / 0 bloqué
+      - mult : float32, multiplicateur de vitesse (1.0 normal, 0.5 lent, 0 bloqué)
+      - cost : float32, coût précalculé pour entrer dans la case (1 / mult, inf si bloqué)
 
     A* utilise :
       - is_walkable(x,y)
       - movement_cost(x,y)
+
+    Les écritures passent par set_cell ou les opérations de masse
+    (fill_rect, set_mask, restore) pour garder `cost` synchronisé.
+    Chacune incrémente `version` : les caches (chemins, flow fields)
+    comparent cette valeur pour détecter une grille modifiée.
+
+    connectivity(diagonal) donne les composantes connexes des cases
+    franchissables (mises à jour à la première requête après une écriture).
+    nearest_walkable(x, y) lit une carte précalculée de la case walkable la
+    plus proche (recalculée si `walkable` a changé).
     """
 
     # Initialise une grille de navigation avec dimensions et valeurs par défaut
@@ -19,14 +39,25 @@ class NavigationGrid:
         self.width = int(width)
         self.height = int(height)
 
-        self.walkable: List[List[bool]] = [
-            [bool(default_walkable) for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
-        self.mult: List[List[float]] = [
-            [float(default_mult) for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
+        shape = (self.height, self.width)
+        self.walkable = np.full(shape, 1 if default_walkable else 0, dtype=np.uint8)
+        self.mult = np.full(shape, float(default_mult), dtype=np.float32)
+        self.cost = np.empty(shape, dtype=np.float32)
+        self._refresh_cost()
+        self.version = next(_VERSIONS)
+
+        # Composantes connexes par voisinage : diagonal -> (version, index)
+        self._connectivity = {}
+        # Case walkable la plus proche : (version, NearestWalkableMap)
+        self._nearest = None
+
+    # Recalcule le coût de déplacement (toute la grille ou une sous-zone)
+    def _refresh_cost(self, region=None):
+        if region is None:
+            region = (slice(None), slice(None))
+        m = self.mult[region]
+        with np.errstate(divide="ignore"):
+            self.cost[region] = np.where(m > 0.0, 1.0 / m, np.inf)
 
     # Vérifie si une position est dans les limites de la grille
     def in_bounds(self, x: int, y: int) -> bool:
@@ -36,16 +67,19 @@ class NavigationGrid:
     def set_cell(self, x: int, y: int, *, walkable: Optional[bool] = None, mult: Optional[float] = None):
         if not self.in_bounds(x, y):
             return
+        self.version = next(_VERSIONS)
         if walkable is not None:
-            self.walkable[y][x] = bool(walkable)
+            self.walkable[y, x] = 1 if walkable else 0
         if mult is not None:
-            self.mult[y][x] = float(mult)
+            m = float(mult)
+            self.mult[y, x] = m
+            self.cost[y, x] = 1.0 / self.mult[y, x] if m > 0.0 else np.inf
 
     # Retourne si une case est traversable
     def is_walkable(self, x: int, y: int) -> bool:
         if not self.in_bounds(x, y):
             return False
-        return self.walkable[y][x]
+        return self.walkable.item(y, x) != 0
 
     # Retourne le coût de déplacement pour entrer dans une case
     def movement_cost(self, x: int, y: int) -> float:
@@ -56,7 +90,88 @@ class NavigationGrid:
         """
         if not self.in_bounds(x, y):
             return float("inf")
-        m = float(self.mult[y][x])
-        if m <= 0:
-            return float("inf")
-        return 1.0 / m
\ No newline at end of file
+        return self.cost.item(y, x)
+
+    # ----------------------------
+    # Opérations de masse
+    # ----------------------------
+    # Remplit un rectangle (clippé aux bords de la grille)
+    def fill_rect(self, x0: int, y0: int, w: int, h: int, *, walkable: Optional[bool] = None, mult: Optional[float] = None):
+        """Applique walkable/mult à toutes les cases de [x0, x0+w) x [y0, y0+h)."""
+        xa = max(0, int(x0))
+        ya = max(0, int(y0))
+        xb = min(self.width, int(x0) + int(w))
+        yb = min(self.height, int(y0) + int(h))
+        if xa >= xb or ya >= yb:
+            return
+
+        region = (slice(ya, yb), slice(xa, xb))
+        self.version = next(_VERSIONS)
+        if walkable is not None:
+            self.walkable[region] = 1 if walkable else 0
+        if mult is not None:
+            self.mult[region] = float(mult)
+            self._refresh_cost(region)
+
+    # Applique walkable/mult à toutes les cases d'un masque booléen (h, w)
+    def set_mask(self, mask, *, walkable: Optional[bool] = None, mult: Optional[float] = None):
+        """
+        Exemple (tempête de sable) : on calcule les masques AVANT d'écrire,
+        puis on échange open <-> dusty en deux appels.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        self.version = next(_VERSIONS)
+        if walkable is not None:
+            self.walkable[mask] = 1 if walkable else 0
+        if mult is not None:
+            self.mult[mask] = float(mult)
+            self._refresh_cost()
+
+    # Retourne une copie de l'état de la grille (pour restauration)
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.walkable.copy(), self.mult.copy()
+
+    # Restaure un état précédemment capturé par snapshot()
+    def restore(self, snap: Tuple[np.ndarray, np.ndarray]):
+        walkable, mult = snap
+        np.copyto(self.walkable, walkable)
+        np.copyto(self.mult, mult)
+        self._refresh_cost()
+        self.version = next(_VERSIONS)
+
+    # Cases franchissables pour A* (walkable et coût fini)
+    def passable_mask(self) -> np.ndarray:
+        return (self.walkable != 0) & np.isfinite(self.cost)
+
+    # Composantes connexes des cases franchissables (voisinage 4 ou 8)
+    def connectivity(self, diagonal: bool = False) -> ConnectivityIndex:
+        diagonal = bool(diagonal)
+        entry = self._connectivity.get(diagonal)
+        if entry is None:
+            index = ConnectivityIndex(self.passable_mask(), diagonal=diagonal)
+        else:
+            version, index = entry
+            if version == self.version:
+                return index
+            # Seules les cases dont la franchissabilité a changé sont retraitées
+            index.update(self.passable_mask())
+        self._connectivity[diagonal] = (self.version, index)
+        return index
+
+    # Case walkable la plus proche de (x, y) à distance de Chebyshev <= max_r
+    def nearest_walkable(self, x: int, y: int, max_r: int = 10) -> Optional[Tuple[int, int]]:
+        if self._nearest is None or self._nearest[0] != self.version:
+            nearest = self._nearest[1] if self._nearest is not None else None
+            mask = self.walkable != 0
+            # Écriture sans changement de walkable (ex : tempête) : carte conservée
+            if nearest is None or not np.array_equal(nearest.mask, mask):
+                nearest = NearestWalkableMap(mask)
+            self._nearest = (self.version, nearest)
+        return self._nearest[1].lookup(x, y, max_r)
+
+    # Masques de zones SAÉ : (interdit, dusty, open)
+    def zone_masks(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        forbidden = (self.walkable == 0) | (self.mult <= 0.0)
+        dusty = ~forbidden & (self.mult < 0.99)
+        open_ = ~forbidden & ~dusty
+        return forbidden, dusty, open_
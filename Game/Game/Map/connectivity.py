@@ -0,0 +1,205 @@
+# Game/Map/connectivity.py
+"""
+Composantes connexes d'une grille de cases franchissables.
+
+Sert à rejeter en O(1) une requête A* dont l'objectif est hors de la
+composante du départ (case enfermée par des zones interdites), au lieu
+d'explorer toute la zone atteignable avant d'échouer.
+
+  - labels à plat sur une grille élargie d'une bordure (0 = bloqué)
+  - union-find sur les labels : une case ouverte fusionne ses voisines
+  - une case fermée peut couper sa composante : on ré-étiquette par
+    remplissage depuis ses voisines (coût = taille des morceaux touchés)
+  - trop de changements d'un coup : ré-étiquetage complet
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+Point = Tuple[int, int]
+
+_AXIAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class ConnectivityIndex:
+    """Étiquetage des composantes d'un masque (h, w) de cases franchissables."""
+
+    # Étiquette le masque initial ; diagonal=True => voisinage 8
+    def __init__(self, mask, *, diagonal: bool = False, full_ratio: float = 0.25):
+        mask = np.asarray(mask, dtype=bool)
+        h, w = mask.shape
+        self.width = int(w)
+        self.height = int(h)
+        self.stride = self.width + 2
+        self.diagonal = bool(diagonal)
+        # Au-delà de full_ratio * cases modifiées : ré-étiquetage complet
+        self.full_ratio = float(full_ratio)
+
+        W = self.stride
+        steps = _AXIAL + _DIAGONAL if self.diagonal else _AXIAL
+        self._offsets = tuple(dx + dy * W for dx, dy in steps)
+
+        self._mask = mask.copy()
+        self._open: List[bool] = []
+        self._labels: List[int] = []
+        self._parent: List[int] = [0]
+
+        # Statistiques
+        self.full_relabels = 0
+        self.updates = 0
+        self._relabel_all()
+
+    # Indice plat d'une case (x, y)
+    def _index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    # Nouveau label (racine de son propre ensemble)
+    def _new_label(self) -> int:
+        self._parent.append(len(self._parent))
+        return len(self._parent) - 1
+
+    # Racine d'un label (avec compression de chemin)
+    def _find(self, label: int) -> int:
+        parent = self._parent
+        root = label
+        while parent[root] != root:
+            root = parent[root]
+        while parent[label] != root:
+            parent[label], label = root, parent[label]
+        return root
+
+    # Remplit la composante de `seed` avec le label donné
+    def _flood(self, seed: int, label: int):
+        is_open, labels, offsets = self._open, self._labels, self._offsets
+        labels[seed] = label
+        stack = [seed]
+        while stack:
+            cur = stack.pop()
+            for off in offsets:
+                nb = cur + off
+                if is_open[nb] and labels[nb] != label:
+                    labels[nb] = label
+                    stack.append(nb)
+
+    # Ré-étiquette toute la grille depuis self._mask
+    def _relabel_all(self):
+        padded = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+        padded[1:-1, 1:-1] = self._mask
+        self._open = padded.ravel().tolist()
+        self._labels = [0] * len(self._open)
+        self._parent = [0]
+        self.full_relabels += 1
+
+        is_open, labels = self._open, self._labels
+        for i, o in enumerate(is_open):
+            if o and labels[i] == 0:
+                self._flood(i, self._new_label())
+
+    # Applique un nouveau masque (seules les cases modifiées sont traitées)
+    def update(self, mask):
+        mask = np.asarray(mask, dtype=bool)
+        changed = np.argwhere(mask != self._mask)
+        if len(changed) == 0:
+            return
+        self.updates += 1
+        np.copyto(self._mask, mask)
+
+        cells = self.width * self.height
+        # Trop de changements, ou table des labels trop grande : on repart de zéro
+        if len(changed) > self.full_ratio * cells or len(self._parent) > 4 * cells + 64:
+            self._relabel_all()
+            return
+
+        is_open, labels, offsets = self._open, self._labels, self._offsets
+        opened = []
+        seeds = []
+        for y, x in changed.tolist():
+            i = self._index(x, y)
+            if mask[y, x]:
+                is_open[i] = True
+                opened.append(i)
+            else:
+                is_open[i] = False
+                labels[i] = 0
+                seeds.extend(i + off for off in offsets)
+
+        # Cases fermées : la composante a pu se couper => remplissage depuis les voisines
+        first_new = len(self._parent)
+        for i in seeds:
+            if is_open[i] and labels[i] < first_new:
+                self._flood(i, self._new_label())
+
+        # Cases ouvertes (non atteintes par un remplissage) : fusion avec les voisines
+        for i in opened:
+            if labels[i] >= first_new:
+                continue
+            root = 0
+            for off in offsets:
+                nb = i + off
+                if not is_open[nb] or labels[nb] == 0:
+                    continue
+                r = self._find(labels[nb])
+                if root == 0:
+                    root = r
+                elif r != root:
+                    self._parent[r] = root
+            labels[i] = root if root else self._new_label()
+
+    # Identifiant de composante d'une case (0 si bloquée ou hors grille)
+    def component(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return 0
+        label = self._labels[self._index(x, y)]
+        return self._find(label) if label else 0
+
+    # Les deux cases sont-elles franchissables et dans la même composante ?
+    def connected(self, a: Point, b: Point) -> bool:
+        ca = self.component(int(a[0]), int(a[1]))
+        return ca != 0 and ca == self.component(int(b[0]), int(b[1]))
+
+    # Composantes accessibles depuis start (la sienne, ou celles de ses voisines si bloquée)
+    def _start_components(self, start: Point) -> set:
+        sx, sy = int(start[0]), int(start[1])
+        c = self.component(sx, sy)
+        if c:
+            return {c}
+        steps = _AXIAL + _DIAGONAL if self.diagonal else _AXIAL
+        return {c for c in (self.component(sx + dx, sy + dy) for dx, dy in steps) if c}
+
+    # Un A* partant de start peut-il atteindre goal ? (start peut être bloqué)
+    def reachable(self, start: Point, goal: Point) -> bool:
+        if (int(start[0]), int(start[1])) == (int(goal[0]), int(goal[1])):
+            return True
+        cg = self.component(int(goal[0]), int(goal[1]))
+        if cg == 0:
+            return False
+        return cg in self._start_components(start)
+
+    # Case de la composante de start la plus proche de goal (None si aucune)
+    def nearest_reachable(self, goal: Point, start: Point, max_r: Optional[int] = None) -> Optional[Point]:
+        targets = self._start_components(start)
+        if not targets:
+            return None
+        gx, gy = int(goal[0]), int(goal[1])
+        if self.component(gx, gy) in targets:
+            return (gx, gy)
+
+        if max_r is None:
+            max_r = max(self.width, self.height)
+        for r in range(1, int(max_r) + 1):
+            best = None
+            best_d = None
+            # Anneau de Chebyshev r, puis la plus proche en distance euclidienne
+            for dy in range(-r, r + 1):
+                step = 1 if abs(dy) == r else 2 * r
+                for dx in range(-r, r + 1, step):
+                    if self.component(gx + dx, gy + dy) in targets:
+                        d = dx * dx + dy * dy
+                        if best_d is None or d < best_d:
+                            best, best_d = (gx + dx, gy + dy), d
+            if best is not None:
+                return best
+        return None
@@ -0,0 +1,93 @@
+# Game/Map/nearest_walkable.py
+"""
+Case walkable la plus proche, précalculée pour toute la grille.
+
+Remplace les recherches en anneaux (find_walkable_near) qui relisent tout
+le carré (2r+1)^2 à chaque rayon : une transformée de distance de Chebyshev
+(par couches, vectorisée NumPy) donne pour chaque case sa case walkable la
+plus proche, et une requête devient une lecture de tableau.
+
+Même résultat que l'ancien balayage : plus petit rayon de Chebyshev, puis
+ordre de balayage (dy croissant, puis dx croissant).
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+Point = Tuple[int, int]
+
+
+# Décalages de l'anneau de Chebyshev r, dans l'ordre du balayage historique
+def _ring(r: int) -> List[Point]:
+    if r == 0:
+        return [(0, 0)]
+    out = []
+    for dy in range(-r, r + 1):
+        step = 1 if abs(dy) == r else 2 * r
+        for dx in range(-r, r + 1, step):
+            out.append((dx, dy))
+    return out
+
+
+class NearestWalkableMap:
+    """Case walkable la plus proche de chaque case (jusqu'au rayon max_r)."""
+
+    # Calcule la carte depuis un masque walkable (h, w)
+    def __init__(self, walkable, *, max_r: int = 16):
+        mask = np.asarray(walkable, dtype=bool)
+        h, w = mask.shape
+        self.width = int(w)
+        self.height = int(h)
+        self.max_r = int(max_r)
+        self.mask = mask.copy()
+
+        R = self.max_r
+        padded = np.zeros((h + 2 * R, w + 2 * R), dtype=bool)
+        padded[R:R + h, R:R + w] = mask
+        ys, xs = np.indices((h, w))
+
+        nearest = np.full((h, w), -1, dtype=np.int64)
+        dist = np.full((h, w), -1, dtype=np.int64)
+        todo = np.ones((h, w), dtype=bool)
+
+        for r in range(R + 1):
+            if not todo.any():
+                break
+            # Le premier décalage de l'anneau qui touche une case walkable l'emporte
+            for dx, dy in _ring(r):
+                hit = todo & padded[R + dy:R + dy + h, R + dx:R + dx + w]
+                if hit.any():
+                    nearest[hit] = (ys[hit] + dy) * w + xs[hit] + dx
+                    dist[hit] = r
+                    todo &= ~hit
+
+        # Listes Python : lecture scalaire rapide
+        self._nearest: List[int] = nearest.ravel().tolist()
+        self._dist: List[int] = dist.ravel().tolist()
+
+    # Case walkable la plus proche de (x, y) à distance <= max_r (None sinon)
+    def lookup(self, x: int, y: int, max_r: int = 10) -> Optional[Point]:
+        x, y = int(x), int(y)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = y * self.width + x
+            d = self._dist[i]
+            if d >= 0:
+                return divmod(self._nearest[i], self.width)[::-1] if d <= max_r else None
+            if max_r <= self.max_r:
+                return None
+            return self._scan(x, y, self.max_r + 1, max_r)
+        # Hors grille : balayage classique
+        return self._scan(x, y, 0, max_r)
+
+    # Balayage en anneaux (au-delà du rayon précalculé ou hors grille)
+    def _scan(self, x: int, y: int, r0: int, max_r: int) -> Optional[Point]:
+        mask = self.mask
+        for r in range(r0, int(max_r) + 1):
+            for dx, dy in _ring(r):
+                nx = x + dx
+                ny = y + dy
+                if 0 <= nx < self.width and 0 <= ny < self.height and mask[ny, nx]:
+                    return (nx, ny)
+        return None
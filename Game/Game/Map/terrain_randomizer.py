@@ -124,19 +124,10 @@ def apply_random_terrain(
         paint_rect(x0, y0, rw, rh, kind="forbidden")
 
     # 4) Comptage zones
-    open_c = 0
-    dusty_c = 0
-    forb_c = 0
-    for y in range(h):
-        for x in range(w):
-            walk = nav.is_walkable(x, y)
-            m = float(nav.mult[y][x])
-            if (not walk) or m <= 0.0:
-                forb_c += 1
-            elif m < 0.99:
-                dusty_c += 1
-            else:
-                open_c += 1
+    forbidden_mask, dusty_mask, open_mask = nav.zone_masks()
+    open_c = int(open_mask.sum())
+    dusty_c = int(dusty_mask.sum())
+    forb_c = int(forbidden_mask.sum())
 
     # 5) Force au moins 1 case dusty + 1 case forbidden (rare mais possible)
     if dusty_c == 0:
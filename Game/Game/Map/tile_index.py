@@ -0,0 +1,89 @@
+# Game/Map/tile_index.py
+"""
+Index dense des tuiles d'une GridMap pour l'A* "GridMap".
+
+Construit une fois (puis invalidé quand une tuile change) au lieu de refaire,
+à chaque requête, le dict position -> tuile et le scan de la vitesse max.
+Tableaux indexés [y, x] (+ CostGrid prête pour le cœur A*) :
+  - walkable : uint8 (0 si pas de tuile ou tuile non franchissable)
+  - speed : float64 (vitesse de la tuile, 0 si absente)
+  - cost : float64, coût pour entrer dans la case = max_speed / speed
+           (inf si bloquée ou vitesse nulle)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import numpy as np
+
+from Game.Map.connectivity import ConnectivityIndex
+from Game.Utils.astar_core import CostGrid
+
+
+@dataclass
+class TileIndex:
+    """Coûts denses d'une GridMap (lecture seule)."""
+    width: int
+    height: int
+    max_speed: float
+    walkable: np.ndarray
+    speed: np.ndarray
+    cost: np.ndarray
+    # Coûts à plat pour astar_core
+    grid: Optional[CostGrid] = field(repr=False, default=None)
+    # Composantes connexes par voisinage (construites à la demande)
+    components: dict = field(repr=False, default_factory=dict)
+
+    # Composantes connexes des cases franchissables (voisinage 4 ou 8)
+    def connectivity(self, diagonal: bool = False) -> ConnectivityIndex:
+        diagonal = bool(diagonal)
+        index = self.components.get(diagonal)
+        if index is None:
+            index = ConnectivityIndex(np.isfinite(self.cost), diagonal=diagonal)
+            self.components[diagonal] = index
+        return index
+
+
+# Construit l'index depuis un itérable de tuiles (.x, .y, .walkable, .speed)
+def build_tile_index(tiles: Iterable, width: Optional[int] = None, height: Optional[int] = None) -> TileIndex:
+    tiles = list(tiles)
+    if width is None or height is None:
+        # Objets "GridMap-like" sans dimensions : boîte englobante des tuiles
+        width = max((int(t.x) for t in tiles), default=-1) + 1
+        height = max((int(t.y) for t in tiles), default=-1) + 1
+    w, h = int(width), int(height)
+
+    walkable = np.zeros((h, w), dtype=np.uint8)
+    speed = np.zeros((h, w), dtype=np.float64)
+    has_speed = np.zeros((h, w), dtype=bool)
+
+    speeds = []
+    for t in tiles:
+        x, y = int(t.x), int(t.y)
+        if not (0 <= x < w and 0 <= y < h):
+            continue
+        s = getattr(t, "speed", None)
+        if s is not None:
+            has_speed[y, x] = True
+            speed[y, x] = float(s)
+            if s > 0:
+                speeds.append(float(s))
+        walkable[y, x] = 1 if getattr(t, "walkable", True) else 0
+
+    max_speed = max(speeds) if speeds else 1.0
+    # Tuile sans attribut speed : vitesse max (coût 1)
+    speed[~has_speed & (walkable != 0)] = max_speed
+
+    with np.errstate(divide="ignore"):
+        cost = np.where((walkable != 0) & (speed > 0), max_speed / np.where(speed > 0, speed, 1.0), np.inf)
+
+    return TileIndex(
+        width=w,
+        height=h,
+        max_speed=float(max_speed),
+        walkable=walkable,
+        speed=speed,
+        cost=cost,
+        grid=CostGrid(cost),
+    )
@@ -1,6 +1,7 @@
 # Game/App/renderers/entity_renderer.py
 """Entity, terrain and minimap rendering for Antique War."""
 
+import numpy as np
 import pygame
 import esper
 
@@ -71,22 +72,14 @@ class EntityRenderer:
         tw = int(self.app.game_map.tilewidth)
         th = int(self.app.game_map.tileheight)
 
-        for y in range(h):
-            for x in range(w):
-                walk = self.app.nav_grid.is_walkable(x, y)
-                m = float(self.app.nav_grid.mult[y][x])
-
-                if (not walk) or m <= 0.0:
-                    color = (220, 50, 50, 70)
-                elif m < 0.99:
-                    color = (170, 120, 70, 60)
-                else:
-                    continue
-
+        # Seules les cases interdites / dusty sont dessinées (masques de la grille)
+        forbidden, dusty, _open = self.app.nav_grid.zone_masks()
+        for mask, color in ((forbidden, (220, 50, 50, 70)), (dusty, (170, 120, 70, 60))):
+            s = pygame.Surface((tw, th), pygame.SRCALPHA)
+            s.fill(color)
+            for y, x in np.argwhere(mask).tolist():
                 sx, sy = self.base.grid_to_screen(float(x), float(y))
                 rect = pygame.Rect(int(sx - tw / 2), int(sy - th / 2), tw, th)
-                s = pygame.Surface((tw, th), pygame.SRCALPHA)
-                s.fill(color)
                 self.app.screen.blit(s, rect.topleft)
 
     def debug_draw_forbidden(self):
@@ -99,14 +92,11 @@ class EntityRenderer:
         tw = int(self.app.game_map.tilewidth)
         th = int(self.app.game_map.tileheight)
 
-        for y in range(h):
-            for x in range(w):
-                walk = self.app.nav_grid.is_walkable(x, y)
-                m = float(self.app.nav_grid.mult[y][x])
-                if (not walk) or m <= 0:
-                    sx, sy = self.base.grid_to_screen(float(x), float(y))
-                    rect = pygame.Rect(int(sx - tw / 2), int(sy - th / 2), tw, th)
-                    pygame.draw.rect(self.app.screen, (220, 50, 50), rect, 1)
+        forbidden, _dusty, _open = self.app.nav_grid.zone_masks()
+        for y, x in np.argwhere(forbidden).tolist():
+            sx, sy = self.base.grid_to_screen(float(x), float(y))
+            rect = pygame.Rect(int(sx - tw / 2), int(sy - th / 2), tw, th)
+            pygame.draw.rect(self.app.screen, (220, 50, 50), rect, 1)
 
     def debug_draw_paths(self):
         """Debug: affiche les chemins de toutes les unités."""
@@ -114,10 +104,10 @@ class EntityRenderer:
             self.app.world._activate()
 
         for ent, (t, path, team) in esper.get_components(Transform, PathComponent, Team):
-            if not path.noeuds:
+            if path.length() == 0:
                 continue
 
-            pts = [self.base.grid_to_screen(n.x, n.y) for n in path.noeuds]
+            pts = [self.base.grid_to_screen(x, y) for x, y in path.points()]
             if len(pts) >= 2:
                 if team.id == 1:
                     color = (80, 200, 255)
@@ -183,6 +173,25 @@ class EntityRenderer:
             sx, sy = self.base.grid_to_screen(t.pos[0], t.pos[1])
             sprite_renderer.draw_projectile(self.app.screen, sx, sy, p.team_id)
 
+        # Projectiles du pool (tableaux, pas d'entité)
+        pool = getattr(self.app, "projectile_pool", None)
+        if pool:
+            for x, y, team_id in pool.positions():
+                sx, sy = self.base.grid_to_screen(x, y)
+                sprite_renderer.draw_projectile(self.app.screen, sx, sy, team_id)
+
+        # Tirs programmés (pas d'entité) : interpolation vers la cible
+        impacts = getattr(self.app, "impact_queue", None)
+        if impacts:
+            for impact in impacts:
+                tid = impact.target_entity_id
+                target_pos = None
+                if esper.entity_exists(tid) and esper.has_component(tid, Transform):
+                    target_pos = esper.component_for_entity(tid, Transform).pos
+                x, y = impacts.position(impact, target_pos)
+                sx, sy = self.base.grid_to_screen(x, y)
+                sprite_renderer.draw_projectile(self.app.screen, sx, sy, impact.team_id)
+
     def draw_minimap(self):
         """Dessine une minimap stylisée en bas à droite."""
         if not self.app.nav_grid:
@@ -212,24 +221,14 @@ class EntityRenderer:
         scale_x = mm_w / grid_w
         scale_y = mm_h / grid_h
         
-        # Terrain
-        for y in range(grid_h):
-            for x in range(grid_w):
-                walk = self.app.nav_grid.is_walkable(x, y)
-                m = float(self.app.nav_grid.mult[y][x])
-                
+        # Terrain (une passe par zone via les masques de la grille)
+        pw = max(1, int(scale_x))
+        ph = max(1, int(scale_y))
+        forbidden, dusty, open_ = self.app.nav_grid.zone_masks()
+        for mask, color in ((open_, (70, 65, 50)), (dusty, (100, 85, 60)), (forbidden, (80, 50, 45))):
+            for y, x in np.argwhere(mask).tolist():
                 px = mm_x + int(x * scale_x)
                 py = mm_y + int(y * scale_y)
-                pw = max(1, int(scale_x))
-                ph = max(1, int(scale_y))
-                
-                if not walk or m <= 0:
-                    color = (80, 50, 45)
-                elif m < 0.99:
-                    color = (100, 85, 60)
-                else:
-                    color = (70, 65, 50)
-                
                 pygame.draw.rect(self.app.screen, color, (px, py, pw, ph))
         
         # Lanes
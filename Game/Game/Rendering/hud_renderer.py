@@ -386,7 +386,7 @@ class HUDRenderer:
 
     def draw_hud_advanced(self, base_renderer):
         """Dessine le HUD avancé avec infos de debug."""
-        base_renderer.draw_panel(12, 112, 640, 94, alpha=100)
+        base_renderer.draw_panel(12, 112, 640, 138, alpha=100)
         x = 22
         y = 120
 
@@ -406,9 +406,23 @@ class HUDRenderer:
             diff_txt = "Spawner: N/A"
         l3 = self.app.font_small.render(diff_txt, True, (220, 220, 220))
 
+        if self.app.astar_system:
+            path_txt = self.app.astar_system.hud_line()
+        else:
+            path_txt = "Path: N/A"
+        l4 = self.app.font_small.render(path_txt, True, (220, 220, 220))
+
+        if self.app.targeting_system:
+            target_txt = self.app.targeting_system.hud_line()
+        else:
+            target_txt = "Ciblage: N/A"
+        l5 = self.app.font_small.render(target_txt, True, (220, 220, 220))
+
         self.app.screen.blit(l1, (x, y))
         self.app.screen.blit(l2, (x, y + 22))
         self.app.screen.blit(l3, (x, y + 44))
+        self.app.screen.blit(l4, (x, y + 66))
+        self.app.screen.blit(l5, (x, y + 88))
 
     def draw_hud_player2(self):
         """Dessine le HUD du joueur 2 (à droite) en mode 1v1 - miroir du P1."""
@@ -0,0 +1,207 @@
+# Game/Utils/astar_core.py
+"""
+Cœur A* unique du projet (astar_gridmap, astar_numpy, astar_navgrid et
+l'A* de LanePathfinder sont des adaptateurs au-dessus).
+
+  - CostGrid : coûts d'entrée à plat sur une grille élargie d'une bordure
+    bloquée (inf) -> aucun test de limites, voisins = indice + décalage
+  - AStarCore : tampons g / parent / tampons de visite réutilisés d'un appel
+    à l'autre (remise à zéro paresseuse par numéro de recherche)
+
+Modèle de coût : entrer dans une case coûte base * cost (base = 1 axial,
+sqrt(2) diagonal), cost = inf => bloquée. L'heuristique est "manhattan",
+"octile", une fonction h(x, y) ou une table à plat (liste indexée comme
+CostGrid.cost, ex : bornes ALT de Utils/landmarks.py).
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Point = Tuple[int, int]
+Heuristic = Union[str, Callable[[int, int], float], Sequence[float]]
+
+_INF = float("inf")
+_SQRT2 = math.sqrt(2)
+_AXIAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class CostGrid:
+    """Coûts d'entrée figés (h, w) à plat, avec bordure bloquée."""
+
+    # Construit la grille élargie depuis un tableau de coûts [y, x] (inf = bloqué)
+    def __init__(self, cost):
+        cost = np.asarray(cost, dtype=np.float64)
+        h, w = cost.shape
+        self.width = int(w)
+        self.height = int(h)
+        self.stride = self.width + 2
+
+        padded = np.full((h + 2, w + 2), np.inf)
+        padded[1:-1, 1:-1] = cost
+        self.cost: List[float] = padded.ravel().tolist()
+
+        W = self.stride
+        # Table des voisins : (décalage plat, coût de base, dx, dy)
+        self.offsets4 = tuple((dx + dy * W, 1.0, dx, dy) for dx, dy in _AXIAL)
+        self.offsets8 = self.offsets4 + tuple((dx + dy * W, _SQRT2, dx, dy) for dx, dy in _DIAGONAL)
+
+    # Nombre de cases de la grille élargie
+    def __len__(self):
+        return len(self.cost)
+
+    # Indice plat d'une case (x, y)
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    # Case (x, y) d'un indice plat
+    def point(self, i: int) -> Point:
+        y, x = divmod(i, self.stride)
+        return (x - 1, y - 1)
+
+    # Vérifie si une position est dans les limites de la grille
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+
+class AStarCore:
+    """
+    A* sur CostGrid avec tampons réutilisés (pas d'allocation par nœud hors tas).
+    Une instance n'est pas réentrante : une recherche à la fois.
+    """
+
+    # Initialise des tampons vides (agrandis à la première recherche)
+    def __init__(self):
+        self._g: List[float] = []
+        self._parent: List[int] = []
+        self._seen: List[int] = []    # numéro de recherche où g / parent sont valides
+        self._closed: List[int] = []  # numéro de recherche où la case est fermée
+        self._search_id = 0
+
+        # Statistique : nœuds développés par la dernière recherche
+        self.last_expanded = 0
+
+    # Agrandit les tampons pour une grille de n cases
+    def _reserve(self, n: int):
+        missing = n - len(self._g)
+        if missing > 0:
+            self._g.extend([_INF] * missing)
+            self._parent.extend([-1] * missing)
+            self._seen.extend([0] * missing)
+            self._closed.extend([0] * missing)
+
+    # Cherche un chemin start -> goal (liste de cases, None si aucun chemin)
+    def search(
+        self,
+        grid: CostGrid,
+        start: Point,
+        goal: Point,
+        *,
+        diagonal: bool = False,
+        heuristic: Heuristic = "manhattan",
+    ) -> Optional[List[Point]]:
+        sx, sy = int(start[0]), int(start[1])
+        gx, gy = int(goal[0]), int(goal[1])
+        if not grid.in_bounds(sx, sy) or not grid.in_bounds(gx, gy):
+            return None
+        if (sx, sy) == (gx, gy):
+            return [(sx, sy)]
+
+        cost = grid.cost
+        s = grid.index(sx, sy)
+        t = grid.index(gx, gy)
+        if cost[t] == _INF:
+            return None
+
+        self._reserve(len(grid))
+        self._search_id += 1
+        sid = self._search_id
+        g_buf, parent, seen, closed = self._g, self._parent, self._seen, self._closed
+        offsets = grid.offsets8 if diagonal else grid.offsets4
+        h = self._heuristic_fn(heuristic, gx, gy, grid.stride)
+
+        g_buf[s] = 0.0
+        parent[s] = -1
+        seen[s] = sid
+        heap = [(h(sx, sy), 0, s, sx, sy)]
+        counter = 0
+        expanded = 0
+
+        while heap:
+            _, _, cur, cx, cy = heapq.heappop(heap)
+            if closed[cur] == sid:
+                continue
+            if cur == t:
+                self.last_expanded = expanded
+                return self._unwind(grid, parent, s, t)
+            closed[cur] = sid
+            expanded += 1
+
+            g_cur = g_buf[cur]
+            for off, base, dx, dy in offsets:
+                nb = cur + off
+                c = cost[nb]
+                if c == _INF or closed[nb] == sid:
+                    continue
+                tentative = g_cur + base * c
+                if seen[nb] != sid or tentative < g_buf[nb]:
+                    seen[nb] = sid
+                    g_buf[nb] = tentative
+                    parent[nb] = cur
+                    nx = cx + dx
+                    ny = cy + dy
+                    counter += 1
+                    heapq.heappush(heap, (tentative + h(nx, ny), counter, nb, nx, ny))
+
+        self.last_expanded = expanded
+        return None
+
+    # Heuristique vers (gx, gy) : nom prédéfini, fonction h(x, y) ou table à plat
+    @staticmethod
+    def _heuristic_fn(heuristic: Heuristic, gx: int, gy: int, stride: int) -> Callable[[int, int], float]:
+        if callable(heuristic):
+            return heuristic
+        if isinstance(heuristic, (list, tuple)):
+            table = heuristic
+            return lambda x, y: table[(y + 1) * stride + x + 1]
+        if heuristic == "octile":
+            def octile(x: int, y: int) -> float:
+                dx = abs(x - gx)
+                dy = abs(y - gy)
+                return dx + dy + (_SQRT2 - 2) * min(dx, dy)
+            return octile
+        if heuristic == "manhattan":
+            return lambda x, y: abs(x - gx) + abs(y - gy)
+        raise ValueError(f"heuristique inconnue: {heuristic!r}")
+
+    # Reconstruit le chemin depuis le tampon des parents
+    @staticmethod
+    def _unwind(grid: CostGrid, parent: List[int], s: int, t: int) -> List[Point]:
+        out = []
+        cur = t
+        while cur != s:
+            out.append(grid.point(cur))
+            cur = parent[cur]
+        out.append(grid.point(s))
+        out.reverse()
+        return out
+
+
+# Instance partagée par les adaptateurs (boucle de jeu mono-thread)
+_SHARED_CORE = AStarCore()
+
+
+# Recherche avec le cœur partagé
+def find_path(
+    grid: CostGrid,
+    start: Point,
+    goal: Point,
+    *,
+    diagonal: bool = False,
+    heuristic: Heuristic = "manhattan",
+) -> Optional[List[Point]]:
+    return _SHARED_CORE.search(grid, start, goal, diagonal=diagonal, heuristic=heuristic)
@@ -0,0 +1,239 @@
+# Game/Utils/async_paths.py
+"""
+Résolution de chemins en tâche de fond (pool de processus).
+
+La NavigationGrid est publiée dans un segment de mémoire partagée
+(walkable uint8 puis cost float32, bloqué = inf) : les workers s'y attachent
+par nom au lieu de recevoir la grille sérialisée à chaque requête.
+Chaque version de la grille a son propre segment (jamais réécrit pendant
+qu'un worker le lit) ; les anciens segments sont libérés dès qu'aucune
+requête en vol ne les utilise.
+
+Un résultat calculé sur une version périmée est signalé `stale` :
+l'appelant le jette et redemande le chemin.
+"""
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+Point = Tuple[int, int]
+
+# Segments déjà ouverts côté worker : nom -> [segment, grille, solveur JPS éventuel]
+_WORKER_GRIDS: Dict[str, list] = {}
+
+
+class SharedNavGrid:
+    """
+    Vue lecture seule d'une grille publiée (API d'A* : is_walkable / movement_cost).
+    version = nom du segment (jamais réécrit) : astar_navgrid garde sa CostGrid
+    en cache d'une requête à l'autre.
+    """
+
+    # Construit les vues NumPy sur le buffer partagé
+    def __init__(self, buf, width: int, height: int, version=None):
+        self.width = int(width)
+        self.height = int(height)
+        self.version = version
+        n = self.width * self.height
+        self.walkable = np.ndarray((self.height, self.width), dtype=np.uint8, buffer=buf, offset=0)
+        self.cost = np.ndarray((self.height, self.width), dtype=np.float32, buffer=buf, offset=_cost_offset(n))
+
+    # Vérifie si une position est dans les limites de la grille
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    # Retourne si une case est traversable
+    def is_walkable(self, x: int, y: int) -> bool:
+        if not self.in_bounds(x, y):
+            return False
+        return self.walkable.item(y, x) != 0
+
+    # Retourne le coût de déplacement pour entrer dans une case
+    def movement_cost(self, x: int, y: int) -> float:
+        if not self.in_bounds(x, y):
+            return float("inf")
+        return self.cost.item(y, x)
+
+
+# Décalage (aligné sur 8 octets) du tableau de coûts dans le segment
+def _cost_offset(n: int) -> int:
+    return (n + 7) // 8 * 8
+
+
+# Ouvre un segment existant sans que ce processus en devienne propriétaire
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 : pas d'option track. Les workers "spawn" partagent le
+        # resource_tracker du processus principal (inscription idempotente) :
+        # c'est l'unlink du principal qui fera foi.
+        return shared_memory.SharedMemory(name=name)
+
+
+# Point d'entrée worker : résout start -> goal sur le segment `shm_name`
+def solve_shared(shm_name: str, width: int, height: int, start: Point, goal: Point, allow_diagonal: bool, solver: str):
+    entry = _WORKER_GRIDS.get(shm_name)
+    if entry is None:
+        # Un seul segment ouvert à la fois : la grille précédente est périmée
+        for old in _WORKER_GRIDS.values():
+            old[1] = old[2] = None  # relâche les vues NumPy avant close()
+            old[0].close()
+        _WORKER_GRIDS.clear()
+        shm = _attach(shm_name)
+        entry = [shm, SharedNavGrid(shm.buf, width, height, version=shm_name), None]
+        _WORKER_GRIDS[shm_name] = entry
+
+    grid = entry[1]
+    if solver == "jps":
+        from Game.Utils.jump_point import JumpPointGrid, navgrid_cost_array
+
+        if entry[2] is None:
+            entry[2] = JumpPointGrid(navgrid_cost_array(grid))
+        return entry[2].find_path(start, goal, allow_diagonal=allow_diagonal)
+
+    from Game.Ecs.Systems.AStarPathfindingSystem import astar_navgrid
+
+    return astar_navgrid(grid, start, goal, allow_diagonal=allow_diagonal)
+
+
+@dataclass
+class AsyncPathResult:
+    """Résultat d'une requête terminée."""
+    key: Hashable
+    start: Point
+    goal: Point
+    points: Optional[List[Point]]
+    version: object
+    stale: bool
+
+
+class AsyncPathSolver:
+    """Pool de processus + publication de la grille en mémoire partagée."""
+
+    # Initialise le pool (processus créés au premier submit)
+    def __init__(self, nav_grid, *, max_workers: int = 2, allow_diagonal: bool = False, solver: str = "astar"):
+        self.nav_grid = nav_grid
+        self.max_workers = max(1, int(max_workers))
+        self.allow_diagonal = bool(allow_diagonal)
+        self.solver = solver
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._shm_version = None
+        # Segments remplacés, libérés quand plus aucune requête ne les lit
+        self._retired: Dict[str, shared_memory.SharedMemory] = {}
+        # Requêtes en vol : clé -> (future, start, goal, version, nom du segment)
+        self._inflight: Dict[Hashable, tuple] = {}
+
+        self.submitted = 0
+        self.completed = 0
+        self.stale = 0
+
+    # Publie la grille courante si sa version a changé
+    def _publish(self):
+        nav = self.nav_grid
+        version = getattr(nav, "version", None)
+        if self._shm is not None and version == self._shm_version:
+            return
+
+        w, h = int(nav.width), int(nav.height)
+        n = w * h
+        shm = shared_memory.SharedMemory(create=True, size=_cost_offset(n) + 4 * n)
+        view = SharedNavGrid(shm.buf, w, h)
+        np.copyto(view.walkable, nav.walkable)
+        np.copyto(view.cost, np.where(nav.walkable != 0, nav.cost, np.inf))
+        del view
+
+        if self._shm is not None:
+            self._retired[self._shm.name] = self._shm
+        self._shm = shm
+        self._shm_version = version
+        self._release_retired()
+
+    # Libère les segments remplacés qui ne sont plus lus par aucune requête
+    def _release_retired(self):
+        in_use = {entry[4] for entry in self._inflight.values()}
+        for name in [n for n in self._retired if n not in in_use]:
+            shm = self._retired.pop(name)
+            shm.close()
+            shm.unlink()
+
+    # Pool de processus (contexte "spawn" : pas de copie de l'état pygame)
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    # Vérifie si une requête est en vol pour cette clé
+    def is_pending(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    # Nombre de requêtes en vol
+    def __len__(self):
+        return len(self._inflight)
+
+    # Envoie une requête au pool (ignorée si la clé est déjà en vol)
+    def submit(self, key: Hashable, start: Point, goal: Point) -> bool:
+        if key in self._inflight:
+            return False
+        self._publish()
+        w, h = int(self.nav_grid.width), int(self.nav_grid.height)
+        future: Future = self._executor().submit(
+            solve_shared, self._shm.name, w, h, start, goal, self.allow_diagonal, self.solver
+        )
+        self._inflight[key] = (future, start, goal, self._shm_version, self._shm.name)
+        self.submitted += 1
+        return True
+
+    # Récupère les requêtes terminées (sans bloquer)
+    def poll(self) -> List[AsyncPathResult]:
+        done = [k for k, entry in self._inflight.items() if entry[0].done()]
+        if not done:
+            return []
+
+        current = getattr(self.nav_grid, "version", None)
+        out = []
+        for key in done:
+            future, start, goal, version, _name = self._inflight.pop(key)
+            try:
+                points = future.result()
+            except Exception as e:
+                print(f"[WARN] async path {start}->{goal} failed: {e}")
+                points = None
+            stale = version != current
+            self.completed += 1
+            if stale:
+                self.stale += 1
+            out.append(AsyncPathResult(key, start, goal, points, version, stale))
+
+        self._release_retired()
+        return out
+
+    # Abandonne la requête d'une clé (le résultat sera ignoré)
+    def cancel(self, key: Hashable):
+        entry = self._inflight.pop(key, None)
+        if entry is not None:
+            entry[0].cancel()
+
+    # Arrête le pool et libère la mémoire partagée
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._inflight.clear()
+        for shm in list(self._retired.values()) + ([self._shm] if self._shm is not None else []):
+            shm.close()
+            shm.unlink()
+        self._retired.clear()
+        self._shm = None
+        self._shm_version = None
@@ -0,0 +1,79 @@
+# Game/Utils/damage_events.py
+"""
+Dégâts groupés par frame et flux d'événements de mort.
+
+Les sources de dégâts (projectiles, sauterelles) n'écrivent plus les PV :
+elles empilent des touches (victime, points, équipe source). DamageSystem
+les applique toutes à un point fixe de l'ordre des systèmes et publie la
+liste des morts de la frame ; CombatSystem, TargetingSystem, CleanupSystem
+et le compteur de kills lisent ce flux au lieu de revérifier chaque cible.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Set, Tuple
+
+# Équipe source des dégâts d'environnement (événements aléatoires)
+ENVIRONMENT_TEAM = 0
+
+
+@dataclass
+class DeathEvent:
+    """
+    Mort d'une entité :
+    - victim : entité tuée
+    - killer_team : équipe qui a porté le coup fatal (ENVIRONMENT_TEAM sinon)
+    - cost : coût de la victime (UnitStats.cost, 0 sans UnitStats)
+    - victim_team : équipe de la victime (0 sans Team)
+    """
+    victim: int
+    killer_team: int
+    cost: float
+    victim_team: int = 0
+
+
+class DamageAccumulator:
+    """Touches en attente + morts publiées au dernier flush."""
+
+    # Crée un accumulateur vide
+    def __init__(self):
+        self._pending: List[Tuple[int, int, int]] = []
+        # Morts du dernier flush et leurs victimes (recherche rapide)
+        self.deaths: List[DeathEvent] = []
+        self.victims: Set[int] = set()
+        # Morts pas encore lues par drain()
+        self._unread: List[DeathEvent] = []
+
+    # Nombre de touches en attente
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # Empile une touche (dégâts arrondis en points de vie)
+    def add(self, victim: int, damage: float, source_team: int):
+        points = int(round(damage))
+        if points < 0:
+            points = 0
+        self._pending.append((int(victim), points, int(source_team)))
+
+    # Retire et retourne les touches en attente (ordre d'arrivée)
+    def take(self) -> List[Tuple[int, int, int]]:
+        pending, self._pending = self._pending, []
+        return pending
+
+    # Publie les morts du flush courant
+    def publish(self, deaths: List[DeathEvent]):
+        self.deaths = deaths
+        self.victims = {ev.victim for ev in deaths}
+        self._unread.extend(deaths)
+
+    # Retourne les morts publiées depuis le dernier appel
+    def drain(self) -> List[DeathEvent]:
+        unread, self._unread = self._unread, []
+        return unread
+
+    # Oublie touches et morts (nouvelle partie)
+    def clear(self):
+        self._pending.clear()
+        self.deaths = []
+        self.victims = set()
+        self._unread.clear()
@@ -0,0 +1,228 @@
+# Game/Utils/flow_field.py
+"""
+Flow fields (cartes de distances Dijkstra) partagés par objectif.
+
+Au lieu de lancer un A* par unité, on calcule UNE fois par objectif
+(case d'attaque d'une lane) un champ d'intégration depuis la NavigationGrid :
+  - dist[y, x] : coût minimal pour rejoindre l'objectif depuis (x, y)
+  - next : case suivante à prendre depuis (x, y) (lecture O(1))
+
+Le modèle de coût est celui d'astar_navgrid :
+  entrer dans une case coûte base * movement_cost(case)
+  (base = 1 en axial, sqrt(2) en diagonal).
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+Point = Tuple[int, int]
+
+_AXIAL = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0))
+_DIAGONAL = _AXIAL + (
+    (1, 1, math.sqrt(2)),
+    (1, -1, math.sqrt(2)),
+    (-1, 1, math.sqrt(2)),
+    (-1, -1, math.sqrt(2)),
+)
+
+
+class FlowField:
+    """Champ d'intégration vers un objectif unique."""
+
+    # Construit le champ (Dijkstra inverse depuis l'objectif + table "next")
+    def __init__(self, nav_grid, goal: Point, *, allow_diagonal: bool = False):
+        self.width = int(nav_grid.width)
+        self.height = int(nav_grid.height)
+        self.goal = (int(goal[0]), int(goal[1]))
+        self.allow_diagonal = bool(allow_diagonal)
+        # Cases walkable au moment de la construction (le champ est un instantané)
+        self.walkable = np.asarray(nav_grid.walkable) != 0
+
+        offsets = _DIAGONAL if self.allow_diagonal else _AXIAL
+        self.dist = self._integrate(nav_grid, offsets)
+        self._next = self._build_next(nav_grid, offsets)
+
+    # Dijkstra depuis l'objectif sur les cases walkable (indices plats)
+    def _integrate(self, nav_grid, offsets) -> np.ndarray:
+        w, h = self.width, self.height
+        n = w * h
+        inf = float("inf")
+        dist = [inf] * n
+
+        gx, gy = self.goal
+        if not nav_grid.is_walkable(gx, gy):
+            return np.full((h, w), inf)
+
+        cost = nav_grid.cost.ravel().tolist()
+        walk = nav_grid.walkable.ravel().tolist()
+
+        gi = gy * w + gx
+        dist[gi] = 0.0
+        heap = [(0.0, gi)]
+
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d > dist[i]:
+                continue
+
+            # Coût pour ENTRER dans i depuis un voisin
+            enter = cost[i]
+            y, x = divmod(i, w)
+            for dx, dy, base in offsets:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or nx >= w or ny < 0 or ny >= h:
+                    continue
+                j = ny * w + nx
+                if not walk[j]:
+                    continue
+                nd = d + base * enter
+                if nd < dist[j]:
+                    dist[j] = nd
+                    heapq.heappush(heap, (nd, j))
+
+        return np.asarray(dist, dtype=np.float64).reshape(h, w)
+
+    # Table de la case suivante pour chaque case (vectorisée, -1 = aucune)
+    def _build_next(self, nav_grid, offsets) -> List[int]:
+        w, h = self.width, self.height
+        cost = nav_grid.cost.astype(np.float64)
+
+        best = np.full((h, w), np.inf)
+        best_idx = np.full((h, w), -1, dtype=np.int64)
+        flat = np.arange(w * h, dtype=np.int64).reshape(h, w)
+
+        for dx, dy, base in offsets:
+            # Pour la case (x, y), le candidat est (x+dx, y+dy)
+            cand = np.full((h, w), np.inf)
+            cand_idx = np.full((h, w), -1, dtype=np.int64)
+            src_y = slice(max(0, dy), h + min(0, dy))
+            src_x = slice(max(0, dx), w + min(0, dx))
+            dst_y = slice(max(0, -dy), h + min(0, -dy))
+            dst_x = slice(max(0, -dx), w + min(0, -dx))
+            cand[dst_y, dst_x] = self.dist[src_y, src_x] + base * cost[src_y, src_x]
+            cand_idx[dst_y, dst_x] = flat[src_y, src_x]
+
+            better = cand < best
+            best[better] = cand[better]
+            best_idx[better] = cand_idx[better]
+
+        # Case non walkable : meilleure voisine walkable (comme l'A*, qui en repart) ;
+        # aucune case suivante depuis l'objectif
+        gx, gy = self.goal
+        if 0 <= gx < w and 0 <= gy < h:
+            best_idx[gy, gx] = -1
+        return best_idx.ravel().tolist()
+
+    # Vérifie si l'objectif est atteignable depuis (x, y) (mêmes cas que path_from)
+    def reachable(self, x: int, y: int) -> bool:
+        if (int(x), int(y)) == self.goal:
+            return True
+        return self.next_step(x, y) is not None
+
+    # Coût restant vers l'objectif depuis (x, y) (inf si inatteignable)
+    def distance(self, x: int, y: int) -> float:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return float("inf")
+        return float(self.dist[y, x])
+
+    # Case suivante depuis (x, y), en O(1)
+    def next_step(self, x: int, y: int) -> Optional[Point]:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        j = self._next[y * self.width + x]
+        if j < 0:
+            return None
+        ny, nx = divmod(j, self.width)
+        return (nx, ny)
+
+    # Case walkable (dans la grille) au moment de la construction
+    def is_walkable(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool(self.walkable[y, x])
+
+    # Déroule le champ depuis start jusqu'à l'objectif (start bloqué : sortie par la
+    # meilleure voisine walkable, comme l'A*)
+    def path_from(self, start: Point) -> Optional[List[Point]]:
+        sx, sy = int(start[0]), int(start[1])
+        if not (0 <= sx < self.width and 0 <= sy < self.height):
+            return None
+        if (sx, sy) == self.goal:
+            return [self.goal]
+
+        w = self.width
+        nxt = self._next
+        i = sy * w + sx
+        out = [(sx, sy)]
+        for _ in range(w * self.height):
+            i = nxt[i]
+            if i < 0:
+                return None
+            y, x = divmod(i, w)
+            out.append((x, y))
+            if (x, y) == self.goal:
+                return out
+        return None
+
+
+class FlowFieldManager:
+    """
+    Un FlowField par objectif enregistré, reconstruit paresseusement
+    après un changement de terrain (NavigationGrid.version ou invalidate()).
+    """
+
+    # Initialise le gestionnaire avec la grille de navigation
+    def __init__(self, nav_grid, *, allow_diagonal: bool = False):
+        self.nav_grid = nav_grid
+        self.allow_diagonal = bool(allow_diagonal)
+        self.goals: set[Point] = set()
+        self._fields: Dict[Point, FlowField] = {}
+        self._version = getattr(nav_grid, "version", None)
+        self.builds = 0
+
+    # Enregistre un objectif (ex: case d'attaque d'une lane)
+    def register_goal(self, goal: Point):
+        self.goals.add((int(goal[0]), int(goal[1])))
+
+    # Vérifie si un objectif a un flow field
+    def has_goal(self, goal: Point) -> bool:
+        return (int(goal[0]), int(goal[1])) in self.goals
+
+    # Oublie tous les champs (terrain modifié) : reconstruits au prochain accès
+    def invalidate(self):
+        self._fields.clear()
+
+    # Retourne le champ d'un objectif enregistré (construit si besoin)
+    def field(self, goal: Point) -> Optional[FlowField]:
+        key = (int(goal[0]), int(goal[1]))
+        if key not in self.goals or not self.nav_grid:
+            return None
+        version = getattr(self.nav_grid, "version", None)
+        if version != self._version:
+            self._fields.clear()
+            self._version = version
+        f = self._fields.get(key)
+        if f is None:
+            f = FlowField(self.nav_grid, key, allow_diagonal=self.allow_diagonal)
+            self._fields[key] = f
+            self.builds += 1
+        return f
+
+    # Case suivante vers goal depuis pos (None si pas de champ / inatteignable)
+    def next_step(self, goal: Point, pos: Point) -> Optional[Point]:
+        f = self.field(goal)
+        if f is None:
+            return None
+        return f.next_step(int(pos[0]), int(pos[1]))
+
+    # Chemin complet start -> goal lu dans le champ
+    def path(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        f = self.field(goal)
+        if f is None:
+            return None
+        return f.path_from(start)
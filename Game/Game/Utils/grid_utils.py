@@ -26,46 +26,20 @@ class GridUtils:
         w = int(getattr(nav, "width", 0))
         h = int(getattr(nav, "height", 0))
         if w > 0 and h > 0:
-            for x in range(w):
-                nav.set_cell(x, 0, walkable=False, mult=0.0)
-                nav.set_cell(x, h - 1, walkable=False, mult=0.0)
-            for y in range(h):
-                nav.set_cell(0, y, walkable=False, mult=0.0)
-                nav.set_cell(w - 1, y, walkable=False, mult=0.0)
+            nav.fill_rect(0, 0, w, 1, walkable=False, mult=0.0)
+            nav.fill_rect(0, h - 1, w, 1, walkable=False, mult=0.0)
+            nav.fill_rect(0, 0, 1, h, walkable=False, mult=0.0)
+            nav.fill_rect(w - 1, 0, 1, h, walkable=False, mult=0.0)
 
         return nav
 
     def find_walkable_near(self, x: int, y: int, max_r: int = 10):
         """Trouve une case walkable proche de (x, y)."""
-        w = int(getattr(self.app.nav_grid, "width", 0))
-        h = int(getattr(self.app.nav_grid, "height", 0))
-        for r in range(0, max_r + 1):
-            for dy in range(-r, r + 1):
-                for dx in range(-r, r + 1):
-                    nx = x + dx
-                    ny = y + dy
-                    if 0 <= nx < w and 0 <= ny < h:
-                        if self.app.nav_grid.is_walkable(nx, ny):
-                            return nx, ny
-        return None
+        return self.app.nav_grid.nearest_walkable(x, y, max_r=max_r)
 
     def force_open_cell(self, x: int, y: int, mult: float = 1.0):
         """Force une case à être walkable/open."""
-        try:
-            self.app.nav_grid.set_cell(int(x), int(y), walkable=True, mult=float(mult))
-            return
-        except Exception:
-            pass
-
-        # Fallback
-        try:
-            self.app.nav_grid.walkable[int(y)][int(x)] = True
-        except Exception:
-            pass
-        try:
-            self.app.nav_grid.mult[int(y)][int(x)] = float(mult)
-        except Exception:
-            pass
+        self.app.nav_grid.set_cell(int(x), int(y), walkable=True, mult=float(mult))
 
     def attack_cell_for_lane(self, team_id: int, lane_idx: int) -> tuple[int, int]:
         """
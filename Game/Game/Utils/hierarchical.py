@@ -0,0 +1,434 @@
+# Game/Utils/hierarchical.py
+"""
+Pathfinding hiérarchique (HPA*) pour les grandes cartes.
+
+La NavigationGrid est découpée en clusters carrés (cluster_size x cluster_size) :
+  - entrées : sur chaque frontière entre deux clusters voisins, les suites de
+    cases traversables des deux côtés donnent une ou deux transitions
+    (milieu de la suite, ou ses deux extrémités si elle est longue)
+  - graphe abstrait : les cases de transition, reliées par les arcs inter-cluster
+    (un pas à travers la frontière) et intra-cluster (Dijkstra limité au cluster,
+    distances ET chemins mis en cache)
+
+Une requête relie start / goal aux transitions de leur cluster, cherche dans le
+graphe abstrait puis déroule les chemins intra-cluster en cache.
+Pas de garantie d'optimalité : le chemin doit passer par les transitions.
+Mesuré sur des grilles aléatoires pondérées (clusters de 10) : 1.1x à 1.15x
+l'optimal en moyenne, 30 à 60 % des requêtes à plus de 10 % au-dessus, 3x au
+pire (5x avec de petits clusters : requêtes courtes qui font le détour par
+une transition) ; sur un terrain type carte de jeu (rectangles de sable et
+obstacles, 240x160) : 1.05x en moyenne, 1.3x au pire.
+
+Affinage optionnel (refine_margin >= 0) : A* limité au couloir des clusters
+traversés (élargi de refine_margin clusters), jamais plus cher que le chemin
+HPA*. Marge 0 : ~1.02x en moyenne, moins de 2x au pire ; marge 1 : optimal
+dans la pratique (<= 1.06x). Le couloir coûte un A* sur sa surface : sur les
+cartes mesurées (jusqu'à 240x160) c'est plus lent qu'un A* plat, donc désactivé
+par défaut et réservé aux cas où la qualité du chemin prime.
+
+Quand le terrain change (NavigationGrid.version), seuls les clusters contenant
+des cases modifiées (et leurs voisins, dont les frontières bougent) sont
+reconstruits.
+
+Modèle de coût identique à astar_navgrid : entrer dans une case coûte
+base * movement_cost (base = 1 axial, sqrt(2) diagonal).
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+Point = Tuple[int, int]
+Cluster = Tuple[int, int]
+
+_INF = float("inf")
+_AXIAL = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0))
+_DIAGONAL = _AXIAL + (
+    (1, 1, math.sqrt(2)),
+    (1, -1, math.sqrt(2)),
+    (-1, 1, math.sqrt(2)),
+    (-1, -1, math.sqrt(2)),
+)
+
+# Au-delà de cette longueur, une entrée reçoit deux transitions (extrémités)
+_LONG_ENTRANCE = 6
+
+
+class HierarchicalPathfinder:
+    """Graphe abstrait HPA* au-dessus d'une NavigationGrid."""
+
+    # Initialise le découpage (le graphe est construit au premier appel)
+    def __init__(self, nav_grid, *, cluster_size: int = 10, allow_diagonal: bool = False,
+                 refine_margin: int = -1):
+        self.nav_grid = nav_grid
+        # Affinage : A* limité aux clusters du chemin trouvé, élargis de refine_margin
+        # clusters (< 0 : pas d'affinage)
+        self.refine_margin = int(refine_margin)
+        self.cluster_size = max(2, int(cluster_size))
+        self.allow_diagonal = bool(allow_diagonal)
+        self._offsets = _DIAGONAL if self.allow_diagonal else _AXIAL
+
+        self.width = int(nav_grid.width)
+        self.height = int(nav_grid.height)
+        self.clusters_x = (self.width + self.cluster_size - 1) // self.cluster_size
+        self.clusters_y = (self.height + self.cluster_size - 1) // self.cluster_size
+
+        # Frontière (cluster A, cluster B) -> transitions [(case côté A, case côté B)]
+        self._borders: Dict[Tuple[Cluster, Cluster], List[Tuple[Point, Point]]] = {}
+        # Cluster -> cases de transition qu'il contient
+        self._nodes: Dict[Cluster, Set[Point]] = {}
+        # Case -> {case cible du même cluster: (coût, chemin)}
+        self._intra: Dict[Point, Dict[Point, Tuple[float, List[Point]]]] = {}
+        # Case -> [(case de l'autre côté, coût)]
+        self._inter: Dict[Point, List[Tuple[Point, float]]] = {}
+
+        self._cost: List[float] = []
+        self._version = None
+        self._snapshot = None
+
+        # Statistiques (reconstructions de clusters)
+        self.cluster_builds = 0
+
+    # ----------------------------
+    # Découpage
+    # ----------------------------
+    # Cluster contenant une case
+    def cluster_of(self, p: Point) -> Cluster:
+        return (int(p[0]) // self.cluster_size, int(p[1]) // self.cluster_size)
+
+    # Limites [x0, x1) x [y0, y1) d'un cluster
+    def _bounds(self, c: Cluster) -> Tuple[int, int, int, int]:
+        cs = self.cluster_size
+        x0 = c[0] * cs
+        y0 = c[1] * cs
+        return x0, y0, min(self.width, x0 + cs), min(self.height, y0 + cs)
+
+    # Clusters voisins (droite / bas d'abord : chaque frontière a une clé unique)
+    def _neighbor_clusters(self, c: Cluster) -> List[Cluster]:
+        cx, cy = c
+        out = []
+        for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+            if 0 <= nx < self.clusters_x and 0 <= ny < self.clusters_y:
+                out.append((nx, ny))
+        return out
+
+    # ----------------------------
+    # Synchronisation avec la grille
+    # ----------------------------
+    # Reconstruit les clusters touchés depuis la dernière version connue
+    def _sync(self):
+        nav = self.nav_grid
+        version = getattr(nav, "version", None)
+        if self._snapshot is not None and version == self._version:
+            return
+
+        self._cost = np.where(nav.walkable != 0, nav.cost, np.inf).astype(np.float64).ravel().tolist()
+
+        if self._snapshot is None:
+            dirty = {(cx, cy) for cx in range(self.clusters_x) for cy in range(self.clusters_y)}
+        else:
+            walk, mult = self._snapshot
+            changed = np.argwhere((walk != nav.walkable) | (mult != nav.mult))
+            dirty = {(int(x) // self.cluster_size, int(y) // self.cluster_size) for y, x in changed}
+
+        self._snapshot = nav.snapshot()
+        self._version = version
+        if dirty:
+            self._rebuild(dirty)
+
+    # Recalcule les frontières des clusters sales puis les arcs intra-cluster touchés
+    def _rebuild(self, dirty: Set[Cluster]):
+        touched = set(dirty)
+        for c in dirty:
+            for n in self._neighbor_clusters(c):
+                key = (c, n) if c < n else (n, c)
+                self._borders[key] = self._find_transitions(*key)
+                touched.add(n)
+
+        # Arcs intra des anciennes transitions des clusters touchés
+        for c in touched:
+            for p in self._nodes.get(c, ()):
+                self._intra.pop(p, None)
+
+        # Transitions par cluster et arcs inter-cluster (peu nombreux : recalcul complet)
+        self._nodes = {}
+        self._inter = {}
+        for (a, b), transitions in self._borders.items():
+            for pa, pb in transitions:
+                self._nodes.setdefault(a, set()).add(pa)
+                self._nodes.setdefault(b, set()).add(pb)
+                self._inter.setdefault(pa, []).append((pb, self._enter_cost(pa, pb)))
+                self._inter.setdefault(pb, []).append((pa, self._enter_cost(pb, pa)))
+
+        for c in touched:
+            self._build_intra(c)
+
+    # Transitions sur la frontière entre deux clusters adjacents (a < b)
+    def _find_transitions(self, a: Cluster, b: Cluster) -> List[Tuple[Point, Point]]:
+        ax0, ay0, ax1, ay1 = self._bounds(a)
+        if a[0] != b[0]:
+            # Frontière verticale : colonne ax1 - 1 (côté a) / ax1 (côté b)
+            pairs = [((ax1 - 1, y), (ax1, y)) for y in range(ay0, ay1)]
+        else:
+            # Frontière horizontale : ligne ay1 - 1 (côté a) / ay1 (côté b)
+            pairs = [((x, ay1 - 1), (x, ay1)) for x in range(ax0, ax1)]
+
+        out: List[Tuple[Point, Point]] = []
+        run: List[Tuple[Point, Point]] = []
+        for pa, pb in pairs + [(None, None)]:
+            if pa is not None and self._passable(pa) and self._passable(pb):
+                run.append((pa, pb))
+                continue
+            if run:
+                if len(run) >= _LONG_ENTRANCE:
+                    out += [run[0], run[-1]]
+                else:
+                    out.append(run[len(run) // 2])
+                run = []
+        return out
+
+    # Case traversable
+    def _passable(self, p: Point) -> bool:
+        return self._cost[p[1] * self.width + p[0]] != _INF
+
+    # Coût pour entrer dans b depuis a (voisins)
+    def _enter_cost(self, a: Point, b: Point) -> float:
+        base = math.sqrt(2) if (a[0] != b[0] and a[1] != b[1]) else 1.0
+        return base * self._cost[b[1] * self.width + b[0]]
+
+    # Arcs intra-cluster : Dijkstra depuis chaque transition du cluster
+    def _build_intra(self, c: Cluster):
+        nodes = self._nodes.get(c, set())
+        for p in nodes:
+            dist, parent = self._local_search(p, c)
+            edges = {}
+            for q in nodes:
+                if q != p and q in dist:
+                    edges[q] = (dist[q], self._unwind(parent, q))
+            self._intra[p] = edges
+        self.cluster_builds += 1
+
+    # ----------------------------
+    # Recherche locale (limitée à un cluster)
+    # ----------------------------
+    # Dijkstra depuis src dans le cluster c (reverse : coûts pour rejoindre src)
+    def _local_search(self, src: Point, c: Cluster, *, reverse: bool = False):
+        x0, y0, x1, y1 = self._bounds(c)
+        w = self.width
+        cost = self._cost
+
+        dist: Dict[Point, float] = {src: 0.0}
+        parent: Dict[Point, Point] = {}
+        heap = [(0.0, src)]
+        while heap:
+            d, cur = heapq.heappop(heap)
+            if d > dist[cur]:
+                continue
+            cx, cy = cur
+            for dx, dy, base in self._offsets:
+                nx = cx + dx
+                ny = cy + dy
+                if nx < x0 or nx >= x1 or ny < y0 or ny >= y1:
+                    continue
+                enter_n = cost[ny * w + nx]
+                if enter_n == _INF:
+                    continue
+                # En sens inverse, l'arc nb -> cur coûte l'entrée dans cur
+                nd = d + base * (cost[cy * w + cx] if reverse else enter_n)
+                nb = (nx, ny)
+                if nd < dist.get(nb, _INF):
+                    dist[nb] = nd
+                    parent[nb] = cur
+                    heapq.heappush(heap, (nd, nb))
+        return dist, parent
+
+    # Chemin src -> q depuis la table des parents (src exclu)
+    @staticmethod
+    def _unwind(parent: Dict[Point, Point], q: Point) -> List[Point]:
+        out = [q]
+        while q in parent:
+            q = parent[q]
+            out.append(q)
+        out.reverse()
+        return out[1:]
+
+    # ----------------------------
+    # Requête
+    # ----------------------------
+    # Heuristique (Manhattan ou octile) vers goal
+    def _heuristic(self, a: Point, b: Point) -> float:
+        dx = abs(a[0] - b[0])
+        dy = abs(a[1] - b[1])
+        if self.allow_diagonal:
+            return dx + dy + (math.sqrt(2) - 2) * min(dx, dy)
+        return dx + dy
+
+    # Cherche un chemin start -> goal (None si aucun chemin trouvé)
+    def find_path(self, start: Point, goal: Point) -> Optional[List[Point]]:
+        start = (int(start[0]), int(start[1]))
+        goal = (int(goal[0]), int(goal[1]))
+        if start == goal:
+            return [start]
+        if not self.nav_grid.in_bounds(*start) or not self.nav_grid.in_bounds(*goal):
+            return None
+
+        self._sync()
+        if not self._passable(goal):
+            return None
+
+        cs = self.cluster_of(start)
+        cg = self.cluster_of(goal)
+
+        # Arcs temporaires : start -> transitions de son cluster
+        s_dist, s_parent = self._local_search(start, cs)
+        start_edges = {
+            q: (s_dist[q], self._unwind(s_parent, q))
+            for q in self._nodes.get(cs, ()) if q in s_dist and q != start
+        }
+        # ... et transitions du cluster du goal -> goal (Dijkstra inverse)
+        g_dist, g_parent = self._local_search(goal, cg, reverse=True)
+        goal_edges = {}
+        for q in self._nodes.get(cg, ()):
+            if q in g_dist:
+                # Chemin q -> goal : on suit les parents (vers goal)
+                seg = []
+                cur = q
+                while cur != goal:
+                    cur = g_parent[cur]
+                    seg.append(cur)
+                goal_edges[q] = (g_dist[q], seg)
+
+        best_cost = _INF
+        best_path: Optional[List[Point]] = None
+        if cs == cg and goal in s_dist:
+            best_cost = s_dist[goal]
+            best_path = [start] + self._unwind(s_parent, goal)
+
+        abstract = self._abstract_search(start, goal, start_edges, goal_edges, best_cost)
+        if abstract is not None:
+            best_path = abstract
+        if best_path is not None and self.refine_margin >= 0:
+            best_path = self._refine(best_path)
+        return best_path
+
+    # Couloir : clusters traversés par path, élargis de refine_margin clusters
+    def _corridor(self, path: List[Point]) -> bytearray:
+        m = self.refine_margin
+        clusters = set()
+        for p in path:
+            cx, cy = self.cluster_of(p)
+            for nx in range(max(0, cx - m), min(self.clusters_x, cx + m + 1)):
+                for ny in range(max(0, cy - m), min(self.clusters_y, cy + m + 1)):
+                    clusters.add((nx, ny))
+
+        w = self.width
+        mask = bytearray(w * self.height)
+        for c in clusters:
+            x0, y0, x1, y1 = self._bounds(c)
+            row = b"\x01" * (x1 - x0)
+            for y in range(y0, y1):
+                mask[y * w + x0:y * w + x1] = row
+        return mask
+
+    # A* start -> goal limité au couloir du chemin trouvé (jamais plus cher que path)
+    def _refine(self, path: List[Point]) -> List[Point]:
+        if len(path) < 3:
+            return path
+        start, goal = path[0], path[-1]
+        mask = self._corridor(path)
+        w, h = self.width, self.height
+        cost = self._cost
+        heuristic = self._heuristic
+
+        si = start[1] * w + start[0]
+        gi = goal[1] * w + goal[0]
+        g_score = {si: 0.0}
+        parent: Dict[int, int] = {}
+        heap = [(heuristic(start, goal), 0.0, si)]
+        closed = set()
+        while heap:
+            _f, g, i = heapq.heappop(heap)
+            if i in closed:
+                continue
+            if i == gi:
+                break
+            closed.add(i)
+            y, x = divmod(i, w)
+            for dx, dy, base in self._offsets:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or nx >= w or ny < 0 or ny >= h:
+                    continue
+                j = ny * w + nx
+                if not mask[j] or j in closed:
+                    continue
+                enter = cost[j]
+                if enter == _INF:
+                    continue
+                ng = g + base * enter
+                if ng < g_score.get(j, _INF):
+                    g_score[j] = ng
+                    parent[j] = i
+                    heapq.heappush(heap, (ng + heuristic((nx, ny), goal), ng, j))
+
+        if gi not in g_score:
+            return path
+        out = []
+        i = gi
+        while True:
+            y, x = divmod(i, w)
+            out.append((x, y))
+            if i == si:
+                break
+            i = parent[i]
+        out.reverse()
+        return out
+
+    # A* sur le graphe abstrait (retourne le chemin déroulé s'il bat `bound`)
+    def _abstract_search(self, start, goal, start_edges, goal_edges, bound: float) -> Optional[List[Point]]:
+        g_score: Dict[Point, float] = {start: 0.0}
+        came: Dict[Point, Tuple[Point, List[Point]]] = {}
+        counter = 0
+        heap = [(self._heuristic(start, goal), counter, start)]
+        closed = set()
+
+        while heap:
+            f, _, cur = heapq.heappop(heap)
+            if f >= bound:
+                break
+            if cur in closed:
+                continue
+            if cur == goal:
+                segs = []
+                while cur in came:
+                    cur, seg = came[cur]
+                    segs.append(seg)
+                out = [start]
+                for seg in reversed(segs):
+                    out += seg
+                return out
+            closed.add(cur)
+
+            g_cur = g_score[cur]
+            edges = [(q, (c, [q])) for q, c in self._inter.get(cur, ())]
+            if cur == start:
+                edges += list(start_edges.items())
+            else:
+                edges += list(self._intra.get(cur, {}).items())
+            if cur in goal_edges:
+                edges.append((goal, goal_edges[cur]))
+
+            for nxt, (c, seg) in edges:
+                if nxt in closed:
+                    continue
+                tentative = g_cur + c
+                if tentative < g_score.get(nxt, _INF):
+                    g_score[nxt] = tentative
+                    came[nxt] = (cur, seg)
+                    counter += 1
+                    heapq.heappush(heap, (tentative + self._heuristic(nxt, goal), counter, nxt))
+
+        return None
@@ -0,0 +1,104 @@
+# Game/Utils/impact_queue.py
+"""
+Impacts programmés : un tir homing touche toujours sa cible, sauf si elle
+meurt avant. Au lieu d'un projectile ECS réorienté à chaque frame, on
+calcule au tir l'instant d'impact (distance au tir / vitesse, moins le
+rayon de touche) et on range l'impact dans un tas trié par instant.
+
+ProjectileSystem avance l'horloge et applique les impacts échus ; le rendu
+ne garde qu'une interpolation (origine -> position actuelle de la cible).
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+Point = Tuple[float, float]
+
+# Rayon de touche minimal, commun aux trois modes de projectiles (entité, pool, impacts)
+MIN_HIT_RADIUS = 0.4
+
+
+@dataclass
+class ScheduledImpact:
+    """
+    Tir en vol :
+    - team_id : équipe qui a tiré
+    - target_entity_id : cible visée
+    - damage : dégâts à appliquer à l'impact
+    - origin : position du tireur au moment du tir
+    - fired_at / hit_at : instants du tir et de l'impact (horloge de la file)
+    - last_pos : dernière position connue de la cible (rendu si elle disparaît)
+    """
+    team_id: int
+    target_entity_id: int
+    damage: float
+    origin: Point
+    fired_at: float
+    hit_at: float
+    last_pos: Point
+
+
+class ImpactQueue:
+    """Tas (instant d'impact, n°, impact) + horloge de simulation."""
+
+    # Crée une file vide
+    def __init__(self):
+        self.time = 0.0
+        self._heap: List[Tuple[float, int, ScheduledImpact]] = []
+        self._seq = 0
+
+    # Nombre de tirs en vol
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    # Tirs en vol (ordre quelconque)
+    def __iter__(self) -> Iterator[ScheduledImpact]:
+        return (entry[2] for entry in self._heap)
+
+    # Avance l'horloge
+    def advance(self, dt: float):
+        if dt > 0.0:
+            self.time += float(dt)
+
+    # Programme un tir ; None si le projectile expirerait avant d'arriver (ttl)
+    def schedule(self, *, team_id: int, target_entity_id: int, damage: float, origin: Point,
+                 target_pos: Point, speed: float, hit_radius: float, ttl: float) -> Optional[ScheduledImpact]:
+        speed = float(speed) if float(speed) >= 1.0 else 12.0
+        dist = math.hypot(target_pos[0] - origin[0], target_pos[1] - origin[1])
+        flight = max(0.0, dist - max(MIN_HIT_RADIUS, float(hit_radius))) / speed
+        if flight > ttl:
+            return None
+
+        impact = ScheduledImpact(
+            team_id=int(team_id),
+            target_entity_id=int(target_entity_id),
+            damage=float(damage),
+            origin=(float(origin[0]), float(origin[1])),
+            fired_at=self.time,
+            hit_at=self.time + flight,
+            last_pos=(float(target_pos[0]), float(target_pos[1])),
+        )
+        self._seq += 1
+        heapq.heappush(self._heap, (impact.hit_at, self._seq, impact))
+        return impact
+
+    # Retire et retourne les impacts échus (ordre chronologique)
+    def pop_due(self) -> List[ScheduledImpact]:
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            due.append(heapq.heappop(heap)[2])
+        return due
+
+    # Position affichée d'un tir : interpolation origine -> cible
+    def position(self, impact: ScheduledImpact, target_pos: Optional[Point] = None) -> Point:
+        if target_pos is not None:
+            impact.last_pos = (float(target_pos[0]), float(target_pos[1]))
+        span = impact.hit_at - impact.fired_at
+        k = 1.0 if span <= 0.0 else min(1.0, max(0.0, (self.time - impact.fired_at) / span))
+        ox, oy = impact.origin
+        tx, ty = impact.last_pos
+        return (ox + (tx - ox) * k, oy + (ty - oy) * k)
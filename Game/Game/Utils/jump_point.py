@@ -0,0 +1,379 @@
+# Game/Utils/jump_point.py
+"""
+Jump Point Search (JPS) sur grille pondérée.
+
+Les régions "calmes" (case dont tous les voisins traversables ont le même coût)
+sont parcourues par sauts en ligne droite : seules les cases où un chemin
+optimal peut tourner (voisins forcés, objectif, bord d'une zone de coût
+différent) sont insérées dans la file. Près des cases dusty / sables mouvants,
+les cases ne sont plus calmes et l'expansion redevient celle d'un A* classique.
+
+Modèle de coût identique aux A* du projet :
+  - entrer dans une case coûte base * cost[y, x] (base = 1 axial, sqrt(2) diagonal)
+  - cost = inf => case bloquée
+  - en diagonal, pas de contrôle de coin (comme astar_navgrid)
+
+En 4-connexité, l'ordre canonique est "vertical puis horizontal" (JPS4) :
+un déplacement vertical ouvre les deux horizontales, un déplacement horizontal
+ne tourne qu'aux voisins forcés.
+
+Les sauts droits sont précalculés (JPS+) : pour chaque case et direction,
+la prochaine case d'arrêt (ou le mur) est lue dans une table, construite
+paresseusement à la première utilisation.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Point = Tuple[int, int]
+
+_INF = float("inf")
+_SQRT2 = math.sqrt(2)
+_AXIAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_ALL8 = _AXIAL + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class JumpPointGrid:
+    """
+    Grille figée pour JPS : coûts + masque "calme", avec une bordure bloquée
+    (indices plats sur la grille élargie, pas de test de limites dans les sauts).
+    """
+
+    # Construit la grille depuis un tableau de coûts (h, w), inf = bloqué
+    def __init__(self, cost: np.ndarray):
+        cost = np.asarray(cost, dtype=np.float64)
+        h, w = cost.shape
+        self.width = int(w)
+        self.height = int(h)
+        self.stride = self.width + 2
+
+        padded = np.full((h + 2, w + 2), np.inf)
+        padded[1:-1, 1:-1] = cost
+
+        # Calme : chaque voisin (8-connexe) est bloqué ou de même coût
+        inner = padded[1:-1, 1:-1]
+        calm = np.isfinite(inner)
+        for dx, dy in _ALL8:
+            nb = padded[1 + dy:h + 1 + dy, 1 + dx:w + 1 + dx]
+            calm &= np.isinf(nb) | (nb == inner)
+        calm_padded = np.zeros((h + 2, w + 2), dtype=bool)
+        calm_padded[1:-1, 1:-1] = calm
+
+        self._cost = padded.ravel().tolist()
+        self._calm = calm_padded.ravel().tolist()
+        # Tables JPS+ : (type de saut, direction) -> (arrêt, dernière case atteinte)
+        self._tables: dict = {}
+
+    # Indice plat (grille élargie) d'une case
+    def _index(self, p: Point) -> int:
+        return (int(p[1]) + 1) * self.stride + int(p[0]) + 1
+
+    # Case (x, y) d'un indice plat
+    def _point(self, i: int) -> Point:
+        y, x = divmod(i, self.stride)
+        return (x - 1, y - 1)
+
+    # Vérifie si une case est dans la grille
+    def in_bounds(self, p: Point) -> bool:
+        return 0 <= p[0] < self.width and 0 <= p[1] < self.height
+
+    # ----------------------------
+    # Tables de sauts droits (JPS+)
+    # ----------------------------
+    # Case d'arrêt d'un saut droit 8-connexe (voisin forcé latéral)
+    def _forced_straight(self, i: int, step: int, side: int) -> bool:
+        cost = self._cost
+        return (cost[i + side] == _INF and cost[i + side + step] != _INF) or (
+            cost[i - side] == _INF and cost[i - side + step] != _INF
+        )
+
+    # Case d'arrêt d'un saut horizontal 4-connexe (verticale "derrière" bloquée)
+    def _forced_horizontal4(self, i: int, step: int, side: int) -> bool:
+        cost = self._cost
+        return (cost[i - step - side] == _INF and cost[i - side] != _INF) or (
+            cost[i - step + side] == _INF and cost[i + side] != _INF
+        )
+
+    # Table (arrêt, fin) pour un type de saut et un pas, construite au besoin
+    def _table(self, kind: str, step: int):
+        key = (kind, step)
+        table = self._tables.get(key)
+        if table is not None:
+            return table
+
+        cost, calm = self._cost, self._calm
+        side = self.stride if abs(step) == 1 else 1
+        forced = self._forced_straight if kind == "s8" else self._forced_horizontal4
+        n = len(cost)
+        stop = [-1] * n
+        end = list(range(n))
+
+        # Parcours à rebours du sens de déplacement : i + step est déjà résolu
+        order = range(n - 1, -1, -1) if step > 0 else range(n)
+        for i in order:
+            j = i + step
+            if j < 0 or j >= n or cost[j] == _INF:
+                continue
+            if not calm[j] or forced(j, step, side):
+                stop[i] = j
+                end[i] = j
+            else:
+                stop[i] = stop[j]
+                end[i] = end[j]
+
+        table = (stop, end)
+        self._tables[key] = table
+        return table
+
+    # Saut droit via table : (indice, coût) du point de saut ou None
+    def _jump_table(self, i: int, step: int, goal: int, kind: str):
+        stop, end = self._table(kind, step)
+        last = end[i]
+        if last == i:
+            return None
+
+        # Objectif sur la ligne parcourue : on s'y arrête
+        if abs(step) == 1:
+            on_line = goal // self.stride == i // self.stride
+        else:
+            on_line = goal % self.stride == i % self.stride
+        if on_line and (i < goal <= last if step > 0 else last <= goal < i):
+            target = goal
+        else:
+            target = stop[i]
+            if target < 0:
+                return None
+
+        # Cases intermédiaires calmes : même coût que la première case
+        cost = self._cost
+        k = (target - i) // step
+        return target, (k - 1) * cost[i + step] + cost[target]
+
+    # ----------------------------
+    # Sauts 8-connexes
+    # ----------------------------
+    # Saut en ligne droite (dx, dy axial) : (indice, coût) du point de saut ou None
+    def _jump_straight(self, i: int, dx: int, dy: int, goal: int):
+        return self._jump_table(i, dx + dy * self.stride, goal, "s8")
+
+    # Saut diagonal : s'arrête si un voisin forcé ou un saut droit aboutit
+    def _jump_diagonal(self, i: int, dx: int, dy: int, goal: int):
+        cost, calm, W = self._cost, self._calm, self.stride
+        step = dx + dy * W
+        g = 0.0
+        while True:
+            i += step
+            c = cost[i]
+            if c == _INF:
+                return None
+            g += _SQRT2 * c
+            if i == goal or not calm[i]:
+                return i, g
+            if (cost[i - dx] == _INF and cost[i - dx + dy * W] != _INF) or (
+                cost[i - dy * W] == _INF and cost[i + dx - dy * W] != _INF
+            ):
+                return i, g
+            if self._jump_straight(i, dx, 0, goal) or self._jump_straight(i, 0, dy, goal):
+                return i, g
+
+    # ----------------------------
+    # Sauts 4-connexes (vertical puis horizontal)
+    # ----------------------------
+    # Saut horizontal : tourne seulement si la case verticale "derrière" est bloquée
+    def _jump_horizontal4(self, i: int, dx: int, goal: int):
+        return self._jump_table(i, dx, goal, "h4")
+
+    # Saut vertical : s'arrête si un saut horizontal depuis la case aboutit
+    def _jump_vertical4(self, i: int, dy: int, goal: int):
+        cost, calm, W = self._cost, self._calm, self.stride
+        step = dy * W
+        g = 0.0
+        while True:
+            i += step
+            c = cost[i]
+            if c == _INF:
+                return None
+            g += c
+            if i == goal or not calm[i]:
+                return i, g
+            if self._jump_horizontal4(i, 1, goal) or self._jump_horizontal4(i, -1, goal):
+                return i, g
+
+    # ----------------------------
+    # Élagage des directions
+    # ----------------------------
+    # Directions à explorer depuis i, sachant la direction d'arrivée (None = toutes)
+    def _directions(self, i: int, d: Optional[Point], diagonal: bool):
+        if d is None or not self._calm[i]:
+            return _ALL8 if diagonal else _AXIAL
+
+        cost, W = self._cost, self.stride
+        dx, dy = d
+        if not diagonal:
+            if dx == 0:
+                return ((0, dy), (1, 0), (-1, 0))
+            out = [(dx, 0)]
+            for vy in (-1, 1):
+                if cost[i - dx + vy * W] == _INF and cost[i + vy * W] != _INF:
+                    out.append((0, vy))
+            return out
+
+        if dx != 0 and dy != 0:
+            out = [(dx, 0), (0, dy), (dx, dy)]
+            if cost[i - dx] == _INF and cost[i - dx + dy * W] != _INF:
+                out.append((-dx, dy))
+            if cost[i - dy * W] == _INF and cost[i + dx - dy * W] != _INF:
+                out.append((dx, -dy))
+            return out
+
+        out = [(dx, dy)]
+        if dy == 0:
+            for vy in (-1, 1):
+                if cost[i + vy * W] == _INF and cost[i + dx + vy * W] != _INF:
+                    out.append((dx, vy))
+        else:
+            for vx in (-1, 1):
+                if cost[i + vx] == _INF and cost[i + vx + dy * W] != _INF:
+                    out.append((vx, dy))
+        return out
+
+    # Saut dans une direction (dispatch selon la connexité)
+    def _jump(self, i: int, d: Point, goal: int, diagonal: bool):
+        dx, dy = d
+        if diagonal:
+            if dx != 0 and dy != 0:
+                return self._jump_diagonal(i, dx, dy, goal)
+            return self._jump_straight(i, dx, dy, goal)
+        if dy == 0:
+            return self._jump_horizontal4(i, dx, goal)
+        return self._jump_vertical4(i, dy, goal)
+
+    # ----------------------------
+    # Recherche
+    # ----------------------------
+    # Cherche un chemin start -> goal (liste complète de cases, None si aucun)
+    # `table` : heuristique à plat optionnelle (indices de la grille élargie, ex : bornes ALT)
+    def find_path(
+        self, start: Point, goal: Point, allow_diagonal: bool = False, table: Optional[Sequence[float]] = None
+    ) -> Optional[List[Point]]:
+        start = (int(start[0]), int(start[1]))
+        goal = (int(goal[0]), int(goal[1]))
+        if not self.in_bounds(start) or not self.in_bounds(goal):
+            return None
+        if start == goal:
+            return [start]
+
+        s = self._index(start)
+        t = self._index(goal)
+        if self._cost[t] == _INF:
+            return None
+
+        gx, gy = goal
+        W = self.stride
+        diagonal = bool(allow_diagonal)
+
+        def heuristic(i: int) -> float:
+            if table is not None:
+                return table[i]
+            y, x = divmod(i, W)
+            dx = abs(x - 1 - gx)
+            dy = abs(y - 1 - gy)
+            if diagonal:
+                return dx + dy + (_SQRT2 - 2) * min(dx, dy)
+            return dx + dy
+
+        g_score = {s: 0.0}
+        came_from = {}
+        arrive = {s: None}
+        counter = 0
+        open_heap = [(heuristic(s), counter, s)]
+        closed = set()
+
+        while open_heap:
+            _, _, cur = heapq.heappop(open_heap)
+            if cur in closed:
+                continue
+            if cur == t:
+                return self._unfold(cur, came_from)
+            closed.add(cur)
+
+            g_cur = g_score[cur]
+            for d in self._directions(cur, arrive[cur], diagonal):
+                hit = self._jump(cur, d, t, diagonal)
+                if hit is None:
+                    continue
+                nxt, step_cost = hit
+                if nxt in closed:
+                    continue
+                tentative = g_cur + step_cost
+                if tentative < g_score.get(nxt, _INF):
+                    g_score[nxt] = tentative
+                    came_from[nxt] = cur
+                    arrive[nxt] = d
+                    counter += 1
+                    heapq.heappush(open_heap, (tentative + heuristic(nxt), counter, nxt))
+
+        return None
+
+    # Reconstruit le chemin case par case entre les points de saut
+    def _unfold(self, cur: int, came_from: dict) -> List[Point]:
+        jumps = [cur]
+        while cur in came_from:
+            cur = came_from[cur]
+            jumps.append(cur)
+        jumps.reverse()
+
+        out = [self._point(jumps[0])]
+        for a, b in zip(jumps, jumps[1:]):
+            ax, ay = self._point(a)
+            bx, by = self._point(b)
+            sx = (bx > ax) - (bx < ax)
+            sy = (by > ay) - (by < ay)
+            x, y = ax, ay
+            while (x, y) != (bx, by):
+                x += sx
+                y += sy
+                out.append((x, y))
+        return out
+
+
+class JumpPointSearch:
+    """
+    JumpPointGrid reconstruite paresseusement quand NavigationGrid.version change.
+    `cost_array(nav_grid)` fournit le tableau de coûts (par défaut nav_grid.cost
+    avec les cases non walkable bloquées).
+    """
+
+    # Initialise le solveur (la grille JPS est construite au premier appel)
+    def __init__(self, nav_grid, *, cost_array: Optional[Callable] = None):
+        self.nav_grid = nav_grid
+        self.cost_array = cost_array or navgrid_cost_array
+        self._grid: Optional[JumpPointGrid] = None
+        self._version = None
+        self.builds = 0
+
+    # Retourne la grille JPS à jour
+    def grid(self) -> JumpPointGrid:
+        version = getattr(self.nav_grid, "version", None)
+        if self._grid is None or version != self._version:
+            self._grid = JumpPointGrid(self.cost_array(self.nav_grid))
+            self._version = version
+            self.builds += 1
+        return self._grid
+
+    # Cherche un chemin start -> goal
+    def find_path(
+        self, start: Point, goal: Point, allow_diagonal: bool = False, table: Optional[Sequence[float]] = None
+    ) -> Optional[List[Point]]:
+        return self.grid().find_path(start, goal, allow_diagonal=allow_diagonal, table=table)
+
+
+# Coûts d'astar_navgrid : cost de la grille, inf si non walkable
+def navgrid_cost_array(nav_grid) -> np.ndarray:
+    cost = nav_grid.cost.astype(np.float64)
+    cost[nav_grid.walkable == 0] = np.inf
+    return cost
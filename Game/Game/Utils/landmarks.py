@@ -0,0 +1,254 @@
+# Game/Utils/landmarks.py
+"""
+Heuristique ALT (A*, Landmarks, Triangle inequality) pour l'A* de lane.
+
+Pour quelques cases repères L (ancres des lanes, cases d'attaque), on garde
+D_L = distances depuis L (Dijkstra, voisinage 4, coût = entrer dans la case).
+Pour un objectif t, l'inégalité triangulaire donne deux bornes inférieures
+de d(v, t) :
+  - avant   : D_L[t] - D_L[v]
+  - arrière : B_L[v] - B_L[t], avec B_L = D_L - cost + cost[L] (distance vers L,
+              la grille étant symétrique au coût d'entrée près)
+L'heuristique est le max de ces bornes (et de Manhattan * coût minimal),
+précalculée pour tout t demandé en une table à plat (indices CostGrid).
+
+Les bornes restent valides (et cohérentes) tant que chaque D_L est un
+potentiel réalisable : D_L[w] <= D_L[u] + cost[w] pour toute arête u -> w.
+  - coût qui augmente : rien à faire (bornes seulement moins serrées)
+  - case rouverte, ou quelques baisses : relaxation Dijkstra depuis ces cases
+  - baisses nombreuses, ou mêlées à trop de hausses (tempête) : k * D_L reste
+    réalisable, avec k le plus petit rapport nouveau / ancien coût ; les
+    champs sont multipliés par k
+Jamais de reconstruction complète dans update() : les champs devenus trop
+lâches sont recalculés par tranches (refine, une tranche par frame), et les
+champs exacts déjà calculés pour une grille de coûts sont mémorisés, si bien
+qu'une fin de tempête retrouve directement les bornes d'avant.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from Game.Utils.astar_core import CostGrid
+
+Point = Tuple[int, int]
+
+_INF = float("inf")
+
+
+class LandmarkHeuristic:
+    """Champs de distance des repères + tables ALT par objectif."""
+
+    # Calcule les champs de distance des repères valides (dans la grille, franchissables)
+    def __init__(self, grid: CostGrid, landmarks: Iterable[Point], *, rebuild_ratio: float = 0.1,
+                 memo_size: int = 4):
+        self.grid = grid
+        self.rebuild_ratio = float(rebuild_ratio)
+        self.memo_size = max(0, int(memo_size))
+        self.landmarks: List[Point] = []
+        for p in landmarks:
+            x, y = int(p[0]), int(p[1])
+            if grid.in_bounds(x, y) and grid.cost[grid.index(x, y)] != _INF and (x, y) not in self.landmarks:
+                self.landmarks.append((x, y))
+
+        self._fields: List[List[float]] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._cost = np.array(grid.cost)
+        self._raised = 0
+        # Objectif -> table à plat
+        self._tables: Dict[Point, List[float]] = {}
+        # Champs exacts par grille de coûts (octets de cost -> champs)
+        self._memo: Dict[bytes, List[List[float]]] = {}
+        # Repères dont le champ n'est plus qu'une borne, et recalcul en cours
+        self._stale: List[int] = []
+        self._refining = None
+        # Statistiques
+        self.full_builds = 0
+        self.repairs = 0
+        self.restores = 0
+        self.refined = 0
+        self._build_all()
+
+    # Dijkstra complet depuis src (indice à plat)
+    def _dijkstra(self, src: int) -> List[float]:
+        dist = [_INF] * len(self.grid.cost)
+        for _ in self._dijkstra_steps(dist, src, 0):
+            pass
+        return dist
+
+    # Dijkstra depuis src dans dist, rend la main toutes les `budget` extractions (0 = jamais)
+    def _dijkstra_steps(self, dist: List[float], src: int, budget: int):
+        cost = self.grid.cost
+        offsets = [off for off, _, _, _ in self.grid.offsets4]
+        dist[src] = 0.0
+        heap = [(0.0, src)]
+        pops = 0
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            pops += 1
+            if pops == budget:
+                pops = 0
+                yield
+            for off in offsets:
+                v = u + off
+                nd = d + cost[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+
+    # Relaxation depuis des cases dont le coût a baissé (le champ ne fait que diminuer)
+    def _relax(self, dist: List[float], cells: Iterable[int]):
+        cost = self.grid.cost
+        offsets = [off for off, _, _, _ in self.grid.offsets4]
+        heap = []
+        for v in cells:
+            c = cost[v]
+            if c == _INF:
+                continue
+            best = min(dist[v + off] for off in offsets) + c
+            if best < dist[v]:
+                dist[v] = best
+                heap.append((best, v))
+        heapq.heapify(heap)
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for off in offsets:
+                v = u + off
+                nd = d + cost[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+
+    # Reconstruit tous les champs
+    def _build_all(self):
+        grid = self.grid
+        self._fields = [self._dijkstra(grid.index(x, y)) for x, y in self.landmarks]
+        self._raised = 0
+        self.full_builds += 1
+        self._remember()
+        self._changed()
+
+    # Mémorise les champs (exacts) de la grille de coûts courante
+    def _remember(self):
+        if self.memo_size == 0:
+            return
+        key = self._cost.tobytes()
+        self._memo.pop(key, None)
+        while len(self._memo) >= self.memo_size:
+            del self._memo[next(iter(self._memo))]
+        self._memo[key] = [list(f) for f in self._fields]
+
+    # Les bornes ont changé : tables à recalculer
+    def _changed(self):
+        self._matrix = np.array(self._fields) if self._fields else None
+        self._tables.clear()
+
+    # Met à jour les champs pour une nouvelle grille de coûts (mêmes dimensions)
+    def update(self, grid: CostGrid):
+        new_cost = np.array(grid.cost)
+        self.grid = grid
+        changed = np.flatnonzero(new_cost != self._cost)
+        old_cost, self._cost = self._cost, new_cost
+        if len(changed) == 0:
+            return
+        # Recalcul en cours fait sur l'ancienne grille : abandonné
+        self._refining = None
+
+        # Grille de coûts déjà vue (fin de tempête) : champs exacts retrouvés
+        exact = self._memo.get(new_cost.tobytes())
+        if exact is not None:
+            self._fields = [list(f) for f in exact]
+            self._stale = []
+            self._raised = 0
+            self.restores += 1
+            self._changed()
+            return
+
+        old = old_cost[changed]
+        new = new_cost[changed]
+        finite = np.isfinite(old) & np.isfinite(new)
+        lowered = changed[finite & (new < old)]
+        opened = changed[~np.isfinite(old) & np.isfinite(new)]
+        self._raised += int(np.count_nonzero(new > old))
+        limit = self.rebuild_ratio * grid.width * grid.height
+
+        loose = self._raised > limit or len(lowered) > limit
+        if len(lowered) and loose:
+            # Champs recalculés de toute façon : mise à l'échelle plutôt que relaxation
+            k = float((new[finite] / old[finite]).min())
+            self._fields = (np.array(self._fields) * k).tolist()
+            cells = opened.tolist()
+        else:
+            cells = lowered.tolist() + opened.tolist()
+        if loose:
+            self._stale = list(range(len(self.landmarks)))
+
+        if cells:
+            for dist in self._fields:
+                self._relax(dist, cells)
+        if cells or (len(lowered) and loose):
+            self.repairs += 1
+            if not self._stale and self._raised == 0:
+                self._remember()
+            self._changed()
+
+    # Recalcule par tranches les champs devenus des bornes lâches ; False si rien à faire
+    def refine(self, max_pops: int = 2000) -> bool:
+        if not self._stale:
+            return False
+        if self._refining is None:
+            i = self._stale[0]
+            dist = [_INF] * len(self.grid.cost)
+            steps = self._dijkstra_steps(dist, self.grid.index(*self.landmarks[i]), max(1, int(max_pops)))
+            self._refining = (i, dist, steps)
+        i, dist, steps = self._refining
+        if next(steps, True) is None:
+            return True
+
+        self._refining = None
+        self._stale.pop(0)
+        self._fields[i] = dist
+        self.refined += 1
+        if not self._stale:
+            self._raised = 0
+            self._remember()
+        self._changed()
+        return True
+
+    # Table ALT à plat vers goal, en cache (None si aucun repère)
+    def table(self, goal: Point) -> Optional[List[float]]:
+        goal = (int(goal[0]), int(goal[1]))
+        if self._matrix is None or not self.grid.in_bounds(*goal):
+            return None
+        table = self._tables.get(goal)
+        if table is None:
+            table = self._compute(goal).tolist()
+            self._tables[goal] = table
+        return table
+
+    # Max des bornes avant / arrière de chaque repère, et de Manhattan
+    def _compute(self, goal: Point) -> np.ndarray:
+        grid = self.grid
+        t = grid.index(*goal)
+        D = self._matrix
+        cost = self._cost
+        Dt = D[:, t][:, None]
+
+        with np.errstate(invalid="ignore"):
+            forward = Dt - D
+            backward = (D - cost) - (Dt - cost[t])
+        forward[~np.isfinite(forward)] = 0.0
+        backward[~np.isfinite(backward)] = 0.0
+
+        finite = cost[np.isfinite(cost)]
+        min_step = float(finite.min()) if finite.size else 1.0
+        ys, xs = np.divmod(np.arange(len(cost)), grid.stride)
+        manhattan = (np.abs(xs - 1 - goal[0]) + np.abs(ys - 1 - goal[1])) * min_step
+
+        return np.maximum(np.maximum(forward.max(axis=0), backward.max(axis=0)), manhattan)
@@ -1,14 +1,45 @@
 # Game/App/utils/lane_pathfinder.py
 """Lane pathfinding utilities for Antique War."""
 
-import heapq
+import numpy as np
+
+from Game.Map.connectivity import ConnectivityIndex
+from Game.Utils.astar_core import CostGrid, find_path
+from Game.Utils.path_cache import PathCache, cached_path
+from Game.Utils.jump_point import JumpPointSearch
+from Game.Utils.landmarks import LandmarkHeuristic
 
 
 class LanePathfinder:
     """Calcul des chemins A* et des routes de lanes."""
 
-    def __init__(self, app):
+    def __init__(self, app, *, cache_size: int = 128, solver: str = "astar"):
         self.app = app
+        # "astar" (cœur A*) ou "jps" (Jump Point Search)
+        self.solver = solver
+        self._jps = None
+        # Coûts de lane à plat pour le cœur A* (clé : grille, version)
+        self._cost_grid = None
+        self._cost_grid_key = (None, None)
+        # Composantes connexes des cases de lane (clé : grille, version)
+        self._components = None
+        self._components_key = (None, None)
+        # Heuristique ALT (repères = ancres des lanes), voir prepare_landmarks
+        self.landmarks = None
+        self._landmarks_grid = None
+        # Cache LRU des segments (vidé automatiquement quand la grille change)
+        self.path_cache = PathCache(cache_size) if cache_size > 0 else None
+        # Segments de lane encore valides : (départ, arrivée) -> chemin, voir _sync_segments
+        self._segments = {}
+        self._segments_grid = None
+        self._segments_cost = None
+        self._segments_key = (None, None)
+        # Segments par grille de coûts déjà vue (octets des coûts -> segments)
+        self._segments_memo = {}
+        self.segments_memo_size = 4
+        # Statistiques : segments repris / recherchés
+        self.segments_kept = 0
+        self.segments_searched = 0
 
     def cell_cost(self, x: int, y: int) -> float:
         """Coût d'une cellule pour le pathfinding."""
@@ -27,6 +58,33 @@ class LanePathfinder:
         """
         if not self.app.nav_grid:
             return []
+        start = (int(start[0]), int(start[1]))
+        goal = (int(goal[0]), int(goal[1]))
+        return cached_path(
+            self.path_cache, self.app.nav_grid, start, goal, False,
+            lambda: self._astar_uncached(start, goal),
+        )
+
+    def lane_cost_array(self, nav_grid) -> np.ndarray:
+        """Tableau des coûts de cell_cost (inf hors intérieur de la grille ou non walkable)."""
+        m = nav_grid.mult.astype(np.float64)
+        with np.errstate(divide="ignore"):
+            cost = np.where(m > 0.0, 1.0 / np.maximum(0.05, m), 999999.0)
+        cost[nav_grid.walkable == 0] = np.inf
+        cost[0, :] = cost[-1, :] = np.inf
+        cost[:, 0] = cost[:, -1] = np.inf
+        return cost
+
+    def _jps_search(self, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """Même recherche que l'A* de lane, via Jump Point Search."""
+        if self._jps is None or self._jps.nav_grid is not self.app.nav_grid:
+            self._jps = JumpPointSearch(self.app.nav_grid, cost_array=self.lane_cost_array)
+        landmarks = self._synced_landmarks(goal)
+        table = landmarks.table(goal) if landmarks is not None else None
+        return self._jps.find_path(start, goal, table=table) or []
+
+    def _astar_uncached(self, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """Corps de l'A* de lane (sans cache)."""
         if start == goal:
             return [start]
 
@@ -42,60 +100,57 @@ class LanePathfinder:
         if not self.app.nav_grid.is_walkable(gx, gy):
             return []
 
-        def h_manh(a: tuple[int, int], b: tuple[int, int]) -> float:
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-        open_heap = []
-        heapq.heappush(open_heap, (0.0, 0.0, (sx, sy)))
-
-        came = {}
-        gscore = {(sx, sy): 0.0}
-        closed = set()
-
-        while open_heap:
-            _f, g, cur = heapq.heappop(open_heap)
-            if cur in closed:
-                continue
-
-            if cur == (gx, gy):
-                out = [cur]
-                while cur in came:
-                    cur = came[cur]
-                    out.append(cur)
-                out.reverse()
-                return out
-
-            closed.add(cur)
-            cx, cy = cur
-
-            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nx = cx + dx
-                ny = cy + dy
-                if nx <= 0 or nx >= w - 1 or ny <= 0 or ny >= h - 1:
-                    continue
-                if not self.app.nav_grid.is_walkable(nx, ny):
-                    continue
-
-                ng = g + self.cell_cost(nx, ny)
-                if (nx, ny) not in gscore or ng < gscore[(nx, ny)]:
-                    gscore[(nx, ny)] = ng
-                    came[(nx, ny)] = (cx, cy)
-                    nf = ng + h_manh((nx, ny), (gx, gy))
-                    heapq.heappush(open_heap, (nf, ng, (nx, ny)))
-
-        return []
+        # Goal enfermé : échec immédiat au lieu d'explorer toute la zone atteignable
+        if not self.lane_connectivity().reachable(start, goal):
+            return []
 
-    def compute_lane_route(self, lane_idx: int) -> list[tuple[int, int]]:
+        if self.solver == "jps":
+            return self._jps_search(start, goal)
+
+        landmarks = self._synced_landmarks(goal)
+        table = landmarks.table(goal) if landmarks is not None else None
+        return find_path(self._lane_cost_grid(), start, goal, heuristic=table or "manhattan") or []
+
+    def _lane_cost_grid(self) -> CostGrid:
+        """CostGrid de lane_cost_array, reconstruite quand la grille change."""
+        nav = self.app.nav_grid
+        version = getattr(nav, "version", None)
+        if (
+            self._cost_grid is None
+            or self._cost_grid_key[0] is not nav
+            or version is None
+            or self._cost_grid_key[1] != version
+        ):
+            self._cost_grid = CostGrid(self.lane_cost_array(nav))
+            self._cost_grid_key = (nav, version)
+        return self._cost_grid
+
+    def lane_connectivity(self) -> ConnectivityIndex:
+        """Composantes des cases de lane (intérieur + walkable), mises à jour après une écriture."""
+        nav = self.app.nav_grid
+        version = getattr(nav, "version", None)
+        if self._components is not None and self._components_key[0] is nav and version is not None:
+            if self._components_key[1] == version:
+                return self._components
+            self._components.update(self._lane_mask(nav))
+        else:
+            self._components = ConnectivityIndex(self._lane_mask(nav))
+        self._components_key = (nav, version)
+        return self._components
+
+    @staticmethod
+    def _lane_mask(nav_grid) -> np.ndarray:
+        """Cases utilisables par l'A* de lane (intérieur de la grille + walkable)."""
+        mask = nav_grid.walkable != 0
+        mask[0, :] = mask[-1, :] = False
+        mask[:, 0] = mask[:, -1] = False
+        return mask
+
+    def lane_anchors(self, lane_idx: int):
         """
-        Calcule le chemin A* complet d'une lane (pyramide joueur → pyramide ennemie).
-        
-        - Lane 0: HAUT des pyramides
-        - Lane 1: MILIEU (côtés des pyramides)
-        - Lane 2: BAS des pyramides
+        Points (départ, entrée de lane, sortie de lane, arrivée) d'une lane,
+        ou None si l'un d'eux n'a pas de case walkable atteignable.
         """
-        if not self.app.nav_grid:
-            return []
-
         lane_idx = max(0, min(2, int(lane_idx)))
         lane_y = int(self.app.lanes_y[lane_idx])
 
@@ -137,12 +192,38 @@ class LanePathfinder:
         g = grid_utils.find_walkable_near(end_anchor[0], end_anchor[1], max_r=12)
 
         if not s or not e or not x or not g:
+            return None
+
+        # Points enfermés (zones interdites) : case atteignable depuis s la plus proche
+        components = self.lane_connectivity()
+        e = components.nearest_reachable(e, s)
+        x = components.nearest_reachable(x, s)
+        g = components.nearest_reachable(g, s)
+        if not e or not x or not g:
+            return None
+        return s, e, x, g
+
+    def compute_lane_route(self, lane_idx: int) -> list[tuple[int, int]]:
+        """
+        Calcule le chemin A* complet d'une lane (pyramide joueur → pyramide ennemie).
+        
+        - Lane 0: HAUT des pyramides
+        - Lane 1: MILIEU (côtés des pyramides)
+        - Lane 2: BAS des pyramides
+        """
+        if not self.app.nav_grid:
+            return []
+
+        anchors = self.lane_anchors(lane_idx)
+        if anchors is None:
             return []
+        s, e, x, g = anchors
 
-        # Construire le chemin en 3 segments
-        p1 = self.astar(s, e)
-        p2 = self.astar(e, x)
-        p3 = self.astar(x, g)
+        # Construire le chemin en 3 segments (repris si toujours valides)
+        self._sync_segments()
+        p1 = self._segment(s, e)
+        p2 = self._segment(e, x)
+        p3 = self._segment(x, g)
 
         # Assembler le chemin complet
         out = []
@@ -155,11 +236,98 @@ class LanePathfinder:
 
         return out
 
+    def _sync_segments(self):
+        """
+        Réparation incrémentale après un changement de terrain :
+        - grille de coûts déjà vue (fin de tempête) : segments mémorisés repris
+        - coûts seulement en hausse (cases bloquées comprises) : un segment dont
+          aucune case n'a changé reste optimal, les autres chemins n'ayant pu
+          que s'allonger ; seuls les segments touchés sont recherchés
+        - sinon (baisse de coût ou case rouverte) : tous les segments recherchés
+        """
+        grid = self._lane_cost_grid()
+        if grid is self._segments_grid:
+            return
+        cost = np.array(grid.cost)
+        raw = cost.tobytes()
+        key = (self.app.nav_grid, self.solver)
+        if self._segments_key != key:
+            self._segments_memo = {}
+            segments = {}
+        else:
+            segments = self._segments_memo.get(raw)
+            if segments is None:
+                old = self._segments_cost
+                changed = np.flatnonzero(cost != old)
+                if len(changed) and np.all(cost[changed] > old[changed]):
+                    touched = set(changed.tolist())
+                    segments = {
+                        k: p for k, p in self._segments.items()
+                        if not any(grid.index(px, py) in touched for px, py in p)
+                    }
+                else:
+                    segments = {} if len(changed) else self._segments
+        self._segments = segments
+        self._segments_grid = grid
+        self._segments_cost = cost
+        self._segments_key = key
+        # Même dict que l'entrée mémorisée : les segments recherchés ensuite y entrent aussi
+        memo = self._segments_memo
+        memo.pop(raw, None)
+        while len(memo) >= max(1, self.segments_memo_size):
+            del memo[next(iter(memo))]
+        memo[raw] = segments
+
+    def _segment(self, start: tuple[int, int], goal: tuple[int, int]) -> list[tuple[int, int]]:
+        """Segment de lane : repris s'il est toujours valide, sinon A*."""
+        key = (start, goal)
+        path = self._segments.get(key)
+        if path is not None:
+            self.segments_kept += 1
+            return path
+        path = self.astar(start, goal)
+        self._segments[key] = path
+        self.segments_searched += 1
+        return path
+
+    def prepare_landmarks(self):
+        """
+        Repères ALT = ancres des 3 lanes (ce sont les objectifs des segments).
+        Construits une fois par grille ; ensuite mis à jour après chaque écriture.
+        """
+        nav = self.app.nav_grid
+        if not nav or (self.landmarks is not None and self._landmarks_grid is nav):
+            return
+        points = []
+        for lane_idx in (0, 1, 2):
+            anchors = self.lane_anchors(lane_idx)
+            if anchors:
+                points.extend(anchors)
+        self.landmarks = LandmarkHeuristic(self._lane_cost_grid(), points)
+        self._landmarks_grid = nav
+
+    def _synced_landmarks(self, goal: tuple[int, int]):
+        """Repères à jour pour la grille courante (None si pas de repères)."""
+        if self.landmarks is None or self._landmarks_grid is not self.app.nav_grid:
+            return None
+        grid = self._lane_cost_grid()
+        if self.landmarks.grid is not grid:
+            self.landmarks.update(grid)
+        return self.landmarks
+
+    def refine_landmarks(self, max_pops: int = 2000):
+        """Avance d'une tranche le recalcul des repères devenus lâches (une fois par frame)."""
+        landmarks = self._synced_landmarks(None)
+        if landmarks is not None:
+            landmarks.refine(max_pops)
+
     def recalculate_all_lanes(self):
         """Recalcule tous les chemins de lanes (joueur ET ennemi)."""
         if not self.app.nav_grid:
             return
-        
+
+        self.prepare_landmarks()
+
         # Chemins du joueur (gauche → droite)
         self.app.lane_paths = [
             self.compute_lane_route(0),
@@ -0,0 +1,142 @@
+# Game/Utils/lane_route.py
+"""
+Route de lane partagée (immuable) : coordonnées compactes d'un chemin.
+
+Une seule instance par lane ; chaque unité n'en garde qu'une référence
+dans son Path, avec un indice de départ et un sens de lecture (+1 joueur,
+-1 ennemi qui parcourt la lane à l'envers).
+
+Les unités suivent les points de passage (waypoints) : toutes les cases,
+ou seulement les coins et frontières de terrain si la route est simplifiée
+(voir path_simplify). Les cases complètes restent indexées pour le
+rattachement.
+
+Index de rattachement (point de la route le plus proche d'une position) :
+  - case -> (premier, dernier) indice sur la route : O(1) si la case est sur la route
+  - grille de seaux BUCKET x BUCKET pour les positions hors route : anneaux de
+    seaux autour de la position, arrêt dès qu'aucun seau plus loin ne peut battre
+    la meilleure distance de Manhattan
+Même résultat que le balayage linéaire (distance minimale, puis premier point
+dans le sens de lecture).
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from Game.Utils.path_simplify import corner_indices
+
+Point = Tuple[int, int]
+
+# Taille (en cases) d'un seau de la grille spatiale
+BUCKET = 4
+
+
+class LaneRoute:
+    """Coordonnées d'un chemin de lane (tableaux d'entiers, lecture seule)."""
+
+    __slots__ = ("xs", "ys", "waypoints", "_cells", "_buckets", "_bounds")
+
+    # Copie les points (x, y) dans deux tableaux compacts et construit l'index ;
+    # simplify : ne garder comme points de passage que les coins (et frontières de mult_at)
+    def __init__(self, points: Iterable[Point], *, simplify: bool = False,
+                 mult_at: Optional[Callable[[int, int], float]] = None):
+        pts = [(int(p[0]), int(p[1])) for p in points]
+        self.xs = array("i", (p[0] for p in pts))
+        self.ys = array("i", (p[1] for p in pts))
+        # Indices (croissants) des cases qui sont des points de passage
+        self.waypoints = array("i", corner_indices(pts, mult_at) if simplify else range(len(pts)))
+
+        # Case -> (premier indice, dernier indice)
+        self._cells: Dict[Point, Tuple[int, int]] = {}
+        # Seau (bx, by) -> indices des points de la route dans ce seau
+        self._buckets: Dict[Point, List[int]] = {}
+        for i, p in enumerate(pts):
+            first = self._cells.get(p)
+            self._cells[p] = (i, i) if first is None else (first[0], i)
+            self._buckets.setdefault((p[0] // BUCKET, p[1] // BUCKET), []).append(i)
+
+        # Seaux extrêmes (limite des anneaux de recherche)
+        if self._buckets:
+            bxs = [b[0] for b in self._buckets]
+            bys = [b[1] for b in self._buckets]
+            self._bounds = (min(bxs), min(bys), max(bxs), max(bys))
+        else:
+            self._bounds = None
+
+    # Nombre de cases
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    # Même route (cases et points de passage)
+    def same_as(self, other: Optional["LaneRoute"]) -> bool:
+        return (other is not None and self.xs == other.xs and self.ys == other.ys
+                and self.waypoints == other.waypoints)
+
+    # Case d'indice i (indice dans la route, pas dans une vue)
+    def point(self, i: int) -> Point:
+        return (self.xs[i], self.ys[i])
+
+    # Point de passage d'indice k
+    def waypoint(self, k: int) -> Point:
+        i = self.waypoints[k]
+        return (self.xs[i], self.ys[i])
+
+    # Nombre de points de passage lisibles depuis offset dans le sens step
+    def span(self, offset: int, step: int) -> int:
+        n = len(self.waypoints)
+        if not 0 <= offset < n:
+            return 0
+        return n - offset if step > 0 else offset + 1
+
+    # Indice du premier point de passage d'une vue complète dans le sens step
+    def first(self, step: int) -> int:
+        return 0 if step > 0 else len(self.waypoints) - 1
+
+    # Premier point de passage strictement après la case i dans le sens step (None si aucun)
+    def next_waypoint(self, i: int, step: int = 1) -> Optional[int]:
+        if step > 0:
+            k = bisect_right(self.waypoints, i)
+            return k if k < len(self.waypoints) else None
+        k = bisect_left(self.waypoints, i) - 1
+        return k if k >= 0 else None
+
+    # Indice de la case sur la route (premier dans le sens step), None si absente
+    def index_of(self, cell: Point, step: int = 1) -> Optional[int]:
+        hit = self._cells.get((int(cell[0]), int(cell[1])))
+        if hit is None:
+            return None
+        return hit[0] if step > 0 else hit[1]
+
+    # Indice (dans la route) du point le plus proche de pos en Manhattan ;
+    # à égalité, le premier rencontré dans le sens step
+    def closest(self, pos: Point, step: int = 1) -> int:
+        px, py = int(pos[0]), int(pos[1])
+        on_path = self.index_of((px, py), step)
+        if on_path is not None:
+            return on_path
+        if self._bounds is None:
+            return 0
+
+        xs, ys = self.xs, self.ys
+        buckets = self._buckets
+        qbx, qby = px // BUCKET, py // BUCKET
+        bx0, by0, bx1, by1 = self._bounds
+        # Au-delà de cet anneau, plus aucun seau occupé
+        max_ring = max(abs(qbx - bx0), abs(qbx - bx1), abs(qby - by0), abs(qby - by1))
+
+        best_i = 0
+        best_key = None
+        for ring in range(max_ring + 1):
+            for by in range(qby - ring, qby + ring + 1):
+                edge = by == qby - ring or by == qby + ring
+                for bx in (range(qbx - ring, qbx + ring + 1) if edge else (qbx - ring, qbx + ring)):
+                    for i in buckets.get((bx, by), ()):
+                        key = (abs(xs[i] - px) + abs(ys[i] - py), i * step)
+                        if best_key is None or key < best_key:
+                            best_key, best_i = key, i
+            # Anneau suivant : distance >= ring * BUCKET + 1
+            if best_key is not None and best_key[0] <= ring * BUCKET:
+                break
+        return best_i
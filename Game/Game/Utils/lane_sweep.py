@@ -0,0 +1,84 @@
+# Game/Utils/lane_sweep.py
+"""
+Listes triées par X, par clé (équipe, lane), gardées d'une frame à l'autre.
+
+Sur une lane, les unités sont presque alignées en X et leur ordre change
+très peu entre deux frames : on replace chaque entité à son rang de la
+frame précédente (O(n)), puis un tri par insertion corrige les quelques
+dépassements (O(n + déplacements)). Les requêtes lisent ensuite une fenêtre
+[x0, x1] par dichotomie, ou balayent deux listes triées avec deux pointeurs.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class SortedXIndex:
+    """Listes d'objets triées par X, une par clé, réordonnées par insertion."""
+
+    # Crée un index vide
+    def __init__(self):
+        # Clé -> entité -> rang à la frame précédente
+        self._rank: Dict[Any, Dict[int, int]] = {}
+        self._pending: Dict[Any, List[Tuple[float, int, Any]]] = {}
+        self.xs: Dict[Any, List[float]] = {}
+        self.items: Dict[Any, List[Any]] = {}
+        # Décalages effectués par le tri par insertion (dernière frame)
+        self.moves = 0
+
+    # Commence une nouvelle frame
+    def begin(self):
+        self._pending = {}
+
+    # Ajoute l'entité eid (objet item, abscisse x) sous la clé key
+    def add(self, key: Any, eid: int, x: float, item: Any):
+        self._pending.setdefault(key, []).append((float(x), int(eid), item))
+
+    # Trie chaque liste en partant de l'ordre de la frame précédente
+    def finish(self):
+        ranks: Dict[Any, Dict[int, int]] = {}
+        self.xs = {}
+        self.items = {}
+        moves = 0
+        for key, entries in self._pending.items():
+            prev = self._rank.get(key, {})
+            slots: List[Any] = [None] * len(prev)
+            tail = []
+            for e in entries:
+                r = prev.get(e[1])
+                if r is None:
+                    tail.append(e)
+                else:
+                    slots[r] = e
+            arr = [e for e in slots if e is not None]
+            arr.extend(tail)
+
+            # Tri par insertion (stable) : quasi linéaire sur une liste presque triée
+            for i in range(1, len(arr)):
+                cur = arr[i]
+                x = cur[0]
+                j = i - 1
+                while j >= 0 and arr[j][0] > x:
+                    arr[j + 1] = arr[j]
+                    j -= 1
+                moves += i - 1 - j
+                arr[j + 1] = cur
+
+            ranks[key] = {e[1]: i for i, e in enumerate(arr)}
+            self.xs[key] = [e[0] for e in arr]
+            self.items[key] = [e[2] for e in arr]
+        self._rank = ranks
+        self.moves = moves
+
+    # Objets de la clé key dont l'abscisse est dans [x0, x1]
+    def window(self, key: Any, x0: float, x1: float) -> Iterator[Any]:
+        xs = self.xs.get(key)
+        if not xs:
+            return
+        items = self.items[key]
+        i = bisect_left(xs, x0)
+        n = len(xs)
+        while i < n and xs[i] <= x1:
+            yield items[i]
+            i += 1
@@ -0,0 +1,101 @@
+# Game/Utils/path_cache.py
+"""
+Cache LRU de chemins A*.
+
+Clé : (start, goal, diagonal, version de la grille).
+Dès que NavigationGrid.version change (set_cell, opérations de masse),
+toutes les entrées sont jetées : un chemin en cache est toujours valide
+pour la grille courante.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+Point = Tuple[int, int]
+
+# Sentinelle publique de PathCache.get : "absent du cache", à distinguer de "aucun chemin" (None)
+MISSING = object()
+
+
+class PathCache:
+    """LRU borné avec compteurs hit / miss / eviction (télémétrie)."""
+
+    # Initialise le cache avec sa capacité maximale
+    def __init__(self, capacity: int = 256):
+        self.capacity = max(1, int(capacity))
+        self._entries: OrderedDict = OrderedDict()
+        self._version = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    # Vide le cache si la grille a changé de version
+    def _sync_version(self, version):
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._version = version
+
+    # Retourne le chemin en cache (copie) ou MISSING
+    def get(self, start: Point, goal: Point, diagonal: bool, version):
+        self._sync_version(version)
+        key = (start, goal, bool(diagonal), version)
+        path = self._entries.get(key, MISSING)
+        if path is MISSING:
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return None if path is None else list(path)
+
+    # Stocke un chemin (ou None si aucun chemin) et évince le plus ancien si plein
+    def put(self, start: Point, goal: Point, diagonal: bool, version, path: Optional[List[Point]]):
+        self._sync_version(version)
+        key = (start, goal, bool(diagonal), version)
+        self._entries[key] = None if path is None else tuple(path)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # Vide le cache
+    def clear(self):
+        self._entries.clear()
+
+    # Taux de hit (0..1)
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    # Compteurs pour télémétrie / HUD
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Lit un chemin dans le cache ou le calcule avec solve() puis le stocke
+def cached_path(cache: Optional[PathCache], nav_grid, start: Point, goal: Point, diagonal: bool, solve):
+    if cache is None:
+        return solve()
+    version = getattr(nav_grid, "version", None)
+    path = cache.get(start, goal, diagonal, version)
+    if path is not MISSING:
+        return path
+    path = solve()
+    cache.put(start, goal, diagonal, version, path)
+    return path
@@ -0,0 +1,167 @@
+# Game/Utils/path_scheduler.py
+"""
+File de requêtes de chemin traitée sous budget de temps par frame.
+
+Chaque frame, les requêtes sont servies par priorité décroissante (puis par
+ordre d'arrivée) tant que le budget (ms) n'est pas épuisé ; le reste attend la
+frame suivante. Au moins une requête est servie par frame pour garantir la
+progression, même avec un budget très bas.
+
+Télémétrie (HUD debug) : profondeur de file, requêtes servies / temps passé à
+la dernière frame, attente moyenne et maximale (frames et secondes de jeu)
+sur une fenêtre glissante.
+"""
+from __future__ import annotations
+
+import heapq
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Tuple
+
+Point = Tuple[int, int]
+
+
+@dataclass
+class _Pending:
+    """Requête en attente (start mis à jour tant qu'elle n'est pas servie)."""
+    start: Point
+    goal: Point
+    priority: float
+    seq: int
+    submitted_time: float
+    submitted_frame: int
+
+
+class PathRequestScheduler:
+    """File de priorité de requêtes (une par entité) avec budget par frame."""
+
+    # Initialise la file (frame_budget_ms <= 0 : pas de limite)
+    def __init__(self, frame_budget_ms: float = 2.0, *, clock: Callable[[], float] = time.perf_counter, wait_window: int = 64):
+        self.frame_budget_ms = float(frame_budget_ms)
+        self.clock = clock
+
+        self._heap: list = []
+        self._pending: Dict[int, _Pending] = {}
+        self._seq = 0
+
+        # Télémétrie
+        self.last_served = 0
+        self.last_frame_ms = 0.0
+        self.total_served = 0
+        self._waits: deque = deque(maxlen=max(1, int(wait_window)))
+
+    # Ajoute ou met à jour la requête d'une entité
+    def submit(self, ent: int, start: Point, goal: Point, *, priority: float = 0.0, now: float = 0.0, frame: int = 0) -> bool:
+        """
+        Retourne True si la requête est nouvelle (ou son goal / sa priorité a changé).
+        Une requête déjà en file garde son ancienneté ; seul son start est rafraîchi.
+        """
+        cur = self._pending.get(ent)
+        if cur is not None and cur.goal == goal and cur.priority == priority:
+            cur.start = start
+            return False
+
+        self._seq += 1
+        submitted_time = cur.submitted_time if cur is not None else now
+        submitted_frame = cur.submitted_frame if cur is not None else frame
+        self._pending[ent] = _Pending(start, goal, float(priority), self._seq, submitted_time, submitted_frame)
+        heapq.heappush(self._heap, (-float(priority), self._seq, ent))
+        return True
+
+    # Vérifie si une entité a une requête en attente
+    def is_pending(self, ent: int) -> bool:
+        return ent in self._pending
+
+    # Retire la requête d'une entité (entrée du tas ignorée au prochain drain)
+    def cancel(self, ent: int):
+        self._pending.pop(ent, None)
+
+    # Sert les requêtes sous budget : itère (ent, start, goal)
+    def drain(self, *, now: float = 0.0, frame: int = 0) -> Iterator[Tuple[int, Point, Point]]:
+        """
+        Le temps passé par l'appelant entre deux éléments (résolution du chemin)
+        est compté dans le budget : consommer l'itérateur jusqu'au bout.
+        """
+        budget = self.frame_budget_ms
+        clock = self.clock
+        t0 = clock()
+        served = 0
+
+        while self._heap:
+            if served and budget > 0 and (clock() - t0) * 1000.0 >= budget:
+                break
+            _, seq, ent = heapq.heappop(self._heap)
+            req = self._pending.get(ent)
+            if req is None or req.seq != seq:
+                continue
+            del self._pending[ent]
+
+            served += 1
+            self._waits.append((frame - req.submitted_frame, now - req.submitted_time))
+            yield ent, req.start, req.goal
+
+        self.last_served = served
+        self.total_served += served
+        self.last_frame_ms = (clock() - t0) * 1000.0
+
+    # Nombre de requêtes en attente
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    # Compteurs pour télémétrie / HUD
+    def stats(self) -> dict:
+        waits = list(self._waits)
+        frames = [w[0] for w in waits]
+        seconds = [w[1] for w in waits]
+        return {
+            "queue_depth": self.queue_depth,
+            "last_served": self.last_served,
+            "last_frame_ms": self.last_frame_ms,
+            "total_served": self.total_served,
+            "avg_wait_frames": sum(frames) / len(frames) if frames else 0.0,
+            "max_wait_frames": max(frames) if frames else 0,
+            "avg_wait_s": sum(seconds) / len(seconds) if seconds else 0.0,
+            "max_wait_s": max(seconds) if seconds else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._pending)
+
+
+# Chemin en ligne droite start -> goal (4 ou 8-connexe), pour patienter
+def straight_line_path(start: Point, goal: Point, allow_diagonal: bool = False) -> List[Point]:
+    x, y = int(start[0]), int(start[1])
+    gx, gy = int(goal[0]), int(goal[1])
+    dx = abs(gx - x)
+    dy = abs(gy - y)
+    sx = 1 if gx > x else -1
+    sy = 1 if gy > y else -1
+    out = [(x, y)]
+
+    if allow_diagonal:
+        # Bresenham
+        err = dx - dy
+        while (x, y) != (gx, gy):
+            e2 = 2 * err
+            if e2 > -dy:
+                err -= dy
+                x += sx
+            if e2 < dx:
+                err += dx
+                y += sy
+            out.append((x, y))
+        return out
+
+    # 4-connexe : on avance sur l'axe le moins "en avance" sur la droite idéale
+    ix = iy = 0
+    while ix < dx or iy < dy:
+        if iy >= dy or (ix < dx and (0.5 + ix) * dy < (0.5 + iy) * dx):
+            x += sx
+            ix += 1
+        else:
+            y += sy
+            iy += 1
+        out.append((x, y))
+    return out
@@ -0,0 +1,62 @@
+# Game/Utils/path_simplify.py
+"""
+Simplification d'un chemin case par case en points de passage (coins).
+
+Une suite de pas axiaux identiques est réduite à ses extrémités : l'unité
+va en ligne droite d'un coin au suivant (mouvement toujours axial). Un pas
+diagonal ou de plus d'une case n'est jamais fusionné.
+
+Le terrain est conservé : TerrainEffectSystem lit la vitesse sur la case
+de GridPosition, qui ne change qu'à l'arrivée sur un point de passage.
+Une case est donc gardée dès que son multiplicateur diffère de celui d'une
+voisine sur le chemin ; entre deux points gardés, toutes les cases ont le
+même multiplicateur, dans les deux sens de parcours.
+"""
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Sequence, Tuple
+
+Point = Tuple[int, int]
+
+
+# Indices des points de passage d'un chemin (premier et dernier toujours gardés)
+def corner_indices(points: Sequence[Point], mult_at: Optional[Callable[[int, int], float]] = None) -> List[int]:
+    n = len(points)
+    if n <= 2:
+        return list(range(n))
+
+    keep = [0]
+    for i in range(1, n - 1):
+        ax, ay = points[i - 1]
+        bx, by = points[i]
+        cx, cy = points[i + 1]
+        dx, dy = bx - ax, by - ay
+        # Coin, ou pas non axial unitaire
+        if (dx, dy) != (cx - bx, cy - by) or abs(dx) + abs(dy) != 1:
+            keep.append(i)
+            continue
+        # Frontière de terrain
+        if mult_at is not None:
+            m = mult_at(bx, by)
+            if m != mult_at(ax, ay) or m != mult_at(cx, cy):
+                keep.append(i)
+    keep.append(n - 1)
+    return keep
+
+
+# Chemin réduit à ses points de passage
+def simplify_path(points: Sequence[Point], mult_at: Optional[Callable[[int, int], float]] = None) -> List[Point]:
+    return [points[i] for i in corner_indices(points, mult_at)]
+
+
+# Multiplicateur de vitesse d'une NavigationGrid (0 hors grille)
+def navgrid_mult(nav_grid) -> Callable[[int, int], float]:
+    mult = nav_grid.mult
+    w, h = int(nav_grid.width), int(nav_grid.height)
+
+    def mult_at(x: int, y: int) -> float:
+        if 0 <= x < w and 0 <= y < h:
+            return float(mult[y, x])
+        return 0.0
+
+    return mult_at
@@ -0,0 +1,128 @@
+# Game/Utils/projectile_pool.py
+"""
+Pool de projectiles en structure de tableaux (hors ECS).
+
+Chaque tir créait une entité esper à 4 composants, supprimée quelques
+frames plus tard : les dicts de composants d'esper tournaient sans arrêt.
+Ici les projectiles vivent dans des tableaux NumPy préalloués (position,
+vitesse, cible, équipe, dégâts, rayon de touche, durée de vie) avec une
+liste de cases libres ; déplacement et tests de touche sont vectorisés sur
+la tranche active [0, high).
+"""
+from __future__ import annotations
+
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+# Vitesse par défaut d'un projectile quasi immobile
+DEFAULT_SPEED = 12.0
+
+
+class ProjectilePool:
+    """Projectiles homing stockés colonne par colonne, cases réutilisées."""
+
+    # Préalloue capacity projectiles (la capacité double si besoin)
+    def __init__(self, capacity: int = 256):
+        self.capacity = 0
+        self.high = 0
+        self._free: List[int] = []
+        self.x = self.y = self.vx = self.vy = np.zeros(0)
+        self.damage = self.hit_radius = self.ttl = np.zeros(0)
+        self.target = np.zeros(0, dtype=np.int64)
+        self.team = np.zeros(0, dtype=np.int64)
+        self.active = np.zeros(0, dtype=bool)
+        self._grow(max(1, int(capacity)))
+
+    # Agrandit tous les tableaux
+    def _grow(self, capacity: int):
+        old = self.capacity
+
+        def grown(arr, dtype):
+            out = np.zeros(capacity, dtype=dtype)
+            out[:old] = arr[:old]
+            return out
+
+        self.x = grown(self.x, float)
+        self.y = grown(self.y, float)
+        self.vx = grown(self.vx, float)
+        self.vy = grown(self.vy, float)
+        self.damage = grown(self.damage, float)
+        self.hit_radius = grown(self.hit_radius, float)
+        self.ttl = grown(self.ttl, float)
+        self.target = grown(self.target, np.int64)
+        self.team = grown(self.team, np.int64)
+        self.active = grown(self.active, bool)
+        self.capacity = capacity
+
+    # Nombre de projectiles actifs
+    def __len__(self) -> int:
+        return self.high - len(self._free)
+
+    # Ajoute un projectile, retourne sa case
+    def spawn(self, *, pos: Tuple[float, float], vel: Tuple[float, float], target_entity_id: int,
+              team_id: int, damage: float, hit_radius: float, ttl: float) -> int:
+        if self._free:
+            i = self._free.pop()
+        else:
+            if self.high >= self.capacity:
+                self._grow(self.capacity * 2)
+            i = self.high
+            self.high += 1
+        self.x[i], self.y[i] = pos
+        self.vx[i], self.vy[i] = vel
+        self.target[i] = int(target_entity_id)
+        self.team[i] = int(team_id)
+        self.damage[i] = float(damage)
+        self.hit_radius[i] = float(hit_radius)
+        self.ttl[i] = float(ttl)
+        self.active[i] = True
+        return i
+
+    # Libère des cases (tableau d'indices)
+    def release(self, idx: np.ndarray):
+        if len(idx) == 0:
+            return
+        self.active[idx] = False
+        self._free.extend(int(i) for i in idx)
+        # Cases libres en fin de tranche : on raccourcit la tranche active
+        if not self.active[: self.high].any():
+            self.high = 0
+            self._free.clear()
+
+    # Indices des projectiles actifs
+    def active_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.active[: self.high])
+
+    # Décrémente les durées de vie ; libère et retourne les projectiles expirés
+    def tick(self, dt: float) -> np.ndarray:
+        idx = self.active_indices()
+        if len(idx) == 0 or dt <= 0.0:
+            return idx[:0]
+        self.ttl[idx] = np.maximum(0.0, self.ttl[idx] - dt)
+        expired = idx[self.ttl[idx] == 0.0]
+        self.release(expired)
+        return expired
+
+    # Réoriente vers les cibles puis déplace (idx : projectiles qui volent encore)
+    def steer_and_move(self, idx: np.ndarray, tx: np.ndarray, ty: np.ndarray, dt: float):
+        if len(idx) == 0:
+            return
+        dx = tx - self.x[idx]
+        dy = ty - self.y[idx]
+        dist = np.hypot(dx, dy)
+        speed = np.hypot(self.vx[idx], self.vy[idx])
+        speed = np.where(speed < 1.0, DEFAULT_SPEED, speed)
+        steer = dist > 0.01
+        safe = np.where(steer, dist, 1.0)
+        vx = np.where(steer, dx / safe * speed, self.vx[idx])
+        vy = np.where(steer, dy / safe * speed, self.vy[idx])
+        self.vx[idx] = vx
+        self.vy[idx] = vy
+        self.x[idx] += vx * dt
+        self.y[idx] += vy * dt
+
+    # (x, y, équipe) des projectiles actifs, pour le rendu
+    def positions(self) -> Iterator[Tuple[float, float, int]]:
+        idx = self.active_indices()
+        return zip(self.x[idx].tolist(), self.y[idx].tolist(), self.team[idx].tolist())
@@ -0,0 +1,73 @@
+# Game/Utils/spatial_hash.py
+"""
+Hachage spatial sur grille uniforme, reconstruit à chaque frame.
+
+Les objets sont rangés par clé (l'équipe) puis par seau de taille
+cell_size. Avec cell_size = portée, tout objet à distance <= portée d'un
+point se trouve dans les 3x3 seaux autour de ce point : une requête ne lit
+que ces seaux au lieu de toutes les entités.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterator, List, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SpatialHash:
+    """Seaux (cx, cy) -> objets, partitionnés par clé."""
+
+    # Crée un index vide (cell_size en cases, > 0)
+    def __init__(self, cell_size: float):
+        self.cell_size = max(1e-6, float(cell_size))
+        self._inv = 1.0 / self.cell_size
+        self._buckets: Dict[Any, Dict[Cell, List[Any]]] = {}
+        self._count = 0
+
+    # Vide l'index (début de frame)
+    def clear(self):
+        self._buckets.clear()
+        self._count = 0
+
+    # Nombre d'objets indexés
+    def __len__(self) -> int:
+        return self._count
+
+    # Clés (équipes) présentes
+    def keys(self):
+        return self._buckets.keys()
+
+    # Seau contenant (x, y)
+    def cell(self, x: float, y: float) -> Cell:
+        return (math.floor(x * self._inv), math.floor(y * self._inv))
+
+    # Ajoute un objet à la position (x, y) sous la clé key
+    def insert(self, item: Any, x: float, y: float, key: Any = 0):
+        self._buckets.setdefault(key, {}).setdefault(self.cell(x, y), []).append(item)
+        self._count += 1
+
+    # Objets de la clé key dans les 3x3 seaux autour de (x, y)
+    def neighbours(self, x: float, y: float, key: Any = 0) -> Iterator[Any]:
+        buckets = self._buckets.get(key)
+        if not buckets:
+            return
+        cx, cy = self.cell(x, y)
+        for by in (cy - 1, cy, cy + 1):
+            for bx in (cx - 1, cx, cx + 1):
+                items = buckets.get((bx, by))
+                if items:
+                    yield from items
+
+    # Objets de la clé key dans les seaux couvrant le rectangle [x0, x1] x [y0, y1]
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float, key: Any = 0) -> Iterator[Any]:
+        buckets = self._buckets.get(key)
+        if not buckets:
+            return
+        cx0, cy0 = self.cell(x0, y0)
+        cx1, cy1 = self.cell(x1, y1)
+        for by in range(cy0, cy1 + 1):
+            for bx in range(cx0, cx1 + 1):
+                items = buckets.get((bx, by))
+                if items:
+                    yield from items
@@ -0,0 +1,144 @@
+# benchmarks/bench_astar_gridmap.py
+"""
+Benchmark de l'A* GridMap : reconstruction du dict de tuiles à chaque requête
+(ancienne version, recopiée ici comme référence) vs index dense en cache
+(GridMap.tile_index()).
+
+Lancer depuis le dossier Game/ :
+    python -m benchmarks.bench_astar_gridmap
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import random
+import time
+
+from Game.Ecs.Systems.AStarPathfindingSystem import astar_gridmap
+from Game.Map.GridMap import GridMap
+from Game.Map.GridTile import GridTile
+
+SIZES = ((30, 20), (60, 40), (120, 80))
+QUERIES = 20
+
+
+# Calcule la distance heuristique entre deux points (Manhattan ou Octile)
+def _heuristic(a, b, diagonal: bool) -> float:
+    dx = abs(a[0] - b[0])
+    dy = abs(a[1] - b[1])
+    if diagonal:
+        # Octile distance
+        F = math.sqrt(2) - 1
+        return (dx + dy) + (F * min(dx, dy)) - min(dx, dy)
+    return dx + dy
+
+
+# Retourne les voisins d'une position (4 ou 8 directions selon diagonal)
+def _neighbors_4_8(pos, width: int | None, height: int | None, diagonal: bool) -> list:
+    x, y = pos
+    nbrs = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+    if diagonal:
+        nbrs += [(x + 1, y + 1), (x + 1, y - 1), (x - 1, y + 1), (x - 1, y - 1)]
+    if width is None or height is None:
+        return nbrs
+    out = []
+    for nx, ny in nbrs:
+        if 0 <= nx < width and 0 <= ny < height:
+            out.append((nx, ny))
+    return out
+
+
+# Ancienne implémentation (avec ses helpers ci-dessus) : dict position -> tuile + scan de max_speed à chaque appel
+def astar_gridmap_rebuild(grid_map, start, goal, allow_diagonal=False):
+    tile_map = {}
+    for t in getattr(grid_map, "tiles", []):
+        tile_map[(t.x, t.y)] = t
+
+    speeds = [getattr(t, "speed", 0) for t in tile_map.values() if getattr(t, "speed", 0) > 0]
+    max_speed = max(speeds) if speeds else 1.0
+
+    def cost(a, b):
+        tile = tile_map.get(b)
+        if tile is None or not getattr(tile, "walkable", True):
+            return float("inf")
+        s = float(getattr(tile, "speed", max_speed))
+        base = 1.0
+        if a[0] != b[0] and a[1] != b[1]:
+            base *= math.sqrt(2)
+        return base * (max_speed / s)
+
+    width = getattr(grid_map, "width", None)
+    height = getattr(grid_map, "height", None)
+
+    open_heap = []
+    g_score = {start: 0.0}
+    came_from = {}
+    counter = 0
+    heapq.heappush(open_heap, (_heuristic(start, goal, allow_diagonal), counter, start))
+    closed = set()
+
+    while open_heap:
+        _, _, current = heapq.heappop(open_heap)
+        if current == goal:
+            path = [current]
+            while current in came_from:
+                current = came_from[current]
+                path.append(current)
+            path.reverse()
+            return path
+
+        closed.add(current)
+        for nbr in _neighbors_4_8(current, width, height, allow_diagonal):
+            if nbr in closed:
+                continue
+            tile = tile_map.get(nbr)
+            if tile is None or not getattr(tile, "walkable", True):
+                continue
+            tentative = g_score.get(current, float("inf")) + cost(current, nbr)
+            if tentative < g_score.get(nbr, float("inf")):
+                came_from[nbr] = current
+                g_score[nbr] = tentative
+                counter += 1
+                heapq.heappush(open_heap, (tentative + _heuristic(nbr, goal, allow_diagonal), counter, nbr))
+
+    return None
+
+
+# Carte aléatoire (désert, sables mouvants, cactus) sans fichier TMX
+def make_map(w: int, h: int, rng: random.Random) -> GridMap:
+    tiles = []
+    for y in range(h):
+        for x in range(w):
+            r = rng.random()
+            kind = "cactus" if r < 0.12 else ("sables_mouvants" if r < 0.30 else "desert")
+            tiles.append(GridTile(None, x, y, kind))
+    return GridMap.from_tiles(tiles, w, h)
+
+
+# Temps moyen par requête (ms)
+def time_queries(fn, gm, queries) -> float:
+    t0 = time.perf_counter()
+    for a, b in queries:
+        fn(gm, a, b)
+    return (time.perf_counter() - t0) * 1000.0 / len(queries)
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'taille':>10} | {'avant (ms/req)':>14} | {'après (ms/req)':>14} | {'gain':>6}")
+    for w, h in SIZES:
+        gm = make_map(w, h, rng)
+        walkable = [(t.x, t.y) for t in gm.tiles if t.walkable]
+        queries = [(rng.choice(walkable), rng.choice(walkable)) for _ in range(QUERIES)]
+
+        # Mêmes chemins que l'ancienne version
+        for a, b in queries:
+            assert astar_gridmap(gm, a, b) == astar_gridmap_rebuild(gm, a, b)
+
+        before = time_queries(astar_gridmap_rebuild, gm, queries)
+        after = time_queries(astar_gridmap, gm, queries)
+        print(f"{w:>4}x{h:<5} | {before:>14.3f} | {after:>14.3f} | {before / after:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
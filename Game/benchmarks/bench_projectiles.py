@@ -0,0 +1,115 @@
+# benchmarks/bench_projectiles.py
+"""
+Tirs soutenus à 60 FPS : projectiles en entités ECS (4 composants créés
+puis supprimés à chaque tir) vs ProjectilePool (tableaux préalloués).
+
+Chaque frame : N tirs vers des cibles à 1-3.5 cases (portées réelles),
+puis ProjectileSystem + CleanupSystem. Une cadence est tenue si le temps
+moyen par frame reste sous 1/60 s ; on affiche la cadence maximale tenue
+(tirs/s) pour chaque mode.
+
+Lancer depuis le dossier Game/ :
+    python -m benchmarks.bench_projectiles
+"""
+from __future__ import annotations
+
+import random
+import time
+
+import esper
+
+from Game.Ecs.Components.health import Health
+from Game.Ecs.Components.lifetime import Lifetime
+from Game.Ecs.Components.projectile import Projectile
+from Game.Ecs.Components.team import Team
+from Game.Ecs.Components.transform import Transform
+from Game.Ecs.Components.unitStats import UnitStats
+from Game.Ecs.Components.velocity import Velocity
+from Game.Ecs.Systems.CleanupSystem import CleanupSystem
+from Game.Ecs.Systems.ProjectileSystem import ProjectileSystem
+from Game.Utils.projectile_pool import ProjectilePool
+
+DT = 1.0 / 60.0
+FRAME_BUDGET_MS = 1000.0 / 60.0
+RATES = (5, 10, 20, 50, 100, 200, 400, 800, 1600, 3200)  # tirs par frame
+FRAMES = 90
+WARMUP = 30
+TARGETS = 200
+SPEED = 12.0
+
+
+class _Silent:
+    """Gestionnaire de sons muet (on mesure le calcul, pas l'audio)."""
+
+    def play(self, name):
+        pass
+
+
+# Cibles immobiles à PV quasi infinis (pas de morts : on mesure les tirs)
+def make_targets(rng: random.Random) -> list:
+    esper.clear_database()
+    targets = []
+    for _ in range(TARGETS):
+        pos = (rng.uniform(0.0, 30.0), rng.uniform(0.0, 20.0))
+        targets.append((esper.create_entity(
+            Transform(pos=pos), Team(id=2), Health(hp_max=10 ** 9, hp=10 ** 9), UnitStats(),
+        ), pos))
+    return targets
+
+
+# Tirs d'une frame : origine à 1-3.5 cases de la cible, vitesse vers la cible
+def shots(rng: random.Random, targets: list, n: int):
+    for _ in range(n):
+        tid, (tx, ty) = rng.choice(targets)
+        d = rng.uniform(1.0, 3.5)
+        ox, oy = tx - d, ty
+        yield tid, (ox, oy), (SPEED, 0.0)
+
+
+# Temps moyen par frame (ms) d'un mode à une cadence donnée
+def time_mode(mode: str, rate: int) -> float:
+    rng = random.Random(rate)
+    targets = make_targets(rng)
+    pool = ProjectilePool() if mode == "pool" else None
+    projectiles = ProjectileSystem(pool=pool)
+    projectiles.flush._sound_manager = _Silent()
+    cleanup = CleanupSystem()
+
+    total = 0.0
+    for frame in range(WARMUP + FRAMES):
+        t0 = time.perf_counter()
+        for tid, origin, vel in shots(rng, targets, rate):
+            if pool is not None:
+                pool.spawn(pos=origin, vel=vel, target_entity_id=tid, team_id=1,
+                           damage=1.0, hit_radius=0.4, ttl=5.0)
+            else:
+                esper.create_entity(
+                    Transform(pos=origin), Velocity(vx=vel[0], vy=vel[1]),
+                    Projectile(team_id=1, target_entity_id=tid, damage=1.0, hit_radius=0.4),
+                    Lifetime(ttl=5.0, despawn_on_death=False),
+                )
+        # Ordre du jeu : CleanupSystem (90) puis ProjectileSystem (60)
+        cleanup.process(DT)
+        projectiles.process(DT)
+        if frame >= WARMUP:
+            total += time.perf_counter() - t0
+    return total * 1000.0 / FRAMES
+
+
+def main():
+    print(f"{'tirs/frame':>10} | {'entités (ms)':>12} | {'pool (ms)':>9}")
+    best = {"entity": 0, "pool": 0}
+    for rate in RATES:
+        row = {}
+        for mode in best:
+            row[mode] = time_mode(mode, rate)
+            if row[mode] <= FRAME_BUDGET_MS:
+                best[mode] = max(best[mode], rate)
+        print(f"{rate:>10} | {row['entity']:>12.2f} | {row['pool']:>9.2f}")
+        if min(row.values()) > FRAME_BUDGET_MS:
+            break
+    print(f"cadence tenue à 60 FPS : entités {best['entity'] * 60} tirs/s, pool {best['pool'] * 60} tirs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# benchmarks/bench_targeting.py
+"""
+Moteurs de TargetingSystem ("hash", "sweep", "numpy") contre le balayage
+complet d'origine (recopié ici comme référence).
+
+Scénarios enregistrés (graines fixes) : mêlées sur les 3 lanes, unités sans
+lane ou mortes, pyramides, puis plusieurs frames où les unités avancent et
+où des unités meurent / apparaissent. Chaque moteur doit donner exactement
+les mêmes cibles que la référence à chaque frame.
+
+Lancer depuis le dossier Game/ :
+    python -m benchmarks.bench_targeting
+"""
+from __future__ import annotations
+
+import math
+import random
+import time
+
+import esper
+
+from Game.Ecs.Components.health import Health
+from Game.Ecs.Components.lane import Lane
+from Game.Ecs.Components.target import Target
+from Game.Ecs.Components.team import Team
+from Game.Ecs.Components.transform import Transform
+from Game.Ecs.Components.unitStats import UnitStats
+from Game.Ecs.Systems.TargetingSystem import TargetingSystem
+
+LANES_Y = (3, 10, 16)
+SIZES = (50, 100, 200, 400)
+FRAMES = 30
+SCENARIOS = 40
+
+
+# Ancienne implémentation : chaque unité parcourt toutes les entités vivantes
+def targets_full_scan(pyramid_ids, attack_range):
+    tol = TargetingSystem.CONVERGENCE_TOLERANCE
+    lanes = {eid: lane.index for eid, lane in esper.get_component(Lane)}
+    candidates = []
+    for eid, (t, team, hp) in esper.get_components(Transform, Team, Health):
+        if hp.is_dead:
+            continue
+        is_pyramid = eid in pyramid_ids
+        candidates.append((eid, t, team, is_pyramid, lanes.get(eid, -1) if not is_pyramid else -1))
+
+    out = {}
+    for eid, (t, team, stats) in esper.get_components(Transform, Team, UnitStats):
+        if esper.has_component(eid, Health) and esper.component_for_entity(eid, Health).is_dead:
+            continue
+        ax, ay = t.pos
+        my_lane = lanes.get(eid, -1)
+        best_unit, best_unit_d = None, 999999.0
+        best_pyr, best_pyr_d = None, 999999.0
+        for cid, ct, cteam, is_pyramid, enemy_lane in candidates:
+            if cid == eid or cteam.id == team.id:
+                continue
+            bx, by = ct.pos
+            d = math.hypot(bx - ax, by - ay)
+            if d > attack_range:
+                continue
+            if is_pyramid:
+                if d < best_pyr_d:
+                    best_pyr, best_pyr_d = cid, d
+                continue
+            same = (my_lane >= 0 and enemy_lane >= 0 and my_lane == enemy_lane) or abs(ay - by) <= tol
+            if same and d < best_unit_d:
+                best_unit, best_unit_d = cid, d
+        # Pas de Path dans ces scènes : toute unité est "arrivée"
+        if best_unit is not None:
+            out[eid] = (best_unit, "unit")
+        elif best_pyr is not None:
+            out[eid] = (best_pyr, "pyramid")
+    return out
+
+
+# Scène : deux pyramides + n unités réparties sur les lanes (quelques-unes hors lane / mortes)
+def make_scene(n: int, rng: random.Random) -> set:
+    esper.clear_database()
+    pyramids = {
+        esper.create_entity(Transform(pos=(1.0, 10.0)), Team(id=1), Health(hp_max=100, hp=100)),
+        esper.create_entity(Transform(pos=(28.0, 10.0)), Team(id=2), Health(hp_max=100, hp=100)),
+    }
+    for _ in range(n):
+        lane_idx = rng.randrange(3)
+        y = float(LANES_Y[lane_idx]) + rng.choice((0.0, 0.0, rng.uniform(-0.6, 0.6)))
+        x = rng.choice((float(rng.randint(0, 29)), rng.uniform(0.0, 29.0)))
+        comps = [Transform(pos=(x, y)), Team(id=rng.choice((1, 2))), UnitStats()]
+        if rng.random() < 0.95:
+            comps.append(Health(hp_max=10, hp=rng.choice((0, 10, 10, 10))))
+        if rng.random() < 0.9:
+            comps.append(Lane(index=lane_idx, y_position=float(LANES_Y[lane_idx])))
+        esper.create_entity(*comps)
+    return pyramids
+
+
+# Une frame : les unités avancent vers la pyramide adverse, une meurt, une apparaît
+def step_scene(rng: random.Random):
+    for eid, (t, team, stats) in esper.get_components(Transform, Team, UnitStats):
+        dx = 0.1 if team.id == 1 else -0.1
+        t.pos = (t.pos[0] + dx * rng.random(), t.pos[1])
+    units = [eid for eid, _ in esper.get_component(UnitStats)]
+    if units and rng.random() < 0.3:
+        esper.delete_entity(rng.choice(units), immediate=True)
+    if rng.random() < 0.3:
+        lane_idx = rng.randrange(3)
+        team_id = rng.choice((1, 2))
+        esper.create_entity(
+            Transform(pos=(2.0 if team_id == 1 else 27.0, float(LANES_Y[lane_idx]))), Team(id=team_id),
+            UnitStats(), Health(hp_max=10, hp=10), Lane(index=lane_idx, y_position=float(LANES_Y[lane_idx])),
+        )
+
+
+# Cibles actuelles (entité -> (cible, type))
+def current_targets() -> dict:
+    return {eid: (tg.entity_id, tg.type) for eid, tg in esper.get_component(Target)}
+
+
+# Vérifie chaque moteur contre la référence sur les scénarios enregistrés
+def check_equivalence():
+    for engine in TargetingSystem.ENGINES:
+        for seed in range(SCENARIOS):
+            rng = random.Random(seed)
+            attack_range = rng.choice((1.0, 2.0, 3.5))
+            pyramids = make_scene(rng.randint(5, 150), rng)
+            system = TargetingSystem(goals_by_team={}, pyramid_ids=pyramids, attack_range=attack_range, engine=engine)
+            for frame in range(10):
+                system.process(1 / 60)
+                expected = targets_full_scan(pyramids, attack_range)
+                assert current_targets() == expected, f"{engine}: scénario {seed}, frame {frame}"
+                step_scene(rng)
+    print(f"équivalence : {len(TargetingSystem.ENGINES)} moteurs x {SCENARIOS} scénarios x 10 frames OK")
+
+
+# Temps moyen par frame (ms) d'un moteur
+def time_engine(engine: str, n: int) -> float:
+    rng = random.Random(n)
+    pyramids = make_scene(n, rng)
+    system = TargetingSystem(goals_by_team={}, pyramid_ids=pyramids, engine=engine)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        step_scene(rng)
+        system.process(1 / 60)
+    return (time.perf_counter() - t0) * 1000.0 / FRAMES
+
+
+# Temps moyen par frame (ms) de la référence
+def time_full_scan(n: int) -> float:
+    rng = random.Random(n)
+    pyramids = make_scene(n, rng)
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        step_scene(rng)
+        targets_full_scan(pyramids, 2.0)
+    return (time.perf_counter() - t0) * 1000.0 / FRAMES
+
+
+def main():
+    check_equivalence()
+    header = " | ".join(f"{e:>8}" for e in TargetingSystem.ENGINES)
+    print(f"{'unités':>7} | {'balayage':>8} | {header}   (ms/frame)")
+    for n in SIZES:
+        row = " | ".join(f"{time_engine(e, n):>8.2f}" for e in TargetingSystem.ENGINES)
+        print(f"{n:>7} | {time_full_scan(n):>8.2f} | {row}")
+
+
+if __name__ == "__main__":
+    main()